@@ -1,4 +1,5 @@
-from datetime import datetime
+import heapq
+from datetime import datetime, timedelta
 import time as real_time
 from typing import Callable, Optional, Dict, Tuple, List
 
@@ -9,6 +10,7 @@ from algotradepy.orders import (
     LimitOrder,
     OrderAction,
     MarketOrder,
+    TrailingStopOrder,
 )
 from algotradepy.sim_utils import ASimulationPiece
 from algotradepy.streamers.sim_streamer import SimulationDataStreamer
@@ -18,6 +20,48 @@ from algotradepy.utils import recursive_dict_update
 DEFAULT_SIM_ACC = "DEFAULT"
 
 
+class _OrderBook:
+    """The resting orders of a contract.
+
+    The limit orders are kept in price-sorted heaps so that matching them
+    against a price range only touches the orders that are filled. The
+    orders leaving the book by other means (e.g. cancellation) are lazily
+    discarded when they reach the top of their heap. The trailing stops move
+    with the prices, so they are kept unsorted and re-priced on every bar.
+    """
+
+    def __init__(self):
+        # [(-limit_price, order_id, trade)], highest limit first
+        self.buy_limits = []
+        # [(limit_price, order_id, trade)], lowest limit first
+        self.sell_limits = []
+        # {order_id: [trade, stop_price]}
+        self.trailing_stops = {}
+
+    def __len__(self):
+        n_orders = (
+            len(self.buy_limits)
+            + len(self.sell_limits)
+            + len(self.trailing_stops)
+        )
+        return n_orders
+
+    def add(self, trade: Trade):
+        order = trade.order
+        if isinstance(order, LimitOrder):
+            if order.action == OrderAction.BUY:
+                entry = (-order.limit_price, order.order_id, trade)
+                heapq.heappush(self.buy_limits, entry)
+            else:
+                entry = (order.limit_price, order.order_id, trade)
+                heapq.heappush(self.sell_limits, entry)
+        else:
+            self.trailing_stops[order.order_id] = [
+                trade,
+                order.trail_stop_price,
+            ]
+
+
 class SimulationBroker(ABroker, ASimulationPiece):
     """Implements the broker interface for simulated back-testing.
 
@@ -66,9 +110,15 @@ class SimulationBroker(ABroker, ASimulationPiece):
         self._new_trade_subscribers = []
         self._trade_updates_subscribers = []
         self._position_updates_subscribers = []
-        self._placed_trades: List[Trade] = []
+        # {order_id: trade}, in placement order
+        self._placed_trades: Dict[int, Trade] = {}
+        self._open_trades: Dict[int, Trade] = {}
         # [(trade, price, n_shares)]
         self._scheduled_trade_executions = []
+        # [(placement time ns, trade)]
+        self._pending_resting_trades = []
+        self._order_books: Dict[AContract, _OrderBook] = {}
+        self._resting_ids = set()
 
     @property
     def acc_cash(self) -> Dict[Currency, float]:
@@ -80,19 +130,12 @@ class SimulationBroker(ABroker, ASimulationPiece):
 
     @property
     def trades(self) -> List[Trade]:
-        return self._placed_trades
+        return list(self._placed_trades.values())
 
     @property
     def open_trades(self) -> List[Trade]:
         # TODO: test
-        done_statuses = [TradeState.CANCELLED, TradeState.FILLED]
-        open_trades = []
-
-        for trade in self._placed_trades:
-            if trade.status.state not in done_statuses:
-                open_trades.append(trade)
-
-        return open_trades
+        return list(self._open_trades.values())
 
     @property
     def open_positions(self) -> List[Position]:
@@ -149,7 +192,8 @@ class SimulationBroker(ABroker, ASimulationPiece):
         new_trade = Trade(
             contract=trade.contract, order=order, status=new_status,
         )
-        self._placed_trades.append(new_trade)
+        self._placed_trades[trade_id] = new_trade
+        self._open_trades[trade_id] = new_trade
 
         self._update_trade_updates_subscribers(trade=new_trade)
 
@@ -157,6 +201,12 @@ class SimulationBroker(ABroker, ASimulationPiece):
             self._scheduled_trade_executions.append(
                 (trade, trade_execution_price, trade_execution_size)
             )
+        elif isinstance(trade.order, (LimitOrder, TrailingStopOrder)):
+            placed_ns = None
+            if self.sim_clock is not None:
+                placed_ns = self.sim_clock.datetime_ns
+            self._pending_resting_trades.append((placed_ns, new_trade))
+            self._resting_ids.add(trade_id)
 
         # update trade placed subscribers
         for func, fn_kwargs in self._new_trade_subscribers:
@@ -178,8 +228,10 @@ class SimulationBroker(ABroker, ASimulationPiece):
             order=trade.order,
             status=cancelled_status,
         )
-        trade_idx = self._placed_trades.index(trade)
-        self._placed_trades[trade_idx] = new_trade
+        order_id = trade.order.order_id
+        self._placed_trades[order_id] = new_trade
+        self._open_trades.pop(order_id, None)
+        self._resting_ids.discard(order_id)
 
         self._update_trade_updates_subscribers(trade=trade)
 
@@ -211,6 +263,20 @@ class SimulationBroker(ABroker, ASimulationPiece):
                 trade=trade, price=price, n_shares=n_shares,
             )
 
+        if self.sim_clock is not None:
+            self._activate_pending_resting_trades()
+            self._match_resting_trades()
+
+    def get_next_wake_up(self) -> Optional[int]:
+        if (
+            len(self._scheduled_trade_executions) != 0
+            or len(self._resting_ids) != 0
+        ):
+            next_ns = self.sim_clock.get_next_step_ns()
+        else:
+            next_ns = None
+        return next_ns
+
     def simulate_trade_execution(
         self,
         trade: Trade,
@@ -218,7 +284,6 @@ class SimulationBroker(ABroker, ASimulationPiece):
         n_shares: Optional[float] = None,
     ):
         # TODO: test
-        # TODO: implement for Limit and Stop Loss Orders
         self._scheduled_trade_executions.append((trade, price, n_shares),)
 
     # -------------------------- Helpers ---------------------------------------
@@ -234,9 +299,7 @@ class SimulationBroker(ABroker, ASimulationPiece):
         price: Optional[float] = None,
         n_shares: Optional[float] = None,
     ):
-
-        trade_idx = self._placed_trades.index(trade)
-        trade = self._placed_trades[trade_idx]
+        trade = self._placed_trades[trade.order.order_id]
 
         self._validate_trade_execution(
             trade=trade, price=price, n_shares=n_shares,
@@ -256,7 +319,7 @@ class SimulationBroker(ABroker, ASimulationPiece):
             funds_delta = -(n_shares * price + self.get_transaction_fee())
             shares_delta = n_shares
         else:
-            funds_delta = n_shares * price + self.get_transaction_fee()
+            funds_delta = n_shares * price - self.get_transaction_fee()
             shares_delta = -n_shares
         self.acc_cash[contract.currency] += funds_delta
         self._add_to_position(
@@ -275,6 +338,9 @@ class SimulationBroker(ABroker, ASimulationPiece):
             order_id=order.order_id,
         )
         trade.status = new_status
+        self._open_trades.pop(order.order_id, None)
+        if new_status.remaining == 0:
+            self._resting_ids.discard(order.order_id)
         self._update_trade_updates_subscribers(trade=trade)
 
     @staticmethod
@@ -359,8 +425,7 @@ class SimulationBroker(ABroker, ASimulationPiece):
         return position
 
     def _update_trade_updates_subscribers(self, trade: Trade):
-        trade_idx = self._placed_trades.index(trade)
-        trade = self._placed_trades[trade_idx]
+        trade = self._placed_trades[trade.order.order_id]
         status = trade.status
 
         for func, fn_kwargs in self._trade_updates_subscribers:
@@ -370,6 +435,161 @@ class SimulationBroker(ABroker, ASimulationPiece):
         for func, fn_kwargs in self._position_updates_subscribers:
             func(position, **fn_kwargs)
 
+    def _activate_pending_resting_trades(self):
+        # the orders are matched from the bar starting at their placement
+        now = self.sim_clock.datetime_ns
+        still_pending = []
+
+        for placed_ns, trade in self._pending_resting_trades:
+            if trade.order.order_id not in self._resting_ids:
+                continue
+            if placed_ns is not None and placed_ns >= now:
+                still_pending.append((placed_ns, trade))
+            else:
+                book = self._order_books.setdefault(
+                    trade.contract, _OrderBook(),
+                )
+                book.add(trade=trade)
+
+        self._pending_resting_trades = still_pending
+
+    def _match_resting_trades(self):
+        for contract, book in list(self._order_books.items()):
+            price_ranges = self._get_last_price_ranges(contract=contract)
+            if price_ranges is not None:
+                buy_range, sell_range = price_ranges
+                self._match_limit_orders(
+                    book=book, buy_range=buy_range, sell_range=sell_range,
+                )
+                self._match_trailing_stops(
+                    book=book, buy_range=buy_range, sell_range=sell_range,
+                )
+            if len(book) == 0:
+                del self._order_books[contract]
+
+    def _match_limit_orders(
+        self,
+        book: _OrderBook,
+        buy_range: Tuple[float, float, float],
+        sell_range: Tuple[float, float, float],
+    ):
+        buy_open, _, buy_low = buy_range
+        buy_limits = book.buy_limits
+        while len(buy_limits) != 0:
+            neg_limit, order_id, trade = buy_limits[0]
+            if order_id in self._resting_ids:
+                if -neg_limit < buy_low:
+                    break
+                self._fill_resting_trade(
+                    trade=trade, price=min(-neg_limit, buy_open),
+                )
+            heapq.heappop(buy_limits)
+
+        sell_open, sell_high, _ = sell_range
+        sell_limits = book.sell_limits
+        while len(sell_limits) != 0:
+            limit, order_id, trade = sell_limits[0]
+            if order_id in self._resting_ids:
+                if limit > sell_high:
+                    break
+                self._fill_resting_trade(
+                    trade=trade, price=max(limit, sell_open),
+                )
+            heapq.heappop(sell_limits)
+
+    def _match_trailing_stops(
+        self,
+        book: _OrderBook,
+        buy_range: Tuple[float, float, float],
+        sell_range: Tuple[float, float, float],
+    ):
+        for order_id, (trade, stop_price) in list(book.trailing_stops.items()):
+            if order_id not in self._resting_ids:
+                del book.trailing_stops[order_id]
+                continue
+
+            order = trade.order
+            if order.action == OrderAction.SELL:
+                open_, high, low = sell_range
+                if stop_price is None:
+                    stop_price = open_ - self._get_trail_offset(order, open_)
+                if low <= stop_price:
+                    del book.trailing_stops[order_id]
+                    self._fill_resting_trade(
+                        trade=trade, price=min(stop_price, open_),
+                    )
+                    continue
+                stop_price = max(
+                    stop_price, high - self._get_trail_offset(order, high),
+                )
+            else:
+                open_, high, low = buy_range
+                if stop_price is None:
+                    stop_price = open_ + self._get_trail_offset(order, open_)
+                if high >= stop_price:
+                    del book.trailing_stops[order_id]
+                    self._fill_resting_trade(
+                        trade=trade, price=max(stop_price, open_),
+                    )
+                    continue
+                stop_price = min(
+                    stop_price, low + self._get_trail_offset(order, low),
+                )
+            book.trailing_stops[order_id][1] = stop_price
+
+    def _fill_resting_trade(self, trade: Trade, price: float):
+        self._resting_ids.discard(trade.order.order_id)
+        self._execute_trade(trade=trade, price=price)
+
+    @staticmethod
+    def _get_trail_offset(order: TrailingStopOrder, price: float) -> float:
+        if order.aux_price is not None:
+            offset = order.aux_price
+        else:
+            offset = price * order.trail_percent / 100
+        return offset
+
+    def _get_last_price_ranges(
+        self, contract: AContract,
+    ) -> Optional[
+        Tuple[Tuple[float, float, float], Tuple[float, float, float]]
+    ]:
+        """Get the prices of the last clock step.
+
+        Returns
+        -------
+        tuple or None
+            The (open, high, low) prices at which the contract could be
+            bought and sold over the last clock step, or `None` if no prices
+            are available. With a 1s clock, the prices are the ask and bid
+            quotes. Otherwise, both are the prices of the last bar.
+        """
+        time_step = self.sim_clock.time_step
+
+        if time_step == timedelta(seconds=1):
+            quotes = self._streamer.get_last_quotes(contract=contract)
+            if len(quotes) == 0:
+                price_ranges = None
+            else:
+                asks = quotes["ask"]
+                bids = quotes["bid"]
+                price_ranges = (
+                    (float(asks[0]), float(asks.max()), float(asks.min())),
+                    (float(bids[0]), float(bids.max()), float(bids.min())),
+                )
+        else:
+            try:
+                bar = self._streamer.get_last_bar(
+                    contract=contract, bar_size=time_step,
+                )
+            except KeyError:
+                price_ranges = None
+            else:
+                bar_range = (bar["open"], bar["high"], bar["low"])
+                price_ranges = (bar_range, bar_range)
+
+        return price_ranges
+
     def _get_current_price(self, contract: AContract) -> float:
         # TODO: use 1s aggregation of ticks, if available
         bar = self._streamer.get_bar(
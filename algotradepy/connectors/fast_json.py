@@ -0,0 +1,103 @@
+"""Fast JSON decoding of the market data messages.
+
+Uses orjson and msgspec when they are installed (see
+`pip install algotradepy[fastjson]`), and falls back on the standard
+library's json module otherwise.
+"""
+import json
+import operator
+from typing import Any, Union, List, Dict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# the decoded trade fields and their types
+TRADE_COLUMNS = {
+    "t": np.int64,  # SIP time stamp, in nanoseconds
+    "y": np.int64,  # participant time stamp, in nanoseconds
+    "q": np.int64,  # sequence number
+    "x": np.int64,  # exchange id, -1 if missing
+    "s": np.float64,  # size
+    "p": np.float64,  # price
+}
+
+if orjson is not None:
+    _loads = orjson.loads
+elif msgspec is not None:
+    _loads = msgspec.json.Decoder().decode
+else:
+    _loads = json.loads
+
+if msgspec is not None:
+
+    class _Trade(msgspec.Struct, gc=False):
+        t: int
+        s: float
+        p: float
+        y: int = 0
+        q: int = 0
+        x: int = -1
+
+    class _TradesPage(msgspec.Struct, gc=False):
+        results: List[_Trade] = []
+
+    _trades_page_decoder = msgspec.json.Decoder(_TradesPage)
+    # read the columns in C, without running Python code for each trade
+    _trade_field_getters = {
+        name: operator.attrgetter(name) for name in TRADE_COLUMNS
+    }
+else:
+    _trades_page_decoder = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document."""
+    return _loads(data)
+
+
+def decode_trades_page(content: Union[str, bytes]) -> pd.DataFrame:
+    """Decode a page of trades into columns.
+
+    The page is expected to hold its trades in a `results` list. With
+    msgspec, the trades are decoded straight into typed records, skipping
+    the intermediate dictionary built for each trade.
+
+    Parameters
+    ----------
+    content : str or bytes
+        The JSON page.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The trades, with the columns of `TRADE_COLUMNS`. The missing
+        exchange ids are set to -1 and the other missing fields to 0.
+    """
+    if _trades_page_decoder is not None:
+        results = _trades_page_decoder.decode(content).results
+        n_trades = len(results)
+        columns = {
+            name: np.fromiter(
+                map(_trade_field_getters[name], results),
+                dtype=dtype,
+                count=n_trades,
+            )
+            for name, dtype in TRADE_COLUMNS.items()
+        }
+        data = pd.DataFrame(data=columns, copy=False)
+    else:
+        results: List[Dict] = loads(content).get("results", [])
+        data = pd.DataFrame(data=results, columns=list(TRADE_COLUMNS))
+        data = data.fillna({"x": -1}).fillna(0).astype(TRADE_COLUMNS)
+
+    return data
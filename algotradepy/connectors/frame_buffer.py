@@ -0,0 +1,208 @@
+import threading
+from collections import deque
+from enum import Enum
+from typing import Callable, List, Dict, Optional, Hashable, Union, Any
+
+
+class OverflowPolicy(Enum):
+    """The behaviour of a full :class:`FrameBuffer`.
+
+    Values
+    ------
+    * BLOCK
+        The producer waits for room in the buffer.
+    * DROP_OLDEST
+        The oldest frame is discarded.
+    * COALESCE_LATEST
+        The buffered frames are parsed and, of the events sharing a
+        coalescing key (e.g. the trades of a symbol), only the latest is
+        kept. The coalescing runs on the producer thread, under the buffer
+        lock: each time the buffer fills up, the producer parses up to
+        `capacity` frames (each frame is parsed only once) and the
+        consumers wait meanwhile. Prefer a capacity small enough for this
+        pause to be acceptable on the producer's thread (e.g. a web socket
+        thread).
+    """
+
+    BLOCK = "BLOCK"
+    DROP_OLDEST = "DROP_OLDEST"
+    COALESCE_LATEST = "COALESCE_LATEST"
+
+
+class FrameBuffer:
+    """A bounded ring buffer of raw message frames.
+
+    Decouples the thread receiving the frames of a connection, which only
+    enqueues them, from the threads parsing and dispatching them, so that
+    slow consumers do not back up the connection.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of buffered frames.
+    parse : Callable
+        Parses a raw frame into its list of events.
+    overflow_policy : OverflowPolicy, default OverflowPolicy.BLOCK
+        What to do with a new frame when the buffer is full.
+    coalesce_key : Callable, optional, default None
+        Returns the coalescing key of an event, or `None` if the event must
+        not be coalesced. Required by the `COALESCE_LATEST` policy.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        parse: Callable[[Union[str, bytes]], List[Dict]],
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        coalesce_key: Optional[Callable[[Dict], Optional[Hashable]]] = None,
+    ):
+        if capacity < 1:
+            raise ValueError(f"The capacity must be positive. Got {capacity}.")
+        if (
+            overflow_policy == OverflowPolicy.COALESCE_LATEST
+            and coalesce_key is None
+        ):
+            raise ValueError(
+                f"A coalesce_key must be provided with the"
+                f" {OverflowPolicy.COALESCE_LATEST} policy."
+            )
+
+        self._capacity = capacity
+        self._parse = parse
+        self._policy = overflow_policy
+        self._coalesce_key = coalesce_key
+        # the raw frames, or the lists of events of the coalesced frames
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+
+        self._received_frames = 0
+        self._dropped_frames = 0
+        self._coalesced_events = 0
+        self._max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """The number of buffered items."""
+        return len(self._items)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the buffer counters.
+
+        Returns
+        -------
+        dict
+            The `depth` and `max_depth` (number of buffered items), the
+            `received_frames`, the `dropped_frames` discarded by the
+            `DROP_OLDEST` policy or put after the closing, and the
+            `coalesced_events` discarded by the `COALESCE_LATEST` policy.
+        """
+        with self._lock:
+            stats = {
+                "depth": len(self._items),
+                "max_depth": self._max_depth,
+                "received_frames": self._received_frames,
+                "dropped_frames": self._dropped_frames,
+                "coalesced_events": self._coalesced_events,
+            }
+        return stats
+
+    def put(self, frame: Union[str, bytes]):
+        """Enqueue a raw frame, applying the overflow policy if full.
+
+        The frames put after the buffer is closed are dropped.
+        """
+        with self._lock:
+            self._received_frames += 1
+
+            if len(self._items) >= self._capacity:
+                if self._policy == OverflowPolicy.BLOCK:
+                    self._not_full.wait_for(
+                        lambda: len(self._items) < self._capacity
+                        or self._closed
+                    )
+                elif self._policy == OverflowPolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self._dropped_frames += 1
+                else:
+                    self._coalesce()
+
+            if self._closed:
+                self._dropped_frames += 1
+                return
+
+            self._items.append(frame)
+            self._max_depth = max(self._max_depth, len(self._items))
+            self._not_empty.notify()
+
+    def get_events(self, timeout: Optional[float] = None) -> Optional[List]:
+        """Dequeue the oldest frame and parse it.
+
+        Parameters
+        ----------
+        timeout : float, optional, default None
+            How long to wait for a frame, in seconds. Waits indefinitely by
+            default.
+
+        Returns
+        -------
+        list or None
+            The events of the frame, or `None` if the timeout expired or the
+            buffer was closed and is empty.
+        """
+        with self._lock:
+            self._not_empty.wait_for(
+                lambda: len(self._items) != 0 or self._closed, timeout=timeout,
+            )
+            if len(self._items) == 0:
+                return None
+            item = self._items.popleft()
+            self._not_full.notify()
+
+        if isinstance(item, list):
+            events = item
+        else:
+            events = self._parse(item)
+
+        return events
+
+    def close(self):
+        """Close the buffer, waking up the waiting threads.
+
+        The frames buffered at the time of the closing can still be
+        dequeued.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def _coalesce(self):
+        # Collapses the buffered frames into a single list of events. Each
+        # frame is parsed only once, either here or by the consumer, and the
+        # buffer only fills up again after `capacity` more frames.
+        events: List[Any] = []
+        for item in self._items:
+            if isinstance(item, list):
+                events.extend(item)
+            else:
+                events.extend(self._parse(item))
+
+        latest = {}
+        keys = []
+        for i, event in enumerate(events):
+            key = self._coalesce_key(event)
+            keys.append(key)
+            if key is not None:
+                latest[key] = i
+
+        coalesced = [
+            event
+            for i, (event, key) in enumerate(zip(events, keys))
+            if key is None or latest[key] == i
+        ]
+        self._coalesced_events += len(events) - len(coalesced)
+        self._items.clear()
+        self._items.append(coalesced)
@@ -23,7 +23,7 @@ def _get_client_id() -> int:
     return _NEXT_VALID_CLIENT_ID
 
 
-class IBConnector(IB):
+class IBConnector(IB, Subscribable):
     """A wrapper around `ib_insync.IB`."""
 
     def __init__(self):
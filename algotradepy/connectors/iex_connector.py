@@ -13,6 +13,7 @@ class IEXConnector:
     def __init__(self, api_token: str, simulation: bool):
         self._api_token = api_token
         self._simulation = simulation
+        self._session = requests.Session()
 
     @property
     def _base_url(self) -> str:
@@ -49,7 +50,7 @@ class IEXConnector:
         url = f"{self._base_url}/stock/{symbol.lower()}/batch"
 
         params["exactDate"] = request_date.strftime(self._REQ_DATE_FORMAT)
-        r = requests.get(url=url, params=params)
+        r = self._session.get(url=url, params=params)
         json_data = json.loads(r.text)
         data = pd.DataFrame(data=json_data[request_type])
 
@@ -1,4 +1,5 @@
 import json
+import queue
 import threading
 from datetime import date, datetime, time
 from enum import Enum
@@ -17,6 +18,8 @@ except ImportError as e:
         " 'pip install algotradepy[polygon]'."
     )
 
+from algotradepy.connectors import fast_json
+from algotradepy.connectors.frame_buffer import FrameBuffer, OverflowPolicy
 from algotradepy.time_utils import nano_to_seconds, seconds_to_nano
 
 
@@ -34,6 +37,25 @@ class PolygonRESTConnector:
     def download_trades_data(
         self, symbol: str, request_date: date, rth: bool = True,
     ) -> pd.DataFrame:
+        """Download the trades of a symbol on a given day.
+
+        Parameters
+        ----------
+        symbol : str
+        request_date : datetime.date
+        rth : bool, default True
+            Whether to only download the trades of the regular trading hours.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The trades, with the columns of
+            :data:`~algotradepy.connectors.fast_json.TRADE_COLUMNS`: the SIP
+            (`t`) and participant (`y`) time stamps, the sequence number
+            (`q`), the exchange id (`x`, -1 if missing), the size (`s`) and
+            the price (`p`). The trade conditions (`c`), tape (`z`) and
+            trade id (`i`) returned by the API are not kept.
+        """
         date_str = request_date.strftime("%Y-%m-%d")
         url = f"{self._url}/{self._TRADES_SUFFIX}/{symbol}/{date_str}"
         params = {
@@ -49,19 +71,27 @@ class PolygonRESTConnector:
             )  # todo: localize
             ts = start_dt.timestamp()
             params["timestamp"] = seconds_to_nano(s=ts)
-        resp = self._make_call(endpoint=url, params=params)
-        data = self._resp_to_pandas(resp=resp)
+        page = self._make_call(
+            endpoint=url, params=params, decode=fast_json.decode_trades_page,
+        )
+        pages = [page]
 
-        while len(resp["results"]) == 50000:
-            ts = nano_to_seconds(resp["results"][-1]["t"])
+        while len(page) == 50000:
+            last_ts = int(page["t"].iloc[-1])
+            ts = nano_to_seconds(last_ts)
 
             if rth and datetime.fromtimestamp(ts).time() >= time(hour=16):
                 break
 
-            params["timestamp"] = resp["results"][-1]["t"]
-            resp = self._make_call(endpoint=url, params=params)
-            next_data = self._resp_to_pandas(resp=resp)
-            data = data.append(other=next_data, ignore_index=True)
+            params["timestamp"] = last_ts
+            page = self._make_call(
+                endpoint=url,
+                params=params,
+                decode=fast_json.decode_trades_page,
+            )
+            pages.append(page)
+
+        data = pd.concat(pages, ignore_index=True)
 
         if rth:
             end_dt = datetime(
@@ -81,16 +111,16 @@ class PolygonRESTConnector:
         resp: List[Dict] = self._make_call(endpoint=url)
         return resp
 
-    def _make_call(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+    def _make_call(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        decode: Callable[[bytes], Any] = fast_json.loads,
+    ) -> Any:
         resp = self._session.get(endpoint, params=params)
-        resp = resp.json()
+        resp = decode(resp.content)
         return resp
 
-    @staticmethod
-    def _resp_to_pandas(resp) -> pd.DataFrame:
-        results = pd.DataFrame(data=resp["results"])
-        return results
-
 
 class PolygonWSClusters(Enum):
     STOCKS_CLUSTER = "stocks"
@@ -99,12 +129,39 @@ class PolygonWSClusters(Enum):
 
 
 class PolygonWebSocketConnector:
+    """The Polygon web socket connector.
+
+    The web socket thread only enqueues the raw message frames into a
+    bounded :class:`~algotradepy.connectors.frame_buffer.FrameBuffer`. A
+    dispatcher thread parses them and calls the subscribers, so that slow
+    subscribers do not back up the socket.
+
+    Parameters
+    ----------
+    api_token : str
+    cluster : PolygonWSClusters, default PolygonWSClusters.STOCKS_CLUSTER
+    buffer_capacity : int, default 10_000
+        The maximum number of frames waiting to be dispatched.
+    overflow_policy : OverflowPolicy, default OverflowPolicy.BLOCK
+        What to do with the incoming frames when the buffer is full. With
+        `OverflowPolicy.COALESCE_LATEST`, only the latest trade of each
+        symbol is kept, and the buffered frames are parsed on the web socket
+        thread when the buffer fills up.
+    dispatcher_threads : int, default 1
+        The number of threads calling the trade subscribers. If greater than
+        one, the trades are sharded across the threads by symbol, which
+        keeps the trades of a symbol in order.
+    """
+
     _DEFAULT_HOST = "socket.polygon.io"
 
     def __init__(
         self,
         api_token: str,
         cluster: PolygonWSClusters = PolygonWSClusters.STOCKS_CLUSTER,
+        buffer_capacity: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        dispatcher_threads: int = 1,
     ):
         self._host = self._DEFAULT_HOST
         self._cluster = cluster
@@ -120,10 +177,43 @@ class PolygonWebSocketConnector:
         self._authenticated = threading.Event()
         self._run_thread = None
         self._trade_event_subscribers_lock = threading.Lock()
-        self._trade_event_subscribers = []
+        # replaced on change, so that it can be iterated without the lock
+        self._trade_event_subscribers = ()
         self._request_lock = threading.Lock()
 
+        self._buffer_capacity = buffer_capacity
+        self._overflow_policy = overflow_policy
+        self._n_dispatcher_threads = dispatcher_threads
+        # created on connect, since closing them on disconnect is final
+        self._frames: Optional[FrameBuffer] = None
+        self._dispatcher_thread = None
+        self._shard_queues: List[queue.Queue] = []
+        self._shard_threads: List[threading.Thread] = []
+
     def connect(self):
+        self._authenticated.clear()
+        self._frames = FrameBuffer(
+            capacity=self._buffer_capacity,
+            parse=fast_json.loads,
+            overflow_policy=self._overflow_policy,
+            coalesce_key=self._get_coalesce_key,
+        )
+        self._shard_queues = []
+        if self._n_dispatcher_threads > 1:
+            self._shard_queues = [
+                queue.Queue(maxsize=self._buffer_capacity)
+                for _ in range(self._n_dispatcher_threads)
+            ]
+        self._shard_threads = [
+            threading.Thread(
+                target=self._run_shard_dispatcher, args=(shard_queue,),
+            )
+            for shard_queue in self._shard_queues
+        ]
+        for thread in self._shard_threads:
+            thread.start()
+        self._dispatcher_thread = threading.Thread(target=self._run_dispatcher)
+        self._dispatcher_thread.start()
         self._run_thread = threading.Thread(target=self._ws.run_forever)
         self._run_thread.start()
         self._authenticated.wait()
@@ -131,14 +221,37 @@ class PolygonWebSocketConnector:
     def disconnect(self):
         self._ws.close()
         self._run_thread.join()
+        self._frames.close()
+        self._dispatcher_thread.join()
+        for thread in self._shard_threads:
+            thread.join()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the dispatch counters.
+
+        Returns
+        -------
+        dict
+            The counters of the frames buffer (see
+            :meth:`~algotradepy.connectors.frame_buffer.FrameBuffer.get_stats`)
+            and the `shard_depth`, the number of trades waiting in the
+            per-thread queues, for the current or last connection.
+        """
+        if self._frames is None:
+            raise RuntimeError("The connector was never connected.")
+        stats = self._frames.get_stats()
+        stats["shard_depth"] = sum(q.qsize() for q in self._shard_queues)
+        return stats
 
     def subscribe_to_trade_event(self, func: Callable):
         with self._trade_event_subscribers_lock:
-            self._trade_event_subscribers.append(func)
+            self._trade_event_subscribers += (func,)
 
     def unsubscribe_from_trade_event(self, func: Callable):
         with self._trade_event_subscribers_lock:
-            self._trade_event_subscribers.remove(func)
+            subscribers = list(self._trade_event_subscribers)
+            subscribers.remove(func)
+            self._trade_event_subscribers = tuple(subscribers)
 
     def request_trade_data(self, symbol: str):
         request = {
@@ -166,12 +279,34 @@ class PolygonWebSocketConnector:
 
     def _on_message(self):
         def f(_, message):
-            message = json.loads(message)
+            self._frames.put(frame=message)
 
-            for event in message:
+        return f
+
+    @staticmethod
+    def _get_coalesce_key(event: Dict) -> Optional[tuple]:
+        key = None
+        if event.get("ev") == "T":
+            key = ("T", event["sym"])
+        return key
+
+    def _run_dispatcher(self):
+        while True:
+            events = self._frames.get_events()
+            if events is None:
+                break
+            for event in events:
                 self._process_event(event=event)
 
-        return f
+        for shard_queue in self._shard_queues:
+            shard_queue.put(None)
+
+    def _run_shard_dispatcher(self, shard_queue: queue.Queue):
+        while True:
+            event = shard_queue.get()
+            if event is None:
+                break
+            self._dispatch_trade_event(event=event)
 
     def _process_event(self, event: Dict):
         ev = event["ev"]
@@ -191,9 +326,15 @@ class PolygonWebSocketConnector:
                 logging.info("Polygon Web Socket authenticated.")
 
     def _process_trade_event(self, event: Dict):
-        with self._trade_event_subscribers_lock:
-            for subscriber in self._trade_event_subscribers:
-                subscriber(event)
+        if len(self._shard_queues) != 0:
+            shard = hash(event["sym"]) % len(self._shard_queues)
+            self._shard_queues[shard].put(event)
+        else:
+            self._dispatch_trade_event(event=event)
+
+    def _dispatch_trade_event(self, event: Dict):
+        for subscriber in self._trade_event_subscribers:
+            subscriber(event)
 
     def _make_request(self, request: Dict):
         with self._request_lock:
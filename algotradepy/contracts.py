@@ -1,7 +1,7 @@
 from abc import ABC
 from datetime import date
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple, Dict, Type
 
 from algotradepy.utils import ReprAble, Comparable
 
@@ -153,8 +153,16 @@ class AContract(ABC, ReprAble, Comparable):
         The exchange on which this contract is traded.
     currency : ~algotradepy.contracts.Currency, default `Currency.USD`
         The currency of the contract.
+
+    Notes
+    -----
+    Contracts are hashed on their fields. The `exchange` and `currency` can
+    only be set until the contract is first hashed (e.g. used as a
+    dictionary key); setting them afterwards raises an AttributeError.
     """
 
+    __slots__ = ("_con_id", "_symbol", "_exchange", "_currency")
+
     def __init__(
         self,
         symbol: str,
@@ -183,6 +191,7 @@ class AContract(ABC, ReprAble, Comparable):
     @exchange.setter
     def exchange(self, ex: Exchange):
         assert isinstance(ex, Exchange)
+        self._reset_key()
         self._exchange = ex
 
     @property
@@ -192,8 +201,13 @@ class AContract(ABC, ReprAble, Comparable):
     @currency.setter
     def currency(self, cu: Currency):
         assert isinstance(cu, Currency)
+        self._reset_key()
         self._currency = cu
 
+    def _make_key(self) -> Tuple:
+        key = (self._symbol, self._con_id, self._exchange, self._currency)
+        return key
+
 
 class StockContract(AContract):
     """Defines a stock contract.
@@ -206,6 +220,8 @@ class StockContract(AContract):
     currency
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         symbol: str,
@@ -237,6 +253,8 @@ class OptionContract(AContract):
     currency
     """
 
+    __slots__ = ("_strike", "_right", "_multiplier", "_last_trade_date")
+
     # TODO: test; todo after getting option chain...
     def __init__(
         self,
@@ -273,8 +291,19 @@ class OptionContract(AContract):
     def last_trade_date(self) -> date:
         return self._last_trade_date
 
+    def _make_key(self) -> Tuple:
+        key = super()._make_key() + (
+            self._strike,
+            self._right,
+            self._multiplier,
+            self._last_trade_date,
+        )
+        return key
+
 
 class ForexContract(AContract):
+    __slots__ = ()
+
     def __init__(
         self,
         symbol: str,
@@ -287,6 +316,84 @@ class ForexContract(AContract):
         )
 
 
+class ContractRegistry:
+    """An intern pool of contracts.
+
+    Returns a single, canonical instance for all the equal contracts, so
+    that the hot paths receiving market data events can look their
+    contract up without building, hashing and comparing a new object for
+    each event.
+
+    The contracts are mutable, and modifying a canonical instance would
+    modify it for all of its holders and change its hash while it is used
+    as a dictionary key. A registry is therefore meant to be private to the
+    component using it (e.g. to key the subscriptions of a streamer), and
+    its canonical instances must not be handed out.
+    """
+
+    def __init__(self):
+        self._contracts: Dict[Tuple, AContract] = {}
+        self._requests: Dict[Tuple, AContract] = {}
+
+    def __len__(self) -> int:
+        return len(self._contracts)
+
+    def intern(self, contract: AContract) -> AContract:
+        """Get the canonical instance of a contract.
+
+        Parameters
+        ----------
+        contract : AContract
+            The contract. It becomes the canonical instance if no equal
+            contract was registered before.
+
+        Returns
+        -------
+        AContract
+            The canonical instance.
+        """
+        key = (type(contract),) + contract._get_key()
+        contract = self._contracts.setdefault(key, contract)
+        return contract
+
+    def get(self, contract_type: Type[AContract], **kwargs) -> AContract:
+        """Get the canonical instance of a contract from its definition.
+
+        Parameters
+        ----------
+        contract_type : Type[AContract]
+            The type of contract.
+        kwargs
+            The keyword arguments with which to build the contract. The
+            definitions are remembered, so that subsequent requests with the
+            same arguments do not build the contract.
+
+        Returns
+        -------
+        AContract
+            The canonical instance.
+
+        Examples
+        --------
+        >>> registry = ContractRegistry()
+        >>> spy = registry.get(StockContract, symbol="SPY")
+        >>> registry.get(StockContract, symbol="SPY") is spy
+        True
+        """
+        request_key = (contract_type,) + tuple(kwargs.items())
+        contract = self._requests.get(request_key)
+
+        if contract is None:
+            contract = self.intern(contract=contract_type(**kwargs))
+            self._requests[request_key] = contract
+
+        return contract
+
+    def clear(self):
+        self._contracts.clear()
+        self._requests.clear()
+
+
 def are_loosely_equal_contracts(
     loose: AContract, well_defined: AContract,
 ) -> bool:
@@ -3,11 +3,19 @@ from algotradepy.historical.providers.yahoo_provider import (
 )
 from algotradepy.historical.loaders import HistoricalRetriever
 from algotradepy.historical.transformers import HistoricalAggregator
+from algotradepy.historical.storage import (
+    CSVHistStorage,
+    ParquetHistStorage,
+    ArrowHistStorage,
+)
 
 __all__ = [
     "YahooHistoricalProvider",
     "HistoricalRetriever",
     "HistoricalAggregator",
+    "CSVHistStorage",
+    "ParquetHistStorage",
+    "ArrowHistStorage",
 ]
 
 try:
@@ -0,0 +1,223 @@
+import json
+import os
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from algotradepy.historical.hist_utils import DATE_FORMAT
+from algotradepy.historical.storage import AHistStorage
+
+MANIFEST_FILE_NAME = ".manifest.json"
+_NANOS_PER_DAY = 24 * 60 * 60 * 10 ** 9
+
+
+class CacheIndex:
+    """The coverage index of a single cache folder.
+
+    The index records, for each cached date, the number of rows, the first
+    and last timestamps (nanoseconds since the epoch) and the storage format
+    of the file holding the data. It is persisted as a JSON manifest inside
+    the folder it describes, which allows coverage queries without scanning
+    the folder.
+
+    Parameters
+    ----------
+    folder_path : pathlib.Path
+        The cache folder described by the index.
+    schema_v : int, optional, default None
+        The schema version of the data in the folder.
+    days : dict, optional, default None
+        The index entries, keyed by date string.
+    """
+
+    def __init__(
+        self,
+        folder_path: Path,
+        schema_v: Optional[int] = None,
+        days: Optional[Dict[str, Dict]] = None,
+    ):
+        self._folder_path = Path(folder_path)
+        self._schema_v = schema_v
+        if days is None:
+            days = {}
+        self._days = days
+        self._dates = None
+
+    @property
+    def folder_path(self) -> Path:
+        return self._folder_path
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._folder_path / MANIFEST_FILE_NAME
+
+    @property
+    def schema_v(self) -> Optional[int]:
+        return self._schema_v
+
+    @schema_v.setter
+    def schema_v(self, schema_v: Optional[int]):
+        self._schema_v = schema_v
+
+    @property
+    def dates(self) -> List[date]:
+        """The sorted list of covered dates."""
+        if self._dates is None:
+            self._dates = sorted(
+                datetime.strptime(date_str, DATE_FORMAT).date()
+                for date_str in self._days
+            )
+        return self._dates
+
+    def covers(self, date_: date) -> bool:
+        covered = date_.strftime(DATE_FORMAT) in self._days
+        return covered
+
+    def get_entry(self, date_: date) -> Optional[Dict]:
+        entry = self._days.get(date_.strftime(DATE_FORMAT))
+        return entry
+
+    def get_dates(self, start_date: date, end_date: date) -> List[date]:
+        """Get the covered dates between two dates, inclusive."""
+        dates = self.dates
+        start_idx = np.searchsorted(dates, start_date, side="left")
+        end_idx = np.searchsorted(dates, end_date, side="right")
+        dates = dates[start_idx:end_idx]
+        return dates
+
+    def update(self, data: pd.DataFrame, extension: str):
+        """Record the dates covered by a data frame.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The data, indexed by a `datetime` index.
+        extension : str
+            The file extension of the storage format holding the data.
+        """
+        if len(data) == 0:
+            return
+
+        ts = np.sort(pd.DatetimeIndex(data.index).asi8)
+        days = ts // _NANOS_PER_DAY
+        unique_days, starts, counts = np.unique(
+            days, return_index=True, return_counts=True,
+        )
+
+        for day, start, count in zip(unique_days, starts, counts):
+            date_str = str(np.datetime64(int(day), "D"))
+            self._days[date_str] = {
+                "rows": int(count),
+                "start": int(ts[start]),
+                "end": int(ts[start + count - 1]),
+                "ext": extension,
+            }
+
+        self._dates = None
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the index as a data frame indexed by date."""
+        data = pd.DataFrame.from_dict(self._days, orient="index")
+        if len(data) != 0:
+            data.index = pd.to_datetime(data.index).date
+            data = data.sort_index()
+        data.index.name = "date"
+        return data
+
+    def save(self):
+        """Atomically persist the index to the folder manifest."""
+        manifest = {"schema_v": self._schema_v, "days": self._days}
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._folder_path, prefix=MANIFEST_FILE_NAME, suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(
+        cls, folder_path: Path, daily: bool, storages: List[AHistStorage],
+    ) -> "CacheIndex":
+        """Load the index of a cache folder.
+
+        If the folder has no manifest (e.g. it was written by an older
+        version), the index is rebuilt from the folder contents. The rebuilt
+        index is not persisted until the folder is next written to.
+
+        Parameters
+        ----------
+        folder_path : pathlib.Path
+            The cache folder.
+        daily : bool
+            Whether the folder holds daily bars data.
+        storages : list of AHistStorage
+            The storage formats in which the data may be stored, in order of
+            preference.
+        """
+        folder_path = Path(folder_path)
+        manifest_path = folder_path / MANIFEST_FILE_NAME
+
+        if manifest_path.exists():
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+            index = cls(
+                folder_path=folder_path,
+                schema_v=manifest["schema_v"],
+                days=manifest["days"],
+            )
+        else:
+            index = cls._rebuild(
+                folder_path=folder_path, daily=daily, storages=storages,
+            )
+
+        return index
+
+    @classmethod
+    def _rebuild(
+        cls, folder_path: Path, daily: bool, storages: List[AHistStorage],
+    ) -> "CacheIndex":
+        schema_v = None
+        schema_path = folder_path / ".schema_v"
+        if schema_path.exists():
+            with open(schema_path, "r") as f:
+                schema_v = int(f.read())
+        index = cls(folder_path=folder_path, schema_v=schema_v)
+
+        if daily:
+            for storage in storages:
+                file_path = folder_path / storage.file_name(stem="daily")
+                if file_path.exists():
+                    data = storage.read(file_path=file_path)
+                    index.update(data=data, extension=storage.EXTENSION)
+                    break
+        elif folder_path.exists():
+            extensions = [storage.EXTENSION for storage in storages]
+            for file_name in os.listdir(folder_path):
+                stem, _, extension = file_name.partition(".")
+                if extension not in extensions:
+                    continue
+                try:
+                    datetime.strptime(stem, DATE_FORMAT)
+                except ValueError:
+                    continue
+                entry = index._days.get(stem)
+                if entry is None or extensions.index(
+                    extension
+                ) < extensions.index(entry["ext"]):
+                    index._days[stem] = {
+                        "rows": None,
+                        "start": None,
+                        "end": None,
+                        "ext": extension,
+                    }
+
+        return index
@@ -1,5 +1,7 @@
 from datetime import timedelta, date
-from typing import Optional
+from typing import Optional, List
+
+import pandas as pd
 
 from algotradepy.path_utils import PROJECT_DIR
 from algotradepy.time_utils import generate_trading_days
@@ -35,16 +37,41 @@ def bar_size_to_str(bar_size: Optional[timedelta]):
     return bar_size_str
 
 
-def hist_file_names(
+def hist_file_stems(
     start_date: date, end_date: date, bar_size: timedelta,
 ):
     if is_daily(bar_size=bar_size):
-        f_names = ["daily.csv"]
+        f_stems = ["daily"]
     else:
         dates = generate_trading_days(start_date=start_date, end_date=end_date)
-        f_names = [f"{date_.strftime(DATE_FORMAT)}.csv" for date_ in dates]
+        f_stems = [date_.strftime(DATE_FORMAT) for date_ in dates]
+
+    return f_stems
+
+
+def hist_file_names(
+    start_date: date, end_date: date, bar_size: timedelta, extension="csv",
+):
+    f_stems = hist_file_stems(
+        start_date=start_date, end_date=end_date, bar_size=bar_size,
+    )
+    f_names = [f"{stem}.{extension}" for stem in f_stems]
 
     return f_names
 
 
+def concat_data(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate data frames in a single pass, skipping empty ones."""
+    frames = [frame for frame in frames if len(frame) != 0]
+
+    if len(frames) == 0:
+        data = pd.DataFrame()
+    elif len(frames) == 1:
+        data = frames[0]
+    else:
+        data = pd.concat(frames)
+
+    return data
+
+
 HIST_DATA_DIR = PROJECT_DIR / "histData"
@@ -1,10 +1,22 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta, time
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import (
+    Optional,
+    List,
+    Iterator,
+    Dict,
+    Tuple,
+    Callable,
+    Union,
+    Iterable,
+)
 
-import pandas as pd
 import numpy as np
+import pandas as pd
 
 from algotradepy.contracts import (
     AContract,
@@ -12,34 +24,188 @@ from algotradepy.contracts import (
     OptionContract,
     ForexContract,
 )
+from algotradepy.historical.cache_index import CacheIndex, MANIFEST_FILE_NAME
 from algotradepy.historical.hist_utils import (
     bar_size_to_str,
-    hist_file_names,
+    concat_data,
     is_daily,
-    DATETIME_FORMAT,
     DATE_FORMAT,
     HIST_DATA_DIR,
 )
 from algotradepy.historical.providers.base import AHistoricalProvider
+from algotradepy.historical.storage import AHistStorage, CSVHistStorage
+from algotradepy.historical.tick_store import (
+    TickStore,
+    frame_to_records,
+    TRADES_DTYPE,
+    QUOTES_DTYPE,
+)
 from algotradepy.time_utils import generate_trading_days
 
 
 class HistCacheHandler:
-    """
-    TODO: documentation
+    """Manages the historical data cache.
+
+    Data is stored in one file per trading day (one file per contract for
+    daily bars) under `<con_type>/<symbol>/<bar_size>`. Each folder holds a
+    manifest (see :class:`~algotradepy.historical.cache_index.CacheIndex`)
+    recording the cached dates, which is updated on every write and used to
+    answer coverage queries without scanning the folder. Trades and tick data
+    are additionally written to a memory-mapped
+    :class:`~algotradepy.historical.tick_store.TickStore`.
+
+    Parameters
+    ----------
+    hist_data_dir : pathlib.Path, default "../histData"
+        The path to the historical data cache.
+    storage : AHistStorage, optional, default None
+        The storage format used to write and read the cache files. Defaults to
+        :class:`~algotradepy.historical.storage.CSVHistStorage`. If another
+        format is used, files missing in that format are read from the legacy
+        CSV files, if available.
     """
 
-    def __init__(self, hist_data_dir: Path = HIST_DATA_DIR):
+    def __init__(
+        self,
+        hist_data_dir: Path = HIST_DATA_DIR,
+        storage: Optional[AHistStorage] = None,
+    ):
         self._hist_data_dir = hist_data_dir
+        if storage is None:
+            storage = CSVHistStorage()
+        self._storage = storage
+        self._legacy_storage = CSVHistStorage()
+        self._indices: Dict[Path, Tuple[Optional[int], CacheIndex]] = {}
+        self._folder_locks: Dict[Path, threading.Lock] = {}
+        self._index_lock = threading.Lock()  # guards the two dicts above
 
     @property
     def base_data_path(self) -> Path:
         return self._hist_data_dir
 
     @property
-    def available_data(self) -> dict:
-        # TODO: implement
-        raise NotImplementedError
+    def storage(self) -> AHistStorage:
+        return self._storage
+
+    @property
+    def available_data(self) -> Dict[str, Dict[str, Dict[str, List[date]]]]:
+        """The cached dates, keyed by contract type, symbol and bar size.
+
+        The bar size keys are the names of the cache folders (e.g. "1 min"
+        or "trades" for trades data), and "daily" for daily bars.
+        """
+        available = {}
+
+        base_data_path = Path(self.base_data_path)
+
+        if not base_data_path.exists():
+            return available
+
+        for con_type in sorted(os.listdir(base_data_path)):
+            con_type_path = base_data_path / con_type
+            if not con_type_path.is_dir():
+                continue
+            con_type_data = {}
+            for symbol in sorted(os.listdir(con_type_path)):
+                symbol_path = con_type_path / symbol
+                if not symbol_path.is_dir():
+                    continue
+                symbol_data = {}
+                daily_index = self._get_index(
+                    folder_path=symbol_path, daily=True,
+                )
+                if len(daily_index.dates) != 0:
+                    symbol_data["daily"] = daily_index.dates
+                for suffix in sorted(os.listdir(symbol_path)):
+                    folder_path = symbol_path / suffix
+                    if not folder_path.is_dir():
+                        continue
+                    index = self._get_index(
+                        folder_path=folder_path, daily=False,
+                    )
+                    symbol_data[suffix] = index.dates
+                con_type_data[symbol] = symbol_data
+            available[con_type] = con_type_data
+
+        return available
+
+    def get_coverage(
+        self, contract: AContract, bar_size: Optional[timedelta] = None,
+    ) -> pd.DataFrame:
+        """Get the cache coverage for a contract.
+
+        Parameters
+        ----------
+        contract : AContract
+        bar_size : datetime.timedelta, optional, default None
+            The bar size. If not specified, returns the coverage of the trades
+            data.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per cached date with the number of rows (`rows`), the
+            first and last time stamps in nanoseconds since the epoch
+            (`start` and `end`) and the file format (`ext`).
+        """
+        bar_size, suffix = self._resolve_bar_size(bar_size=bar_size)
+        folder_path = self._get_folder_path(contract=contract, suffix=suffix)
+        index = self._get_index(
+            folder_path=folder_path, daily=is_daily(bar_size=bar_size),
+        )
+        coverage = index.to_frame()
+
+        return coverage
+
+    def get_missing_date_ranges(
+        self,
+        contract: AContract,
+        start_date: date,
+        end_date: date,
+        bar_size: Optional[timedelta] = None,
+        trading_days: Optional[List[date]] = None,
+    ) -> List[List[date]]:
+        """Get the trading days not covered by the cache.
+
+        Parameters
+        ----------
+        contract : AContract
+        start_date : datetime.date
+        end_date : datetime.date
+        bar_size : datetime.timedelta, optional, default None
+            The bar size. If not specified, checks the trades data.
+        trading_days : list of datetime.date, optional, default None
+            The trading days between the start and end dates. Allows sharing
+            the calendar computation between multiple calls.
+
+        Returns
+        -------
+        list of list of datetime.date
+            The runs of consecutive trading days missing from the cache.
+        """
+        bar_size, suffix = self._resolve_bar_size(bar_size=bar_size)
+        folder_path = self._get_folder_path(contract=contract, suffix=suffix)
+        index = self._get_index(
+            folder_path=folder_path, daily=is_daily(bar_size=bar_size),
+        )
+        if trading_days is None:
+            trading_days = generate_trading_days(
+                start_date=start_date, end_date=end_date,
+            )
+
+        date_ranges = []
+        date_range = []
+        for date_ in trading_days:
+            if index.covers(date_=date_):
+                if len(date_range) != 0:
+                    date_ranges.append(date_range)
+                    date_range = []
+            else:
+                date_range.append(date_)
+        if len(date_range) != 0:
+            date_ranges.append(date_range)
+
+        return date_ranges
 
     def get_cached_bar_data(
         self,
@@ -116,33 +282,164 @@ class HistCacheHandler:
         suffix: str,
     ):
         if len(data) != 0:
-            contract_type = self._get_con_type(contract=contract)
-            symbol = contract.symbol
-            folder_path = self.base_data_path / contract_type / symbol / suffix
+            folder_path = self._get_folder_path(
+                contract=contract, suffix=suffix,
+            )
+            daily = is_daily(bar_size=bar_size)
 
-            if not os.path.exists(path=folder_path):
-                os.makedirs(name=folder_path)
-                if schema_v:
-                    with open(folder_path / ".schema_v", "w") as f:
-                        f.write(str(schema_v))
-
-            self._validate_schema(folder_path=folder_path, schema_v=schema_v)
-            if is_daily(bar_size=bar_size):
-                file_path = folder_path / "daily.csv"
-                if os.path.exists(file_path):
-                    day_data = pd.read_csv(
-                        file_path, index_col="datetime", parse_dates=True,
+            # only writes to the same folder need to be serialized
+            with self._get_folder_lock(folder_path=folder_path):
+                if not os.path.exists(path=folder_path):
+                    os.makedirs(name=folder_path)
+                    if schema_v:
+                        with open(folder_path / ".schema_v", "w") as f:
+                            f.write(str(schema_v))
+
+                self._validate_schema(
+                    folder_path=folder_path, schema_v=schema_v,
+                )
+                index = self._get_index(folder_path=folder_path, daily=daily)
+
+                if daily:
+                    day_data = self._read_file(
+                        folder_path=folder_path, stem="daily",
                     )
-                    data = data.append(day_data).sort_index()
-                data.to_csv(file_path, date_format=DATE_FORMAT)
-            else:
-                data_by_date = data.groupby(pd.Grouper(freq="D"))
+                    if day_data is not None:
+                        data = concat_data(
+                            frames=[data, day_data],
+                        ).sort_index()
+                    file_path = folder_path / self._storage.file_name(
+                        stem="daily",
+                    )
+                    self._storage.write(
+                        data=data, file_path=file_path, daily=True,
+                    )
+                else:
+                    data_by_date = data.groupby(pd.Grouper(freq="D"))
 
-                for date_, group in data_by_date:
-                    if len(group) != 0:
-                        file_name = f"{date_.date().strftime(DATE_FORMAT)}.csv"
-                        file_path = folder_path / file_name
-                        group.to_csv(file_path, date_format=DATETIME_FORMAT)
+                    for date_, group in data_by_date:
+                        if len(group) != 0:
+                            file_name = self._storage.file_name(
+                                stem=date_.date().strftime(DATE_FORMAT),
+                            )
+                            file_path = folder_path / file_name
+                            self._storage.write(
+                                data=group, file_path=file_path, daily=False,
+                            )
+
+                if bar_size == timedelta(0):
+                    self._write_ticks(
+                        data=data, folder_path=folder_path, suffix=suffix,
+                    )
+
+                index.update(data=data, extension=self._storage.EXTENSION)
+                if schema_v:
+                    index.schema_v = schema_v
+                index.save()
+                mtime = self._get_manifest_mtime(folder_path=folder_path)
+                with self._index_lock:
+                    self._indices[folder_path] = (mtime, index)
+
+    def iter_cached_days(
+        self,
+        contract: AContract,
+        start_date: date,
+        end_date: date,
+        bar_size: Optional[timedelta] = None,
+        schema_v: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over the cached data one trading day at a time.
+
+        Only one day of data is loaded in memory at any given time, which
+        allows processing histories that do not fit in memory.
+
+        Parameters
+        ----------
+        contract : AContract
+        start_date : datetime.date
+        end_date : datetime.date
+        bar_size : datetime.timedelta, optional, default None
+            The bar size. If not specified, iterates over the cached trades
+            data.
+        schema_v : int, optional, default None
+            The expected schema version.
+
+        Yields
+        ------
+        pandas.DataFrame
+            The data for a single trading day. Trading days with no cached
+            data are skipped. For daily bars, the whole requested range is
+            yielded as a single data frame.
+        """
+        bar_size, suffix = self._resolve_bar_size(bar_size=bar_size)
+
+        yield from self._iter_cached_data(
+            contract=contract,
+            start_date=start_date,
+            end_date=end_date,
+            bar_size=bar_size,
+            schema_v=schema_v,
+            suffix=suffix,
+        )
+
+    def get_tick_store(
+        self, contract: AContract, bar_size: Optional[timedelta] = None,
+    ) -> TickStore:
+        """Get the memory-mapped tick store of a contract.
+
+        Parameters
+        ----------
+        contract : AContract
+        bar_size : datetime.timedelta, optional, default None
+            If set to `timedelta(0)`, returns the store of the tick (quotes)
+            data. Otherwise, returns the store of the trades data.
+        """
+        if bar_size is None:
+            suffix = "trades"
+        else:
+            suffix = bar_size_to_str(bar_size=bar_size)
+        folder_path = self._get_folder_path(contract=contract, suffix=suffix)
+        dtype = self._get_ticks_dtype(suffix=suffix)
+        store = TickStore(folder_path=folder_path, dtype=dtype)
+
+        return store
+
+    def get_tick_records(
+        self,
+        contract: AContract,
+        date_: date,
+        bar_size: Optional[timedelta] = None,
+    ) -> Optional[np.ndarray]:
+        """Get the cached tick records of a single day.
+
+        The records are memory-mapped from the tick store if available, and
+        converted from the cache files otherwise.
+
+        Parameters
+        ----------
+        contract : AContract
+        date_ : datetime.date
+        bar_size : datetime.timedelta, optional, default None
+            If set to `timedelta(0)`, returns the tick (quotes) data.
+            Otherwise, returns the trades data.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The records, or `None` if the day is not cached.
+        """
+        store = self.get_tick_store(contract=contract, bar_size=bar_size)
+        records = store.open_day(date_=date_)
+
+        if records is None:
+            data = self._read_file(
+                folder_path=store.folder_path,
+                stem=date_.strftime(DATE_FORMAT),
+            )
+            if data is not None:
+                records = frame_to_records(data=data, dtype=store.dtype)
+
+        return records
 
     def _get_cached_data(
         self,
@@ -153,33 +450,139 @@ class HistCacheHandler:
         schema_v: Optional[int],
         suffix: str,
     ) -> pd.DataFrame:
-        contract_type = self._get_con_type(contract=contract)
-        symbol = contract.symbol
-        folder_path = self.base_data_path / contract_type / symbol / suffix
-        data = pd.DataFrame()
+        frames = list(
+            self._iter_cached_data(
+                contract=contract,
+                start_date=start_date,
+                end_date=end_date,
+                bar_size=bar_size,
+                schema_v=schema_v,
+                suffix=suffix,
+            )
+        )
+        data = concat_data(frames=frames)
+
+        return data
+
+    def _iter_cached_data(
+        self,
+        contract: AContract,
+        start_date: date,
+        end_date: date,
+        bar_size: timedelta,
+        schema_v: Optional[int],
+        suffix: str,
+    ) -> Iterator[pd.DataFrame]:
+        folder_path = self._get_folder_path(contract=contract, suffix=suffix)
 
         if not folder_path.exists():
-            return data
+            return
 
         self._validate_schema(folder_path=folder_path, schema_v=schema_v)
-        file_names = hist_file_names(
-            start_date=start_date, end_date=end_date, bar_size=bar_size,
-        )
+        daily = is_daily(bar_size=bar_size)
+        index = self._get_index(folder_path=folder_path, daily=daily)
+        dates = index.get_dates(start_date=start_date, end_date=end_date)
 
-        for file_name in file_names:
-            file_path = folder_path / file_name
-            if os.path.exists(file_path):
-                day_data = pd.read_csv(
-                    file_path, index_col="datetime", parse_dates=True,
+        if daily:
+            if len(dates) != 0:
+                data = self._read_file(folder_path=folder_path, stem="daily")
+                if data is not None:
+                    yield data.loc[start_date:end_date]
+        else:
+            for date_ in dates:
+                day_data = self._read_file(
+                    folder_path=folder_path,
+                    stem=date_.strftime(DATE_FORMAT),
+                    extension=index.get_entry(date_=date_)["ext"],
                 )
-                data = data.append(day_data)
+                if day_data is not None and len(day_data) != 0:
+                    yield day_data
 
-        if len(data) != 0:
-            if is_daily(bar_size=bar_size):
-                data = data.loc[start_date:end_date]
+    def _read_file(
+        self, folder_path: Path, stem: str, extension: Optional[str] = None,
+    ) -> Optional[pd.DataFrame]:
+        data = None
+
+        for storage in self._storages:
+            if extension is not None and storage.EXTENSION != extension:
+                continue
+            file_path = folder_path / storage.file_name(stem=stem)
+            if os.path.exists(file_path):
+                data = storage.read(file_path=file_path)
+                break
 
         return data
 
+    def _write_ticks(self, data: pd.DataFrame, folder_path: Path, suffix: str):
+        dtype = self._get_ticks_dtype(suffix=suffix)
+        if set(dtype.names[1:]).issubset(data.columns):
+            store = TickStore(folder_path=folder_path, dtype=dtype)
+            store.write(data=data)
+
+    @staticmethod
+    def _get_ticks_dtype(suffix: str) -> np.dtype:
+        if suffix == "trades":
+            dtype = TRADES_DTYPE
+        else:
+            dtype = QUOTES_DTYPE
+        return dtype
+
+    @property
+    def _storages(self) -> List[AHistStorage]:
+        storages = [self._storage]
+        if self._storage.EXTENSION != self._legacy_storage.EXTENSION:
+            storages.append(self._legacy_storage)
+        return storages
+
+    def _get_index(self, folder_path: Path, daily: bool) -> CacheIndex:
+        mtime = self._get_manifest_mtime(folder_path=folder_path)
+        with self._index_lock:
+            memo = self._indices.get(folder_path)
+
+        if memo is not None and memo[0] == mtime:
+            index = memo[1]
+        else:
+            index = CacheIndex.load(
+                folder_path=folder_path, daily=daily, storages=self._storages,
+            )
+            with self._index_lock:
+                self._indices[folder_path] = (mtime, index)
+
+        return index
+
+    def _get_folder_lock(self, folder_path: Path) -> threading.Lock:
+        with self._index_lock:
+            lock = self._folder_locks.get(folder_path)
+            if lock is None:
+                lock = threading.Lock()
+                self._folder_locks[folder_path] = lock
+        return lock
+
+    @staticmethod
+    def _get_manifest_mtime(folder_path: Path) -> Optional[int]:
+        try:
+            mtime = os.stat(folder_path / MANIFEST_FILE_NAME).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        return mtime
+
+    def _get_folder_path(self, contract: AContract, suffix: str) -> Path:
+        contract_type = self._get_con_type(contract=contract)
+        base_data_path = Path(self.base_data_path)
+        folder_path = base_data_path / contract_type / contract.symbol / suffix
+        return folder_path
+
+    @staticmethod
+    def _resolve_bar_size(
+        bar_size: Optional[timedelta],
+    ) -> Tuple[timedelta, str]:
+        if bar_size is None:
+            bar_size = timedelta(0)
+            suffix = "trades"
+        else:
+            suffix = bar_size_to_str(bar_size=bar_size)
+        return bar_size, suffix
+
     @staticmethod
     def _get_con_type(contract: AContract) -> str:
         if isinstance(contract, StockContract):
@@ -221,6 +624,15 @@ class HistoricalRetriever:
         non-cached data.
     hist_data_dir : pathlib.Path, default "../histData"
         The path to the historical data cache.
+    storage : AHistStorage, optional, default None
+        The cache storage format. See
+        :class:`~algotradepy.historical.loaders.HistCacheHandler`.
+    max_workers : int, default 1
+        The number of threads used to download missing data. If greater than
+        one, missing intraday and trades data is requested one trading day
+        at a time and in parallel, up to the provider's
+        `MAX_CONCURRENT_REQUESTS`. Each day is written to the cache as soon as
+        it is received.
 
     Notes
     -----
@@ -232,9 +644,22 @@ class HistoricalRetriever:
         self,
         provider: Optional[AHistoricalProvider] = None,
         hist_data_dir: Path = HIST_DATA_DIR,
+        storage: Optional[AHistStorage] = None,
+        max_workers: int = 1,
     ):
-        self._cache_handler = HistCacheHandler(hist_data_dir=hist_data_dir)
+        self._cache_handler = HistCacheHandler(
+            hist_data_dir=hist_data_dir, storage=storage,
+        )
         self._provider = provider
+        self._max_workers = max_workers
+
+    @property
+    def hist_data_dir(self) -> Path:
+        return self._cache_handler.base_data_path
+
+    @property
+    def storage(self) -> AHistStorage:
+        return self._cache_handler.storage
 
     def retrieve_bar_data(
         self,
@@ -297,30 +722,34 @@ class HistoricalRetriever:
             data = pd.DataFrame()
 
         if not cache_only:
-            date_ranges = self._get_missing_date_ranges(
-                data=data, start_date=start_date, end_date=end_date,
+            date_ranges = self._cache_handler.get_missing_date_ranges(
+                contract=contract,
+                start_date=start_date,
+                end_date=end_date,
+                bar_size=bar_size,
             )
-
-            for date_range in date_ranges:
-                range_data = self._provider.download_bars_data(
+            if len(date_ranges) != 0:
+                frames = [data]
+                download = partial(
+                    self._provider.download_bars_data,
                     contract=contract,
-                    start_date=date_range[0],
-                    end_date=date_range[-1],
                     bar_size=bar_size,
                     rth=False,
                 )
-                data = data.append(range_data)
-
-                if cache_downloads:
-                    range_data = range_data[
-                        range_data.index <= pd.to_datetime(end_cache_date)
-                    ]
-                    self._cache_handler.cache_bar_data(
-                        data=range_data,
-                        contract=contract,
-                        bar_size=bar_size,
-                        schema_v=AHistoricalProvider.BARS_SCHEMA_V,
-                    )
+                cache = partial(
+                    self._cache_handler.cache_bar_data,
+                    contract=contract,
+                    bar_size=bar_size,
+                    schema_v=AHistoricalProvider.BARS_SCHEMA_V,
+                )
+                frames += self._download_date_ranges(
+                    date_ranges=date_ranges,
+                    download=download,
+                    cache=cache if cache_downloads else None,
+                    end_cache_date=end_cache_date,
+                    split_days=not is_daily(bar_size=bar_size),
+                )
+                data = concat_data(frames=frames).sort_index()
 
         if rth and not is_daily(bar_size=bar_size):
             data = data.between_time(
@@ -329,6 +758,163 @@ class HistoricalRetriever:
 
         return data
 
+    def retrieve_bars_bulk(
+        self,
+        contracts: Iterable[AContract],
+        bar_size: timedelta,
+        start_date: date,
+        end_date: date,
+        cache_only: bool = False,
+        rth: bool = True,
+        as_dict: bool = False,
+    ) -> Union[pd.DataFrame, Dict[AContract, pd.DataFrame]]:
+        """Retrieves the historical bar data of multiple contracts.
+
+        See :meth:`iter_bars_bulk`.
+
+        Parameters
+        ----------
+        contracts : iterable of AContract
+        bar_size : datetime.timedelta
+        start_date : datetime.date
+        end_date : datetime.date
+        cache_only : bool, default False
+            Prevents data-download on cache-miss.
+        rth : bool, default True
+            Restrict to regular trading hours.
+        as_dict : bool, default False
+            Whether to return a dictionary of data frames keyed by contract
+            instead of a single data frame.
+
+        Returns
+        -------
+        pandas.DataFrame or dict
+            The requested historical data, indexed by contract and `datetime`
+            if returned as a single data frame.
+        """
+        data = {}
+
+        for contract, contract_data in self.iter_bars_bulk(
+            contracts=contracts,
+            bar_size=bar_size,
+            start_date=start_date,
+            end_date=end_date,
+            cache_only=cache_only,
+            rth=rth,
+        ):
+            data[contract] = contract_data
+
+        if not as_dict:
+            frames = [frame for frame in data.values() if len(frame) != 0]
+            if len(frames) == 0:
+                data = pd.DataFrame()
+            else:
+                data = pd.concat(
+                    frames,
+                    keys=[
+                        contract
+                        for contract, frame in data.items()
+                        if len(frame) != 0
+                    ],
+                    names=["contract", "datetime"],
+                )
+
+        return data
+
+    def iter_bars_bulk(
+        self,
+        contracts: Iterable[AContract],
+        bar_size: timedelta,
+        start_date: date,
+        end_date: date,
+        cache_only: bool = False,
+        rth: bool = True,
+    ) -> Iterator[Tuple[AContract, pd.DataFrame]]:
+        """Iterate over the historical bar data of multiple contracts.
+
+        The cache hits and misses of all the contracts are planned at once,
+        using a single trading calendar computation. The missing data is then
+        downloaded for all contracts using the worker pool and written to the
+        cache. Finally, the data is loaded from the cache one contract at a
+        time, such that only one contract's data is held in memory.
+
+        Parameters
+        ----------
+        contracts : iterable of AContract
+        bar_size : datetime.timedelta
+        start_date : datetime.date
+        end_date : datetime.date
+            If the end date is set to today's date, it will be adjusted to
+            yesterday's date to avoid storing partial historical data.
+        cache_only : bool, default False
+            Prevents data-download on cache-miss.
+        rth : bool, default True
+            Restrict to regular trading hours.
+
+        Yields
+        ------
+        tuple of AContract and pandas.DataFrame
+            The contract and its historical data.
+        """
+        contracts = list(contracts)
+
+        if end_date == date.today():
+            end_date -= timedelta(days=1)
+
+        if not cache_only:
+            trading_days = generate_trading_days(
+                start_date=start_date, end_date=end_date,
+            )
+            tasks = []
+            for contract in contracts:
+                date_ranges = self._cache_handler.get_missing_date_ranges(
+                    contract=contract,
+                    start_date=start_date,
+                    end_date=end_date,
+                    bar_size=bar_size,
+                    trading_days=trading_days,
+                )
+                if len(date_ranges) == 0:
+                    continue
+                download = partial(
+                    self._provider.download_bars_data,
+                    contract=contract,
+                    bar_size=bar_size,
+                    rth=False,
+                )
+                cache = partial(
+                    self._cache_handler.cache_bar_data,
+                    contract=contract,
+                    bar_size=bar_size,
+                    schema_v=AHistoricalProvider.BARS_SCHEMA_V,
+                )
+                date_ranges = self._split_date_ranges(
+                    date_ranges=date_ranges,
+                    split_days=not is_daily(bar_size=bar_size),
+                )
+                tasks += [
+                    (download, cache, date_range) for date_range in date_ranges
+                ]
+            self._run_downloads(
+                tasks=tasks, end_cache_date=end_date, keep_frames=False,
+            )
+
+        for contract in contracts:
+            data = self._cache_handler.get_cached_bar_data(
+                contract=contract,
+                start_date=start_date,
+                end_date=end_date,
+                bar_size=bar_size,
+                schema_v=AHistoricalProvider.BARS_SCHEMA_V,
+            )
+            if rth and not is_daily(bar_size=bar_size) and len(data) != 0:
+                data = data.between_time(
+                    start_time=time(9, 30),
+                    end_time=time(16),
+                    include_end=False,
+                )
+            yield contract, data
+
     def retrieve_trades_data(
         self,
         contract: AContract,
@@ -387,55 +973,165 @@ class HistoricalRetriever:
             data = pd.DataFrame()
 
         if not cache_only:
-            date_ranges = self._get_missing_date_ranges(
-                data=data, start_date=start_date, end_date=end_date,
+            date_ranges = self._cache_handler.get_missing_date_ranges(
+                contract=contract, start_date=start_date, end_date=end_date,
             )
-
-            for date_range in date_ranges:
-                range_data = self._provider.download_trades_data(
+            if len(date_ranges) != 0:
+                frames = [data]
+                download = partial(
+                    self._provider.download_trades_data,
                     contract=contract,
-                    start_date=date_range[0],
-                    end_date=date_range[-1],
                     rth=rth,
                 )
-                data = data.append(range_data)
-
-                if cache_downloads:
-                    range_data = range_data[
-                        range_data.index <= pd.to_datetime(end_cache_date)
-                    ]
-                    self._cache_handler.cache_trades_data(
-                        data=range_data,
-                        contract=contract,
-                        schema_v=AHistoricalProvider.TRADES_SCHEMA_V,
-                    )
+                cache = partial(
+                    self._cache_handler.cache_trades_data,
+                    contract=contract,
+                    schema_v=AHistoricalProvider.TRADES_SCHEMA_V,
+                )
+                frames += self._download_date_ranges(
+                    date_ranges=date_ranges,
+                    download=download,
+                    cache=cache if cache_downloads else None,
+                    end_cache_date=end_cache_date,
+                    split_days=True,
+                )
+                data = concat_data(frames=frames).sort_index()
 
         return data
 
-    @staticmethod
-    def _get_missing_date_ranges(
-        data: pd.DataFrame, start_date: date, end_date: date,
-    ) -> List[List[date]]:
-        dates = generate_trading_days(start_date=start_date, end_date=end_date)
+    def get_cached_tick_records(
+        self,
+        contract: AContract,
+        date_: date,
+        bar_size: Optional[timedelta] = None,
+    ) -> Optional[np.ndarray]:
+        """Get the cached tick records of a single day.
 
-        if len(data) != 0:
-            data_dates = np.unique(data.index.date).tolist()
-            date_ranges = []
-            date_range = []
-            for i in range(len(dates)):
-                date_ = dates[i]
-                if date_ != data_dates[0]:
-                    date_range.append(date_)
-                else:
-                    data_dates.pop(0)
-                    if len(date_range) != 0:
-                        date_ranges.append(date_range)
-                    if len(data_dates) == 0:
-                        if i != len(dates) - 1:
-                            date_ranges.append(dates[i + 1 :])
-                        break
-                    date_range = []
+        See :meth:`~HistCacheHandler.get_tick_records`. No data is downloaded.
+        """
+        records = self._cache_handler.get_tick_records(
+            contract=contract, date_=date_, bar_size=bar_size,
+        )
+        return records
+
+    def iter_cached_days(
+        self,
+        contract: AContract,
+        start_date: date,
+        end_date: date,
+        bar_size: Optional[timedelta] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over the cached data one trading day at a time.
+
+        No data is downloaded. Useful for processing multi-year tick histories
+        without loading them in memory all at once.
+
+        Parameters
+        ----------
+        contract : AContract
+        start_date : datetime.date
+        end_date : datetime.date
+        bar_size : datetime.timedelta, optional, default None
+            The bar size. If not specified, iterates over the cached trades
+            data.
+
+        Yields
+        ------
+        pandas.DataFrame
+            The data for a single trading day.
+        """
+        if bar_size is None:
+            schema_v = AHistoricalProvider.TRADES_SCHEMA_V
         else:
-            date_ranges = [dates]
+            schema_v = AHistoricalProvider.BARS_SCHEMA_V
+
+        yield from self._cache_handler.iter_cached_days(
+            contract=contract,
+            start_date=start_date,
+            end_date=end_date,
+            bar_size=bar_size,
+            schema_v=schema_v,
+        )
+
+    def _download_date_ranges(
+        self,
+        date_ranges: List[List[date]],
+        download: Callable,
+        cache: Optional[Callable],
+        end_cache_date: date,
+        split_days: bool,
+    ) -> List[pd.DataFrame]:
+        date_ranges = self._split_date_ranges(
+            date_ranges=date_ranges, split_days=split_days,
+        )
+        tasks = [(download, cache, date_range) for date_range in date_ranges]
+        frames = self._run_downloads(
+            tasks=tasks, end_cache_date=end_cache_date,
+        )
 
+        return frames
+
+    def _split_date_ranges(
+        self, date_ranges: List[List[date]], split_days: bool,
+    ) -> List[List[date]]:
+        if split_days and self._get_download_workers() > 1:
+            date_ranges = [[date_] for dates in date_ranges for date_ in dates]
         return date_ranges
+
+    def _run_downloads(
+        self,
+        tasks: List[Tuple[Callable, Optional[Callable], List[date]]],
+        end_cache_date: date,
+        keep_frames: bool = True,
+    ) -> List[pd.DataFrame]:
+        frames = []
+
+        if len(tasks) == 0:
+            return frames
+
+        max_workers = self._get_download_workers()
+
+        def handle_download(data: pd.DataFrame, cache: Optional[Callable]):
+            if keep_frames:
+                frames.append(data)
+            self._maybe_cache(
+                data=data, cache=cache, end_cache_date=end_cache_date,
+            )
+
+        if max_workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        download,
+                        start_date=date_range[0],
+                        end_date=date_range[-1],
+                    ): cache
+                    for download, cache, date_range in tasks
+                }
+                for future in as_completed(futures):
+                    handle_download(
+                        data=future.result(), cache=futures[future],
+                    )
+        else:
+            for download, cache, date_range in tasks:
+                range_data = download(
+                    start_date=date_range[0], end_date=date_range[-1],
+                )
+                handle_download(data=range_data, cache=cache)
+
+        return frames
+
+    def _get_download_workers(self) -> int:
+        max_workers = min(
+            self._max_workers, self._provider.MAX_CONCURRENT_REQUESTS,
+        )
+        return max_workers
+
+    @staticmethod
+    def _maybe_cache(
+        data: pd.DataFrame, cache: Optional[Callable], end_cache_date: date,
+    ):
+        if cache is not None and len(data) != 0:
+            end_cache_dt = pd.to_datetime(end_cache_date + timedelta(days=1))
+            data = data[data.index < end_cache_dt]
+            cache(data=data)
@@ -16,8 +16,18 @@ class AHistoricalProvider(ABC):
     ----------
     simulation : bool, default True
         Used in cases where an API provides a simulation mode.
+
+    Attributes
+    ----------
+    MAX_CONCURRENT_REQUESTS : int
+        The maximum number of download requests that may be issued to the
+        provider concurrently. Providers that allow more than one concurrent
+        request are sent one request per trading day by the
+        :class:`~algotradepy.historical.loaders.HistoricalRetriever` when it
+        is configured with multiple workers.
     """
 
+    MAX_CONCURRENT_REQUESTS = 1
     BARS_SCHEMA_V = 1
     TRADES_SCHEMA_V = 2
     _MAIN_BAR_COLS = ["open", "high", "low", "close", "volume"]
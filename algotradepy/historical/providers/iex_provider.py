@@ -4,7 +4,7 @@ import pandas as pd
 
 from algotradepy.connectors.iex_connector import IEXConnector
 from algotradepy.contracts import AContract
-from algotradepy.historical.hist_utils import is_daily
+from algotradepy.historical.hist_utils import is_daily, concat_data
 from algotradepy.historical.providers.base import AHistoricalProvider
 from algotradepy.time_utils import generate_trading_days
 
@@ -17,6 +17,8 @@ class IEXHistoricalProvider(AHistoricalProvider):
     `Data provided by IEX Cloud<https://iexcloud.io>`_
     """
 
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(
         self, api_token: str, simulation: bool = True,
     ):
@@ -33,13 +35,14 @@ class IEXHistoricalProvider(AHistoricalProvider):
         **kwargs,
     ):
         # TODO: test rth
-        data = pd.DataFrame()
+        frames = []
         dates = generate_trading_days(start_date=start_date, end_date=end_date)
         for date_ in dates:
             day_data = self._conn.download_stock_data(
                 symbol=contract.symbol, request_date=date_, bar_size=bar_size,
             )
-            data = data.append(other=day_data, ignore_index=True)
+            frames.append(day_data)
+        data = concat_data(frames=frames).reset_index(drop=True)
 
         if len(data) != 0:
             if is_daily(bar_size):
@@ -7,6 +7,7 @@ import pandas as pd
 
 from algotradepy.connectors.polygon_connector import PolygonRESTConnector
 from algotradepy.contracts import AContract, Exchange
+from algotradepy.historical.hist_utils import concat_data
 from algotradepy.historical.providers.base import AHistoricalProvider
 from algotradepy.time_utils import (
     generate_trading_days,
@@ -15,6 +16,8 @@ from algotradepy.time_utils import (
 
 
 class PolygonHistoricalProvider(AHistoricalProvider):
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(
         self, api_token: str, simulation: bool = True,
     ):
@@ -42,14 +45,15 @@ class PolygonHistoricalProvider(AHistoricalProvider):
         rth: bool,
         **kwargs,
     ) -> pd.DataFrame:
-        data = pd.DataFrame()
+        frames = []
         dates = generate_trading_days(start_date=start_date, end_date=end_date)
 
         for date_ in dates:
             day_data = self._conn.download_trades_data(
                 symbol=contract.symbol, request_date=date_, rth=rth
             )
-            data = data.append(other=day_data, ignore_index=True)
+            frames.append(day_data)
+        data = concat_data(frames=frames).reset_index(drop=True)
 
         data = self._format_trades_data(data=data)
 
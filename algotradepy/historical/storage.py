@@ -0,0 +1,204 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algotradepy.historical.hist_utils import DATE_FORMAT, DATETIME_FORMAT
+
+
+class AHistStorage(ABC):
+    """The abstract historical data storage format.
+
+    Defines how a single cache file is written to and read from disk by the
+    :class:`~algotradepy.historical.loaders.HistCacheHandler`. Each file
+    holds a data frame indexed by a `datetime` index.
+    """
+
+    EXTENSION = None
+
+    def file_name(self, stem: str) -> str:
+        """Get the file name for a given file stem (e.g. "2020-04-06")."""
+        f_name = f"{stem}.{self.EXTENSION}"
+        return f_name
+
+    @abstractmethod
+    def read(self, file_path: Path) -> pd.DataFrame:
+        """Read a cache file.
+
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            The path to the file.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The data frame, indexed by a `datetime` index.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, data: pd.DataFrame, file_path: Path, daily: bool):
+        """Write a data frame to a cache file.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The data frame to write, indexed by a `datetime` index.
+        file_path : pathlib.Path
+            The path to the file.
+        daily : bool
+            Whether the data is daily bars data.
+        """
+        raise NotImplementedError
+
+
+class CSVHistStorage(AHistStorage):
+    """The legacy CSV storage format.
+
+    Each file is parsed as text on every read, which makes it the slowest
+    format. It is kept as the default for compatibility with existing caches.
+    """
+
+    EXTENSION = "csv"
+
+    def read(self, file_path: Path) -> pd.DataFrame:
+        data = pd.read_csv(file_path, index_col="datetime", parse_dates=True)
+        return data
+
+    def write(self, data: pd.DataFrame, file_path: Path, daily: bool):
+        if daily:
+            date_format = DATE_FORMAT
+        else:
+            date_format = DATETIME_FORMAT
+        data.to_csv(file_path, date_format=date_format)
+
+
+class _AArrowHistStorage(AHistStorage, ABC):
+    """Shared base for the pyarrow-backed columnar storage formats.
+
+    Columns are stored with their native types and the `datetime` index is
+    stored as an int64 column of nanoseconds since the epoch, so that reading
+    a file requires no text parsing. The time zone of the index, if any, is
+    kept in the schema metadata.
+    """
+
+    _TZ_METADATA_KEY = b"algotradepy.tz"
+
+    def __init__(self):
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                f"Original Error: {e}"
+                f"\n{type(self).__name__} requires pyarrow. Please"
+                " reinstall using 'pip install algotradepy[parquet]'."
+            )
+
+        self._pa = pyarrow
+
+    def read(self, file_path: Path) -> pd.DataFrame:
+        table = self._read_table(file_path=file_path)
+        columns = {
+            name: table.column(name).to_numpy()
+            for name in table.column_names
+            if name != "datetime"
+        }
+        ts = table.column("datetime").to_numpy()
+        index = pd.DatetimeIndex(ts.view("datetime64[ns]"), name="datetime")
+        metadata = table.schema.metadata or {}
+        tz = metadata.get(self._TZ_METADATA_KEY)
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz.decode())
+        data = pd.DataFrame(data=columns, index=index)
+        return data
+
+    def write(self, data: pd.DataFrame, file_path: Path, daily: bool):
+        index = pd.DatetimeIndex(data.index)
+        ts = index.asi8.astype(np.int64)  # UTC if the index is tz-aware
+        columns = {"datetime": self._pa.array(ts, type=self._pa.int64())}
+        for col in data.columns:
+            columns[str(col)] = self._pa.array(data[col], from_pandas=True)
+        metadata = None
+        if index.tz is not None:
+            metadata = {self._TZ_METADATA_KEY: str(index.tz).encode()}
+        table = self._pa.table(columns, metadata=metadata)
+        self._write_table(table=table, file_path=file_path)
+
+    @abstractmethod
+    def _read_table(self, file_path: Path):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write_table(self, table, file_path: Path):
+        raise NotImplementedError
+
+
+class ParquetHistStorage(_AArrowHistStorage):
+    """The columnar Parquet storage format.
+
+    Parameters
+    ----------
+    compression : str, default "snappy"
+        The Parquet compression codec.
+
+    Notes
+    -----
+    Requires the optional `pyarrow` package.
+    """
+
+    EXTENSION = "parquet"
+
+    def __init__(self, compression: str = "snappy"):
+        super().__init__()
+        import pyarrow.parquet
+
+        self._pq = pyarrow.parquet
+        self._compression = compression
+
+    def __reduce__(self):
+        # the pyarrow modules are not picklable
+        return type(self), (self._compression,)
+
+    def _read_table(self, file_path: Path):
+        table = self._pq.ParquetFile(file_path).read(use_threads=False)
+        return table
+
+    def _write_table(self, table, file_path: Path):
+        self._pq.write_table(
+            table, file_path, compression=self._compression,
+        )
+
+
+class ArrowHistStorage(_AArrowHistStorage):
+    """The columnar Arrow IPC (Feather V2) storage format.
+
+    Files are written uncompressed and memory-mapped on read, making this the
+    fastest format to load at the cost of larger files.
+
+    Notes
+    -----
+    Requires the optional `pyarrow` package.
+    """
+
+    EXTENSION = "arrow"
+
+    def __init__(self):
+        super().__init__()
+        import pyarrow.feather
+
+        self._feather = pyarrow.feather
+
+    def __reduce__(self):
+        # the pyarrow modules are not picklable
+        return type(self), ()
+
+    def _read_table(self, file_path: Path):
+        table = self._feather.read_table(str(file_path), memory_map=True)
+        return table
+
+    def _write_table(self, table, file_path: Path):
+        self._feather.write_feather(
+            table, str(file_path), compression="uncompressed",
+        )
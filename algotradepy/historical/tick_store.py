@@ -0,0 +1,268 @@
+import bisect
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, List
+
+import numpy as np
+import pandas as pd
+
+from algotradepy.contracts import Exchange
+from algotradepy.historical.hist_utils import DATE_FORMAT
+
+TICKS_EXTENSION = "ticks"
+
+TRADES_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("price", "<f8"),
+        ("size", "<f8"),
+        ("exchange", "<i2"),
+    ]
+)
+QUOTES_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("ask", "<f8"),
+        ("bid", "<f8"),
+        ("ask volume", "<f8"),
+        ("bid volume", "<f8"),
+    ]
+)
+
+# The exchange codes are the positions in the Exchange enum, -1 if unknown.
+_EXCHANGES = [exchange.value for exchange in Exchange]
+_EXCHANGE_CODES = {value: code for code, value in enumerate(_EXCHANGES)}
+_UNKNOWN_EXCHANGE = -1
+
+
+def frame_to_records(data: pd.DataFrame, dtype: np.dtype) -> np.ndarray:
+    """Convert a tick data frame to a fixed-size records array.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The tick data, indexed by a `datetime` index.
+    dtype : numpy.dtype
+        The records type (e.g. `TRADES_DTYPE` or `QUOTES_DTYPE`).
+
+    Returns
+    -------
+    numpy.ndarray
+        The records, sorted by time stamp.
+    """
+    records = np.empty(len(data), dtype=dtype)
+    records["timestamp"] = pd.DatetimeIndex(data.index).asi8
+
+    for name in dtype.names[1:]:
+        if name == "exchange":
+            records[name] = [
+                _EXCHANGE_CODES.get(value, _UNKNOWN_EXCHANGE)
+                for value in data[name].tolist()
+            ]
+        else:
+            records[name] = data[name].to_numpy()
+
+    if len(records) > 1 and np.any(np.diff(records["timestamp"]) < 0):
+        records = records[np.argsort(records["timestamp"], kind="stable")]
+
+    return records
+
+
+def records_to_frame(records: np.ndarray) -> pd.DataFrame:
+    """Convert a records array back to a tick data frame.
+
+    The inverse of :func:`frame_to_records`.
+    """
+    index = pd.DatetimeIndex(
+        records["timestamp"].view("datetime64[ns]"), name="datetime",
+    )
+    columns = {}
+
+    for name in records.dtype.names[1:]:
+        if name == "exchange":
+            exchanges = np.array(_EXCHANGES + [np.nan], dtype=object)
+            columns[name] = exchanges[records[name]]
+        else:
+            columns[name] = records[name]
+
+    if records.dtype == TRADES_DTYPE:
+        columns["timestamp"] = records["timestamp"] / 1e9
+        columns = {
+            name: columns[name]
+            for name in ["timestamp", "exchange", "size", "price"]
+        }
+
+    data = pd.DataFrame(data=columns, index=index)
+
+    return data
+
+
+def slice_records(
+    records: np.ndarray,
+    start: datetime,
+    end: datetime,
+    include_start: bool = True,
+) -> np.ndarray:
+    """Get a view on the records between two points in time.
+
+    Parameters
+    ----------
+    records : numpy.ndarray
+        The records, sorted by time stamp.
+    start : datetime.datetime
+    end : datetime.datetime
+        The end of the range, inclusive.
+    include_start : bool, default True
+        Whether records time-stamped at `start` are included.
+    """
+    # bisect only touches the O(log n) records it compares against, whereas
+    # numpy.searchsorted would first copy the strided time stamps column
+    timestamps = records["timestamp"]
+    start_ns = pd.Timestamp(start).value
+    if include_start:
+        start_idx = bisect.bisect_left(timestamps, start_ns)
+    else:
+        start_idx = bisect.bisect_right(timestamps, start_ns)
+    end_idx = bisect.bisect_right(timestamps, pd.Timestamp(end).value)
+    view = records[start_idx:end_idx]
+
+    return view
+
+
+class TickStore:
+    """A memory-mapped store of tick data.
+
+    Each trading day is stored as a file of fixed-size binary records
+    (`YYYY-MM-DD.ticks`) that is opened with :class:`numpy.memmap`. Opening a
+    day is therefore instantaneous regardless of its size, and only the pages
+    actually accessed are loaded in memory.
+
+    Parameters
+    ----------
+    folder_path : pathlib.Path
+        The folder holding the tick files.
+    dtype : numpy.dtype
+        The records type (`TRADES_DTYPE` or `QUOTES_DTYPE`).
+    """
+
+    def __init__(self, folder_path: Path, dtype: np.dtype):
+        self._folder_path = Path(folder_path)
+        self._dtype = dtype
+
+    @property
+    def folder_path(self) -> Path:
+        return self._folder_path
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    def file_path(self, date_: date) -> Path:
+        file_path = (
+            self._folder_path
+            / f"{date_.strftime(DATE_FORMAT)}.{TICKS_EXTENSION}"
+        )
+        return file_path
+
+    def has_day(self, date_: date) -> bool:
+        has = os.path.exists(self.file_path(date_=date_))
+        return has
+
+    def write(self, data: pd.DataFrame):
+        """Write tick data to the store, one file per day.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The tick data, indexed by a `datetime` index.
+        """
+        if len(data) == 0:
+            return
+
+        os.makedirs(self._folder_path, exist_ok=True)
+        data_by_date = data.groupby(pd.Grouper(freq="D"))
+
+        for date_, group in data_by_date:
+            if len(group) != 0:
+                records = frame_to_records(data=group, dtype=self._dtype)
+                file_path = self.file_path(date_=date_.date())
+                tmp_path = file_path.with_suffix(".tmp")
+                records.tofile(tmp_path)
+                os.replace(tmp_path, file_path)
+
+    def open_day(self, date_: date) -> Optional[np.ndarray]:
+        """Memory-map the records of a day.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The read-only records, or `None` if the day is not stored.
+        """
+        file_path = self.file_path(date_=date_)
+
+        if not os.path.exists(file_path):
+            records = None
+        elif os.path.getsize(file_path) == 0:
+            records = np.empty(0, dtype=self._dtype)
+        else:
+            records = np.memmap(file_path, dtype=self._dtype, mode="r")
+
+        return records
+
+    def get_range(
+        self, start: datetime, end: datetime, include_start: bool = True,
+    ) -> np.ndarray:
+        """Get the records between two points in time.
+
+        If the range spans a single day, the records are a zero-copy view on
+        the memory-mapped file.
+
+        Parameters
+        ----------
+        start : datetime.datetime
+        end : datetime.datetime
+            The end of the range, inclusive.
+        include_start : bool, default True
+            Whether ticks time-stamped at `start` are included.
+
+        Returns
+        -------
+        numpy.ndarray
+            The records.
+        """
+        dates = pd.date_range(start=start.date(), end=end.date(), freq="D")
+        views = []
+
+        for date_ in dates:
+            records = self.open_day(date_=date_.date())
+            if records is not None:
+                views.append(
+                    slice_records(
+                        records=records,
+                        start=start,
+                        end=end,
+                        include_start=include_start,
+                    )
+                )
+
+        if len(views) == 0:
+            records = np.empty(0, dtype=self._dtype)
+        elif len(views) == 1:
+            records = views[0]
+        else:
+            records = np.concatenate(views)
+
+        return records
+
+    def get_dates(self) -> List[date]:
+        """Get the stored dates."""
+        dates = []
+
+        if self._folder_path.exists():
+            for file_name in os.listdir(self._folder_path):
+                stem, _, extension = file_name.partition(".")
+                if extension == TICKS_EXTENSION:
+                    dates.append(datetime.strptime(stem, DATE_FORMAT).date())
+
+        return sorted(dates)
@@ -1,16 +1,24 @@
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
 from algotradepy.contracts import AContract
 from algotradepy.historical.loaders import HistCacheHandler
 from algotradepy.historical.hist_utils import HIST_DATA_DIR
+from algotradepy.historical.storage import AHistStorage
 
 
 class HistoricalAggregator:
-    def __init__(self, hist_data_dir: Path = HIST_DATA_DIR):
-        self._cache_handler = HistCacheHandler(hist_data_dir=hist_data_dir)
+    def __init__(
+        self,
+        hist_data_dir: Path = HIST_DATA_DIR,
+        storage: Optional[AHistStorage] = None,
+    ):
+        self._cache_handler = HistCacheHandler(
+            hist_data_dir=hist_data_dir, storage=storage,
+        )
 
     def aggregate_data(
         self,
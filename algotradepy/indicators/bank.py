@@ -0,0 +1,331 @@
+from abc import ABC, abstractmethod
+from typing import Sequence, Hashable, Dict, Union, Optional
+
+import numpy as np
+
+
+class AnIndicatorBank(ABC):
+    """The base class of the vectorized indicators.
+
+    A vectorized indicator keeps the state of an indicator for several
+    instruments in arrays, with one row per instrument, and updates the
+    instruments together.
+
+    Parameters
+    ----------
+    n_instruments : int
+        The number of instruments.
+    """
+
+    def __init__(self, n_instruments: int):
+        self._n_instruments = n_instruments
+
+    @property
+    def n_instruments(self) -> int:
+        return self._n_instruments
+
+    def update(self, values: np.ndarray, mask: Optional[np.ndarray] = None):
+        """Update the instruments.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The new value of each instrument.
+        mask : numpy.ndarray, optional, default None
+            A boolean array of the instruments to update. Defaults to the
+            instruments with a value other than NaN.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if mask is None:
+            mask = ~np.isnan(values)
+        rows = np.flatnonzero(mask)
+        self.update_rows(rows=rows, values=values[rows])
+
+    @abstractmethod
+    def update_rows(self, rows: np.ndarray, values: np.ndarray):
+        """Update the instruments at the given rows.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The rows of the updated instruments, without duplicates.
+        values : numpy.ndarray
+            The new values of the updated instruments.
+        """
+        raise NotImplementedError
+
+
+class SMABank(AnIndicatorBank):
+    """The vectorized :class:`~algotradepy.indicators.ma.SMA`.
+
+    The windows of the instruments are kept in a ring buffer of shape
+    `(n_instruments, n_periods)`.
+    """
+
+    def __init__(self, n_instruments: int, n_periods: int):
+        super().__init__(n_instruments=n_instruments)
+        self._values = np.full((n_instruments, n_periods), np.nan)
+        self._bar_counts = np.zeros(n_instruments, dtype=np.int64)
+        self._sums = np.zeros(n_instruments)
+
+    @property
+    def ready(self) -> np.ndarray:
+        return self._bar_counts >= self._values.shape[1]
+
+    @property
+    def value(self) -> np.ndarray:
+        n_periods = self._values.shape[1]
+        value = np.where(self.ready, self._sums / n_periods, np.nan)
+        return value
+
+    def update_rows(self, rows: np.ndarray, values: np.ndarray):
+        n_periods = self._values.shape[1]
+        counts = self._bar_counts[rows]
+        idx = counts % n_periods
+        full = counts >= n_periods
+
+        sums = self._sums[rows]
+        sums[full] -= self._values[rows[full], idx[full]]
+        self._values[rows, idx] = values
+        sums += values
+        self._bar_counts[rows] = counts + 1
+
+        wrapped = idx == n_periods - 1
+        sums[wrapped] = self._values[rows[wrapped]].sum(axis=1)
+        self._sums[rows] = sums
+
+
+class EMABank(AnIndicatorBank):
+    """The vectorized :class:`~algotradepy.indicators.ma.EMA`."""
+
+    def __init__(self, n_instruments: int, n_periods: int):
+        super().__init__(n_instruments=n_instruments)
+        self._n_periods = n_periods
+        self._factor = 2 / (n_periods + 1)
+        self._bar_counts = np.zeros(n_instruments, dtype=np.int64)
+        self._states = np.zeros(n_instruments)
+
+    @property
+    def ready(self) -> np.ndarray:
+        return self._bar_counts >= self._n_periods
+
+    @property
+    def value(self) -> np.ndarray:
+        value = np.where(self.ready, self._states, np.nan)
+        return value
+
+    def update_rows(self, rows: np.ndarray, values: np.ndarray):
+        counts = self._bar_counts[rows]
+        states = self._states[rows]
+
+        ready = counts >= self._n_periods
+        states[ready] = (
+            values[ready] - states[ready]
+        ) * self._factor + states[ready]
+        seeding = counts == self._n_periods - 1
+        states[seeding] = (states[seeding] + values[seeding]) / self._n_periods
+        warming_up = ~(ready | seeding)
+        states[warming_up] += values[warming_up]
+
+        self._states[rows] = states
+        self._bar_counts[rows] = counts + 1
+
+
+class RSIBank(AnIndicatorBank):
+    """The vectorized :class:`~algotradepy.indicators.rsi.RSI`."""
+
+    def __init__(self, n_instruments: int, n_periods: int):
+        super().__init__(n_instruments=n_instruments)
+        self._gain_sma = SMABank(
+            n_instruments=n_instruments, n_periods=n_periods,
+        )
+        self._loss_sma = SMABank(
+            n_instruments=n_instruments, n_periods=n_periods,
+        )
+        self._prev_vals = np.full(n_instruments, np.nan)
+
+    @property
+    def ready(self) -> np.ndarray:
+        return self._gain_sma.ready
+
+    @property
+    def value(self) -> np.ndarray:
+        gains = self._gain_sma.value
+        losses = self._loss_sma.value
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = np.where(
+                losses == 0, 100, 100 - (100 / (1 + gains / losses)),
+            )
+        return value
+
+    def update_rows(self, rows: np.ndarray, values: np.ndarray):
+        prev_vals = self._prev_vals[rows]
+        has_prev = ~np.isnan(prev_vals)
+        diffs = values[has_prev] - prev_vals[has_prev]
+        self._gain_sma.update_rows(
+            rows=rows[has_prev], values=np.maximum(diffs, 0),
+        )
+        self._loss_sma.update_rows(
+            rows=rows[has_prev], values=np.maximum(-diffs, 0),
+        )
+        self._prev_vals[rows] = values
+
+
+class MACDBank(AnIndicatorBank):
+    """The vectorized :class:`~algotradepy.indicators.macd.MACD`."""
+
+    def __init__(
+        self,
+        n_instruments: int,
+        short_ema_n_periods: int,
+        long_ema_n_periods: int,
+        signal_ema_n_periods: int,
+    ):
+        super().__init__(n_instruments=n_instruments)
+        self._short_ema = EMABank(
+            n_instruments=n_instruments, n_periods=short_ema_n_periods,
+        )
+        self._long_ema = EMABank(
+            n_instruments=n_instruments, n_periods=long_ema_n_periods,
+        )
+        self._signal_ema = EMABank(
+            n_instruments=n_instruments, n_periods=signal_ema_n_periods,
+        )
+
+    @property
+    def macd_line(self) -> np.ndarray:
+        value = self._short_ema.value - self._long_ema.value
+        return value
+
+    @property
+    def signal_line(self) -> np.ndarray:
+        value = self._signal_ema.value
+        return value
+
+    @property
+    def macd_hist(self) -> np.ndarray:
+        value = self.macd_line - self.signal_line
+        return value
+
+    def update_rows(self, rows: np.ndarray, values: np.ndarray):
+        self._short_ema.update_rows(rows=rows, values=values)
+        self._long_ema.update_rows(rows=rows, values=values)
+
+        macd_vals = self.macd_line[rows]
+        ready = ~np.isnan(macd_vals)
+        self._signal_ema.update_rows(rows=rows[ready], values=macd_vals[ready])
+
+
+class IndicatorBank:
+    """A set of vectorized indicators tracked for many instruments.
+
+    The state of each indicator is kept in arrays holding all the
+    instruments, so that a new bar timestamp updates all the instruments
+    with one vectorized call per indicator, instead of one call per
+    instrument and indicator object.
+
+    Parameters
+    ----------
+    keys : Sequence of Hashable
+        The instrument keys (e.g. symbols or contracts), in the order of the
+        rows of the indicator values.
+
+    Examples
+    --------
+    >>> bank = IndicatorBank(keys=["SPY", "QQQ"])
+    >>> bank.add_rsi(name="rsi", n_periods=14)
+    >>> bank.update(values={"SPY": 330.1, "QQQ": 270.4})
+    >>> bank["rsi"].value  # the RSI of SPY and QQQ
+    """
+
+    def __init__(self, keys: Sequence[Hashable]):
+        self._keys = list(keys)
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._indicators: Dict[str, AnIndicatorBank] = {}
+
+    def __getitem__(self, name: str) -> AnIndicatorBank:
+        return self._indicators[name]
+
+    @property
+    def keys(self) -> Sequence[Hashable]:
+        return self._keys
+
+    def get_row(self, key: Hashable) -> int:
+        return self._rows[key]
+
+    def add_indicator(self, name: str, indicator: AnIndicatorBank):
+        if indicator.n_instruments != len(self._keys):
+            raise ValueError(
+                f"The indicator tracks {indicator.n_instruments} instruments"
+                f" for a bank of {len(self._keys)} instruments."
+            )
+        self._indicators[name] = indicator
+
+    def add_sma(self, name: str, n_periods: int):
+        self.add_indicator(
+            name=name,
+            indicator=SMABank(
+                n_instruments=len(self._keys), n_periods=n_periods,
+            ),
+        )
+
+    def add_ema(self, name: str, n_periods: int):
+        self.add_indicator(
+            name=name,
+            indicator=EMABank(
+                n_instruments=len(self._keys), n_periods=n_periods,
+            ),
+        )
+
+    def add_rsi(self, name: str, n_periods: int):
+        self.add_indicator(
+            name=name,
+            indicator=RSIBank(
+                n_instruments=len(self._keys), n_periods=n_periods,
+            ),
+        )
+
+    def add_macd(
+        self,
+        name: str,
+        short_ema_n_periods: int,
+        long_ema_n_periods: int,
+        signal_ema_n_periods: int,
+    ):
+        self.add_indicator(
+            name=name,
+            indicator=MACDBank(
+                n_instruments=len(self._keys),
+                short_ema_n_periods=short_ema_n_periods,
+                long_ema_n_periods=long_ema_n_periods,
+                signal_ema_n_periods=signal_ema_n_periods,
+            ),
+        )
+
+    def update(self, values: Union[np.ndarray, Dict[Hashable, float]]):
+        """Update all the indicators with the values of a bar timestamp.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or dict
+            The values of the instruments, either as an array in the order
+            of `keys`, where NaN values mark the instruments not updated, or
+            as a dictionary mapping the keys of the updated instruments to
+            their values.
+        """
+        if isinstance(values, dict):
+            rows = np.fromiter(
+                (self._rows[key] for key in values),
+                dtype=np.int64,
+                count=len(values),
+            )
+            row_values = np.fromiter(
+                values.values(), dtype=np.float64, count=len(values),
+            )
+        else:
+            values = np.asarray(values, dtype=np.float64)
+            rows = np.flatnonzero(~np.isnan(values))
+            row_values = values[rows]
+
+        for indicator in self._indicators.values():
+            indicator.update_rows(rows=rows, values=row_values)
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Union
 
 import numpy as np
+import pandas as pd
 
 
 class AMA(ABC):
@@ -15,20 +17,82 @@ class AMA(ABC):
 
 
 class SMA(AMA):
+    """Simple moving average.
+
+    The average is kept as a running sum of the window, which is recomputed
+    from the window each time it wraps around to bound the floating point
+    drift.
+    """
+
     def __init__(self, n_periods: int):
         self._values = np.array([np.nan] * n_periods)
         self._bar_count = 0
+        self._sum = 0.0
 
     @property
     def value(self) -> np.float64:
-        val = self._values.mean()
+        n_periods = len(self._values)
+        val = np.float64(np.nan)
+        if self._bar_count >= n_periods:
+            val = np.float64(self._sum / n_periods)
         return val
 
     def update(self, value: float):
-        idx = self._bar_count % len(self._values)
+        n_periods = len(self._values)
+        idx = self._bar_count % n_periods
+        if self._bar_count >= n_periods:
+            self._sum -= self._values[idx]
         self._values[idx] = value
+        self._sum += value
         self._bar_count += 1
 
+        if idx == n_periods - 1:
+            self._sum = self._values.sum()
+
+    def update_many(self, values: np.ndarray):
+        """Update the average with a batch of values, in order."""
+        values = np.asarray(values, dtype=np.float64)
+        n_periods = len(self._values)
+        n_new = min(len(values), n_periods)
+
+        if n_new != 0:
+            new_count = self._bar_count + len(values)
+            positions = np.arange(new_count - n_new, new_count) % n_periods
+            self._values[positions] = values[len(values) - n_new :]
+            self._bar_count = new_count
+            if new_count >= n_periods:
+                self._sum = self._values.sum()
+            else:
+                self._sum = self._values[:new_count].sum()
+
+    @classmethod
+    def compute(
+        cls, values: Union[np.ndarray, pd.Series], n_periods: int,
+    ) -> np.ndarray:
+        """Compute the average over a whole series.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or pandas.Series
+        n_periods : int
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of the average after each of `values` is fed to it,
+            NaN while the average is not ready.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        series = np.full(len(values), np.nan)
+
+        if len(values) >= n_periods:
+            windows = np.lib.stride_tricks.sliding_window_view(
+                values, n_periods,
+            )
+            series[n_periods - 1 :] = windows.mean(axis=1)
+
+        return series
+
 
 class EMA:
     def __init__(self, n_periods: int):
@@ -57,3 +121,58 @@ class EMA:
             self._state += value
 
         self._bar_count += 1
+
+    def update_many(self, values: np.ndarray):
+        """Update the average with a batch of values, in order."""
+        self._update_series(values=values)
+
+    @classmethod
+    def compute(
+        cls, values: Union[np.ndarray, pd.Series], n_periods: int,
+    ) -> np.ndarray:
+        """Compute the average over a whole series.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or pandas.Series
+        n_periods : int
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of the average after each of `values` is fed to it,
+            NaN while the average is not ready.
+        """
+        ema = cls(n_periods=n_periods)
+        series = ema._update_series(values=values)
+        return series
+
+    def _update_series(self, values: np.ndarray) -> np.ndarray:
+        # returns the value of the average after each update
+        values = np.asarray(values, dtype=np.float64)
+        series = np.full(len(values), np.nan)
+        n_warm_up = min(
+            max(self._n_periods - self._bar_count, 0), len(values),
+        )
+
+        if n_warm_up != 0:
+            # the average is seeded with the mean of the first values
+            self._state += values[:n_warm_up].sum()
+            self._bar_count += n_warm_up
+            if self.ready:
+                self._state /= self._n_periods
+                series[n_warm_up - 1] = self._state
+
+        if n_warm_up != len(values):
+            seeded = np.concatenate([[self._state], values[n_warm_up:]])
+            ema = (
+                pd.Series(seeded)
+                .ewm(alpha=self._factor, adjust=False)
+                .mean()
+                .to_numpy()
+            )
+            series[n_warm_up:] = ema[1:]
+            self._state = ema[-1]
+            self._bar_count += len(values) - n_warm_up
+
+        return series
@@ -1,4 +1,7 @@
+from typing import Union
+
 import numpy as np
+import pandas as pd
 
 from algotradepy.indicators.ma import EMA
 
@@ -43,3 +46,55 @@ class MACD:
         macd_val = self.macd_line
         if not np.isnan(macd_val):
             self._signal_ema.update(value=macd_val)
+
+    def update_many(self, values: np.ndarray):
+        """Update the indicator with a batch of values, in order."""
+        short_ema = self._short_ema._update_series(values=values)
+        long_ema = self._long_ema._update_series(values=values)
+        macd_line = short_ema - long_ema
+        self._signal_ema.update_many(
+            values=macd_line[~np.isnan(macd_line)],
+        )
+
+    @classmethod
+    def compute(
+        cls,
+        values: Union[np.ndarray, pd.Series],
+        short_ema_n_periods: int,
+        long_ema_n_periods: int,
+        signal_ema_n_periods: int,
+    ) -> pd.DataFrame:
+        """Compute the indicator over a whole series.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or pandas.Series
+        short_ema_n_periods : int
+        long_ema_n_periods : int
+        signal_ema_n_periods : int
+
+        Returns
+        -------
+        pandas.DataFrame
+            The `macd_line`, `signal_line` and `macd_hist` values after each
+            of `values` is fed to the indicator, NaN while they are not
+            ready. The frame has the index of `values` if it is a series.
+        """
+        index = values.index if isinstance(values, pd.Series) else None
+        macd_line = EMA.compute(
+            values=values, n_periods=short_ema_n_periods,
+        ) - EMA.compute(values=values, n_periods=long_ema_n_periods)
+        signal_line = np.full(len(macd_line), np.nan)
+        ready = ~np.isnan(macd_line)
+        signal_line[ready] = EMA.compute(
+            values=macd_line[ready], n_periods=signal_ema_n_periods,
+        )
+        data = pd.DataFrame(
+            data={
+                "macd_line": macd_line,
+                "signal_line": signal_line,
+                "macd_hist": macd_line - signal_line,
+            },
+            index=index,
+        )
+        return data
@@ -1,4 +1,7 @@
+from typing import Union
+
 import numpy as np
+import pandas as pd
 
 from algotradepy.indicators.ma import SMA
 
@@ -32,3 +35,50 @@ class RSI:
             self._loss_sma.update(value=loss_val)
 
         self._prev_val = value
+
+    def update_many(self, values: np.ndarray):
+        """Update the indicator with a batch of values, in order."""
+        values = np.asarray(values, dtype=np.float64)
+
+        if len(values) != 0:
+            if self._prev_val is not None:
+                values = np.concatenate([[self._prev_val], values])
+            diffs = np.diff(values)
+            self._gain_sma.update_many(values=np.maximum(diffs, 0))
+            self._loss_sma.update_many(values=np.maximum(-diffs, 0))
+            self._prev_val = values[-1]
+
+    @classmethod
+    def compute(
+        cls, values: Union[np.ndarray, pd.Series], n_periods: int,
+    ) -> np.ndarray:
+        """Compute the indicator over a whole series.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or pandas.Series
+        n_periods : int
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of the indicator after each of `values` is fed to it,
+            NaN while the indicator is not ready.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        series = np.full(len(values), np.nan)
+
+        if len(values) > 1:
+            diffs = np.diff(values)
+            gains = SMA.compute(
+                values=np.maximum(diffs, 0), n_periods=n_periods,
+            )
+            losses = SMA.compute(
+                values=np.maximum(-diffs, 0), n_periods=n_periods,
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                series[1:] = np.where(
+                    losses == 0, 100, 100 - (100 / (1 + gains / losses)),
+                )
+
+        return series
@@ -1,10 +1,15 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Sequence, Dict, Union, Tuple
+
+import numpy as np
 
 from algotradepy.contracts import Exchange, AContract
 from algotradepy.utils import ReprAble, Comparable
 
 
 class Tick(ReprAble, Comparable):
+    __slots__ = ("_timestamp", "_symbol", "_price", "_size", "_exchange")
+
     def __init__(
         self,
         timestamp: float,
@@ -39,8 +44,20 @@ class Tick(ReprAble, Comparable):
     def exchange(self) -> Exchange:
         return self._exchange
 
+    def _make_key(self) -> Tuple:
+        key = (
+            self._timestamp,
+            self._symbol,
+            self._price,
+            self._size,
+            self._exchange,
+        )
+        return key
+
 
 class Position(ReprAble, Comparable):
+    __slots__ = ("_account", "_contract", "_position", "_ave_fill_price")
+
     def __init__(
         self,
         account: str,
@@ -70,8 +87,19 @@ class Position(ReprAble, Comparable):
     def ave_fill_price(self) -> float:
         return self._ave_fill_price
 
+    def _make_key(self) -> Tuple:
+        key = (
+            self._account,
+            self._contract,
+            self._position,
+            self._ave_fill_price,
+        )
+        return key
+
 
 class Greeks(ReprAble, Comparable):
+    __slots__ = ("_delta", "_gamma", "_vega", "_theta")
+
     def __init__(
         self, delta: float, gamma: float, vega: float, theta: float,
     ):
@@ -95,3 +123,162 @@ class Greeks(ReprAble, Comparable):
     @property
     def theta(self):
         return self._theta
+
+    def _make_key(self) -> Tuple:
+        key = (self._delta, self._gamma, self._vega, self._theta)
+        return key
+
+
+BAR_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class Bar:
+    """A light-weight bar record.
+
+    Supports the same item access as the :class:`pandas.Series` bars (e.g.
+    `bar["close"]`) at a fraction of the construction cost.
+
+    Parameters
+    ----------
+    datetime_ : datetime.datetime
+        The start time of the bar.
+    values : Sequence
+        The bar values, in the order of `columns`.
+    columns : Sequence of str or dict, default BAR_COLUMNS
+        The names of the values. A dictionary mapping each name to its
+        position in `values` can be passed instead to share it across bars.
+    """
+
+    __slots__ = ("_datetime", "_values", "_positions")
+
+    def __init__(
+        self,
+        datetime_: datetime,
+        values: Sequence,
+        columns: Union[Sequence[str], Dict[str, int]] = BAR_COLUMNS,
+    ):
+        if not isinstance(columns, dict):
+            columns = {name: pos for pos, name in enumerate(columns)}
+        self._datetime = datetime_
+        self._values = values
+        self._positions = columns
+
+    def __getitem__(self, key: str):
+        return self._values[self._positions[key]]
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        equal = (
+            self._datetime == other._datetime
+            and self.to_dict() == other.to_dict()
+        )
+        return equal
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{name} {value}" for name, value in self.to_dict().items()
+        )
+        return f"Bar(datetime {self._datetime}, {values})"
+
+    @property
+    def name(self) -> datetime:
+        """The start time of the bar, named as the pandas.Series bars."""
+        return self._datetime
+
+    @property
+    def datetime(self) -> datetime:
+        return self._datetime
+
+    @property
+    def open(self) -> float:
+        return self["open"]
+
+    @property
+    def high(self) -> float:
+        return self["high"]
+
+    @property
+    def low(self) -> float:
+        return self["low"]
+
+    @property
+    def close(self) -> float:
+        return self["close"]
+
+    @property
+    def volume(self) -> float:
+        return self["volume"]
+
+    def keys(self):
+        return self._positions.keys()
+
+    def to_dict(self) -> Dict:
+        values = {
+            name: self._values[pos] for name, pos in self._positions.items()
+        }
+        return values
+
+
+class TickBatch:
+    """A batch of ticks of a contract, stored as arrays.
+
+    Delivers all the ticks received for a contract since the previous
+    batch with a single callback, instead of one :class:`Tick` and one
+    callback per event.
+
+    Parameters
+    ----------
+    contract : AContract
+        The contract of the ticks.
+    timestamps : numpy.ndarray
+        The time stamps of the ticks, in seconds since the epoch.
+    prices : numpy.ndarray
+    sizes : numpy.ndarray
+        The sizes of the ticks, NaN where unknown.
+    exchanges : numpy.ndarray
+        The exchange codes of the ticks: the position of the exchange in
+        :class:`~algotradepy.contracts.Exchange`, -1 where unknown.
+    """
+
+    __slots__ = ("_contract", "_timestamps", "_prices", "_sizes", "_exchanges")
+
+    def __init__(
+        self,
+        contract: AContract,
+        timestamps: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        exchanges: np.ndarray,
+    ):
+        self._contract = contract
+        self._timestamps = timestamps
+        self._prices = prices
+        self._sizes = sizes
+        self._exchanges = exchanges
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __repr__(self):
+        return f"TickBatch(contract {self._contract}, size {len(self)})"
+
+    @property
+    def contract(self) -> AContract:
+        return self._contract
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._sizes
+
+    @property
+    def exchanges(self) -> np.ndarray:
+        return self._exchanges
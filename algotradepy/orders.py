@@ -51,6 +51,20 @@ class AnOrder(ABC, ReprAble):
         The parent order's ID.
     """
 
+    __slots__ = (
+        "_order_id",
+        "_action",
+        "_quantity",
+        "_time_in_force",
+        "_conditions",
+        "_parent_id",
+        "_outside_rth",
+        "_transmit",
+        "_oca_group",
+        "_oca_type",
+        "_order_ref",
+    )
+
     def __init__(
         self,
         action: OrderAction,
@@ -129,6 +143,8 @@ class AnOrder(ABC, ReprAble):
 class MarketOrder(AnOrder):
     """A market order definition."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         action: OrderAction,
@@ -154,6 +170,8 @@ class LimitOrder(AnOrder):
     kwargs
     """
 
+    __slots__ = ("_limit_price",)
+
     def __init__(
         self,
         action: OrderAction,
@@ -192,6 +210,8 @@ class TrailingStopOrder(AnOrder):
     kwargs
     """
 
+    __slots__ = ("_trail_stop_price", "_trail_percent", "_aux_price")
+
     def __init__(
         self,
         action: OrderAction,
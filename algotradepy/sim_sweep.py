@@ -0,0 +1,223 @@
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional, List, Tuple, Dict, Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from algotradepy.contracts import AContract
+from algotradepy.historical.loaders import HistoricalRetriever
+from algotradepy.historical.storage import AHistStorage
+from algotradepy.sim_utils import SimulationClock
+from algotradepy.streamers.sim_streamer import SimulationDataStreamer
+from algotradepy.time_utils import get_next_trading_date
+
+# {(contract, bar_size): pandas.DataFrame}, the bars shared with a worker
+_SHARED_BARS: Dict[Tuple[AContract, timedelta], pd.DataFrame] = {}
+# the retriever of the data not shared with a worker
+_WORKER_RETRIEVER: Optional[HistoricalRetriever] = None
+
+
+class SimulationSweep:
+    """Runs a simulation for each of a set of parameter values.
+
+    The simulations are distributed across a pool of processes. The bars
+    data used by the simulations is loaded once and written to
+    memory-mapped files that all the processes read from, so that the
+    workers neither reload nor copy it.
+
+    Parameters
+    ----------
+    sim_func : Callable
+        The function running a single simulation. It is called as
+        `sim_func(sim_clock, sim_streamer, **params)` for each set of
+        parameters and must return a summary of the run. The
+        `sim_streamer` is a
+        :class:`~algotradepy.streamers.sim_streamer.SimulationDataStreamer`
+        holding the shared bars data. The function, the parameters and the
+        summaries must be picklable (e.g. `sim_func` must be defined at the
+        top level of a module).
+    start_date : datetime.date
+    end_date : datetime.date
+    simulation_time_step : datetime.timedelta
+        The simulation clock settings.
+    bars : list of tuple
+        The `(contract, bar_size)` pairs of the bars data used by the
+        simulations.
+    historical_retriever : HistoricalRetriever, optional, default None
+        The historical retriever with which to load the bars data. The
+        simulations read the data not listed in `bars` from its cache
+        folder.
+    max_workers : int, optional, default None
+        The number of processes. Defaults to the number of CPUs. If set to
+        `1`, the simulations are run in the calling process.
+    """
+
+    def __init__(
+        self,
+        sim_func: Callable[..., Any],
+        start_date: date,
+        end_date: date,
+        simulation_time_step: timedelta,
+        bars: List[Tuple[AContract, timedelta]],
+        historical_retriever: Optional[HistoricalRetriever] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if historical_retriever is None:
+            historical_retriever = HistoricalRetriever()
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        self._sim_func = sim_func
+        self._start_date = start_date
+        self._end_date = end_date
+        self._time_step = simulation_time_step
+        self._bars = bars
+        self._hist_retriever = historical_retriever
+        self._max_workers = max_workers
+
+    def run(
+        self, params: Iterable[Dict[str, Any]], cache_only: bool = False,
+    ) -> List[Any]:
+        """Run the simulations.
+
+        Parameters
+        ----------
+        params : Iterable of dict
+            The keyword arguments passed to `sim_func` for each simulation.
+        cache_only : bool, default False
+            Whether to only use the cached historical data.
+
+        Returns
+        -------
+        list
+            The summaries returned by `sim_func`, in the order of `params`.
+        """
+        params = list(params)
+
+        with tempfile.TemporaryDirectory() as shared_dir:
+            shared_files = self._write_shared_bars(
+                shared_dir=Path(shared_dir), cache_only=cache_only,
+            )
+            clock_kwargs = {
+                "start_date": self._start_date,
+                "end_date": self._end_date,
+                "simulation_time_step": self._time_step,
+            }
+            tasks = [
+                (self._sim_func, clock_kwargs, run_params)
+                for run_params in params
+            ]
+
+            if self._max_workers == 1 or len(tasks) <= 1:
+                _init_worker(
+                    shared_files=shared_files,
+                    hist_data_dir=self._hist_retriever.hist_data_dir,
+                    storage=self._hist_retriever.storage,
+                    hist_retriever=self._hist_retriever,
+                )
+                try:
+                    results = [_run_simulation(task) for task in tasks]
+                finally:
+                    _reset_worker()
+            else:
+                n_workers = min(self._max_workers, len(tasks))
+                chunk_size = max(1, len(tasks) // (n_workers * 4))
+                # the retriever itself is not picklable
+                with ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    initializer=_init_worker,
+                    initargs=(
+                        shared_files,
+                        self._hist_retriever.hist_data_dir,
+                        self._hist_retriever.storage,
+                    ),
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            _run_simulation, tasks, chunksize=chunk_size,
+                        )
+                    )
+
+        return results
+
+    def _write_shared_bars(
+        self, shared_dir: Path, cache_only: bool,
+    ) -> List[Tuple[AContract, timedelta, str]]:
+        # the streamer needs the day following the simulation period
+        end_date = get_next_trading_date(base_date=self._end_date)
+        shared_files = []
+
+        for i, (contract, bar_size) in enumerate(self._bars):
+            data = self._hist_retriever.retrieve_bar_data(
+                contract=contract,
+                bar_size=bar_size,
+                start_date=self._start_date,
+                end_date=end_date,
+                cache_only=cache_only,
+            )
+            stem = str(shared_dir / str(i))
+            np.save(f"{stem}.ts.npy", pd.DatetimeIndex(data.index).asi8)
+            np.save(f"{stem}.values.npy", data.to_numpy(dtype=np.float64))
+            with open(f"{stem}.columns.json", "w") as f:
+                json.dump(list(data.columns), f)
+            shared_files.append((contract, bar_size, stem))
+
+        return shared_files
+
+
+def _init_worker(
+    shared_files: List[Tuple[AContract, timedelta, str]],
+    hist_data_dir: Path,
+    storage: AHistStorage,
+    hist_retriever: Optional[HistoricalRetriever] = None,
+):
+    global _WORKER_RETRIEVER
+
+    _SHARED_BARS.clear()
+    if hist_retriever is None:
+        hist_retriever = HistoricalRetriever(
+            hist_data_dir=hist_data_dir, storage=storage,
+        )
+    _WORKER_RETRIEVER = hist_retriever
+
+    for contract, bar_size, stem in shared_files:
+        timestamps = np.load(f"{stem}.ts.npy", mmap_mode="r")
+        values = np.load(f"{stem}.values.npy", mmap_mode="r")
+        with open(f"{stem}.columns.json", "r") as f:
+            columns = json.load(f)
+        index = pd.DatetimeIndex(
+            timestamps.view("datetime64[ns]"), name="datetime",
+        )
+        data = pd.DataFrame(
+            data=values, index=index, columns=columns, copy=False,
+        )
+        _SHARED_BARS[(contract, bar_size)] = data
+
+
+def _reset_worker():
+    global _WORKER_RETRIEVER
+
+    _SHARED_BARS.clear()
+    _WORKER_RETRIEVER = None
+
+
+def _run_simulation(task: Tuple[Callable, Dict, Dict]) -> Any:
+    sim_func, clock_kwargs, params = task
+    sim_clock = SimulationClock(**clock_kwargs)
+    sim_streamer = SimulationDataStreamer(
+        historical_retriever=_WORKER_RETRIEVER,
+    )
+
+    for (contract, bar_size), data in _SHARED_BARS.items():
+        sim_streamer.add_bar_data(
+            contract=contract, bar_size=bar_size, data=data,
+        )
+
+    result = sim_func(sim_clock, sim_streamer, **params)
+
+    return result
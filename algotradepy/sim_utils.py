@@ -1,10 +1,15 @@
+import bisect
 import time as real_time
 from abc import ABC, abstractmethod
 from datetime import date, timedelta, datetime, time
 from typing import Optional, List
 
+import numpy as np
+
 from algotradepy.historical.hist_utils import is_daily
-from algotradepy.time_utils import generate_trading_schedule
+from algotradepy.time_utils import get_trading_calendar
+
+_EPOCH = datetime(1970, 1, 1)
 
 
 class SimulationEndException(Exception):
@@ -12,24 +17,60 @@ class SimulationEndException(Exception):
 
 
 class SimulationClock:
+    """The simulation clock.
+
+    The session boundaries are precomputed as numpy int64 arrays of
+    exchange-local nanoseconds since the epoch, so that advancing and
+    querying the clock involves no pandas operations.
+
+    Parameters
+    ----------
+    start_date : datetime.date
+    end_date : datetime.date
+    simulation_time_step : datetime.timedelta, default timedelta(minutes=1)
+    real_time_per_tick : int, default 0
+        The number of seconds to sleep on each tick.
+    precompute_timeline : bool, default False
+        Whether to precompute every time stamp of the simulation in a single
+        array. Makes ticking a matter of advancing a cursor at the cost of
+        holding one int64 per step in memory.
+    """
+
     def __init__(
         self,
         start_date: date,
         end_date: date,
         simulation_time_step: timedelta = timedelta(minutes=1),
         real_time_per_tick: int = 0,
+        precompute_timeline: bool = False,
     ):
         self._start_date = start_date
         self._end_date = end_date
         self._time_step = simulation_time_step
+        self._step_ns = int(simulation_time_step.total_seconds() * 1e9)
         self._time_per_tick = real_time_per_tick
-        self._schedule = generate_trading_schedule(
+        calendar = get_trading_calendar(
             start_date=start_date, end_date=end_date,
         )
-        self._curr_schedule_index = 0
-        self._clock_dt = datetime.combine(
-            self._schedule.index[0], self._schedule.iloc[0]["market_open"],
+        (
+            self._session_dates,
+            self._session_opens,
+            self._session_closes,
+        ) = calendar.get_schedule_arrays(
+            start_date=start_date, end_date=end_date,
         )
+        # python lists are faster than numpy arrays for scalar access
+        self._opens = self._session_opens.tolist()
+        self._closes = self._session_closes.tolist()
+        self._timeline = None
+        self._timeline_pos = 0
+
+        if precompute_timeline and not is_daily(bar_size=self._time_step):
+            self._build_timeline()
+
+        self._curr_schedule_index = 0
+        self._clock_ns = self._opens[0]
+        self._clock_dt = None
 
     @property
     def start_date(self) -> date:
@@ -43,42 +84,148 @@ class SimulationClock:
     def time_step(self) -> timedelta:
         return self._time_step
 
+    @property
+    def session_dates(self) -> np.ndarray:
+        """The simulated session dates, as `datetime64[D]`."""
+        return self._session_dates
+
+    @property
+    def session_opens(self) -> np.ndarray:
+        """The session open times, as local nanoseconds since the epoch."""
+        return self._session_opens
+
+    @property
+    def session_closes(self) -> np.ndarray:
+        """The session close times, as local nanoseconds since the epoch."""
+        return self._session_closes
+
     @property
     def date(self) -> date:
-        curr_date = self._clock_dt.date()
+        curr_date = self.datetime.date()
         return curr_date
 
     @property
     def time(self) -> time:
-        curr_time = self._clock_dt.time()
+        curr_time = self.datetime.time()
         return curr_time
 
     @property
     def datetime(self) -> datetime:
+        if self._clock_dt is None:
+            self._clock_dt = _EPOCH + timedelta(
+                microseconds=self._clock_ns // 1000,
+            )
         return self._clock_dt
 
+    @property
+    def datetime_ns(self) -> int:
+        """The current time, as local nanoseconds since the epoch."""
+        return self._clock_ns
+
     @property
     def start_of_day(self) -> bool:
-        idx = self._curr_schedule_index
-        open_time = self._schedule.iloc[idx]["market_open"]
-        sod = self._clock_dt.time() == open_time
+        sod = self._clock_ns == self._opens[self._curr_schedule_index]
         return sod
 
     @property
     def end_of_day(self) -> bool:
-        idx = self._curr_schedule_index
-        close_time = self._schedule.iloc[idx]["market_close"]
-        eod = self._clock_dt.time() == close_time
+        eod = self._clock_ns == self._closes[self._curr_schedule_index]
         return eod
 
     def tick(self):
-        real_time.sleep(self._time_per_tick)
+        if self._time_per_tick:
+            real_time.sleep(self._time_per_tick)
+
+        if self._curr_schedule_index == len(self._closes):
+            raise SimulationEndException
 
         if is_daily(bar_size=self._time_step):
             self._tick_daily()
+        elif self._timeline is not None:
+            self._tick_timeline()
         else:
             self._tick_intraday()
 
+    def get_next_step_ns(self) -> Optional[int]:
+        """Get the time to which the next tick will advance the clock.
+
+        Returns
+        -------
+        int or None
+            The time as local nanoseconds since the epoch, or `None` if the
+            next tick ends the simulation.
+        """
+        idx = self._curr_schedule_index
+
+        if idx == len(self._closes):
+            next_ns = None
+        elif is_daily(bar_size=self._time_step):
+            if self._clock_ns >= self._closes[idx]:
+                idx += 1
+            next_ns = self._closes[idx] if idx != len(self._closes) else None
+        else:
+            next_ns = self._clock_ns + self._step_ns
+            if next_ns > self._closes[idx]:
+                idx += 1
+                if idx == len(self._closes):
+                    next_ns = None
+                else:
+                    next_ns = self._opens[idx] + self._step_ns
+
+        return next_ns
+
+    def advance_to(self, target_ns: int):
+        """Advance the clock to the first step at or after a given time.
+
+        The clock lands on a time it would have reached by ticking, and
+        always moves forward by at least one step.
+
+        Parameters
+        ----------
+        target_ns : int
+            The time as local nanoseconds since the epoch.
+
+        Raises
+        ------
+        SimulationEndException
+            If the target time is past the end of the simulation.
+        """
+        next_ns = self.get_next_step_ns()
+
+        if next_ns is None:
+            self._curr_schedule_index = len(self._closes)
+            raise SimulationEndException
+        if target_ns <= next_ns:
+            if self._time_per_tick:
+                real_time.sleep(self._time_per_tick)
+            self._set_step(clock_ns=next_ns)
+            return
+
+        n_sessions = len(self._closes)
+        idx = bisect.bisect_left(self._closes, target_ns)
+        idx = max(idx, self._curr_schedule_index)
+
+        while idx != n_sessions:
+            if is_daily(bar_size=self._time_step):
+                clock_ns = self._closes[idx]
+            else:
+                if idx == self._curr_schedule_index:
+                    base_ns = self._clock_ns
+                else:
+                    base_ns = self._opens[idx]
+                n_steps = max(-(-(target_ns - base_ns) // self._step_ns), 1)
+                clock_ns = base_ns + n_steps * self._step_ns
+            if clock_ns <= self._closes[idx]:
+                if self._time_per_tick:
+                    real_time.sleep(self._time_per_tick)
+                self._curr_schedule_index = idx
+                self._set_step(clock_ns=clock_ns)
+                return
+            idx += 1
+
+        self._curr_schedule_index = n_sessions
+        raise SimulationEndException
+
     def set_datetime(self, dt: datetime):
         if not self._start_date <= dt.date() <= self._end_date:
             raise ValueError(
@@ -86,12 +233,19 @@ class SimulationClock:
                 f" {self._end_date}. Got {dt.date()}."
             )
 
-        day = self._schedule.loc[dt.date()]
+        dt_ns = (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+        idx = bisect.bisect_left(self._closes, dt_ns)
+
+        if idx == len(self._closes) or dt.date() != (
+            self._session_dates[idx].tolist()
+        ):
+            raise ValueError(f"{dt.date()} is not a trading day.")
 
-        if not day["market_open"] <= dt.time() < day["market_close"]:
+        if not self._opens[idx] <= dt_ns < self._closes[idx]:
             raise ValueError(
-                f"Time must be between {day['market_open']} and"
-                f" {day['market_close']}. Got {dt.time()}."
+                f"Time must be between {self._ns_to_time(self._opens[idx])}"
+                f" and {self._ns_to_time(self._closes[idx])}."
+                f" Got {dt.time()}."
             )
 
         time_ = dt.time()
@@ -103,47 +257,92 @@ class SimulationClock:
                 f"Cannot set time {time_} for time-step {self._time_step}."
             )
 
-        dates_list = self._schedule.index.to_list()
-        idx = dates_list.index(dt.date())
-
         self._curr_schedule_index = idx
-        self._clock_dt = datetime.combine(dt.date(), dt.time())
+        self._set_clock_ns(clock_ns=dt_ns)
+
+        if self._timeline is not None:
+            self._sync_timeline()
 
     def _tick_daily(self):
         idx = self._curr_schedule_index
 
-        if idx == len(self._schedule):
-            raise SimulationEndException
+        if self._clock_ns >= self._closes[idx]:
+            idx += 1
+            if idx == len(self._closes):
+                raise SimulationEndException
+            self._curr_schedule_index = idx
 
-        self._clock_dt = datetime.combine(
-            self._schedule.index[idx],
-            self._schedule.iloc[idx]["market_close"],
-        )
-        self._curr_schedule_index += 1
+        self._set_clock_ns(clock_ns=self._closes[idx])
 
     def _tick_intraday(self):
-        self._clock_dt += self._time_step
-
+        clock_ns = self._clock_ns + self._step_ns
         idx = self._curr_schedule_index
-        close_time = self._schedule.iloc[idx]["market_close"]
 
-        if self._clock_dt.time() > close_time:
-            day_switch = True
-        else:
-            day_switch = False
+        if clock_ns > self._closes[idx]:
+            idx += 1
+            self._curr_schedule_index = idx
+
+            if idx == len(self._closes):
+                self._set_clock_ns(clock_ns=clock_ns)
+                raise SimulationEndException
+
+            clock_ns = self._opens[idx] + self._step_ns
+
+        self._set_clock_ns(clock_ns=clock_ns)
+
+    def _tick_timeline(self):
+        if self._timeline_pos is None:
+            # the clock was set to a time stamp that is not on the timeline
+            self._tick_intraday()
+            self._sync_timeline()
+            return
+
+        pos = self._timeline_pos + 1
 
-        if day_switch:
+        if pos == len(self._timeline):
+            self._curr_schedule_index = len(self._closes)
+            raise SimulationEndException
+
+        clock_ns = self._timeline.item(pos)
+        if clock_ns > self._closes[self._curr_schedule_index]:
             self._curr_schedule_index += 1
 
-            if self._curr_schedule_index == len(self._schedule):
-                raise SimulationEndException
+        self._timeline_pos = pos
+        self._set_clock_ns(clock_ns=clock_ns)
 
-            idx = self._curr_schedule_index
-            self._clock_dt = datetime.combine(
-                self._schedule.index[idx],
-                self._schedule.iloc[idx]["market_open"],
+    def _sync_timeline(self):
+        pos = np.searchsorted(self._timeline, self._clock_ns)
+        if (
+            pos != len(self._timeline)
+            and self._timeline[pos] == self._clock_ns
+        ):
+            self._timeline_pos = int(pos)
+        else:
+            self._timeline_pos = None
+
+    def _set_step(self, clock_ns: int):
+        if clock_ns > self._closes[self._curr_schedule_index]:
+            self._curr_schedule_index += 1
+        self._set_clock_ns(clock_ns=clock_ns)
+        if self._timeline is not None:
+            self._sync_timeline()
+
+    def _set_clock_ns(self, clock_ns: int):
+        self._clock_ns = clock_ns
+        self._clock_dt = None
+
+    def _build_timeline(self):
+        steps = [np.array([self._opens[0]], dtype=np.int64)]
+        for open_, close in zip(self._opens, self._closes):
+            steps.append(
+                np.arange(open_ + self._step_ns, close + 1, self._step_ns)
             )
-            self._clock_dt += self._time_step
+        self._timeline = np.concatenate(steps).astype(np.int64)
+
+    @staticmethod
+    def _ns_to_time(ns: int) -> time:
+        time_ = (_EPOCH + timedelta(microseconds=ns // 1000)).time()
+        return time_
 
 
 class ASimulationPiece(ABC):
@@ -162,17 +361,55 @@ class ASimulationPiece(ABC):
     def step(self, cache_only: bool = True):
         raise NotImplementedError
 
+    def get_next_wake_up(self) -> Optional[int]:
+        """Get the next time at which the piece needs to be stepped.
+
+        Used by the event-driven
+        :class:`~algotradepy.sim_utils.SimulationRunner` to skip the clock
+        steps at which no piece has anything to do. The default
+        implementation requests every clock step.
+
+        Returns
+        -------
+        int or None
+            The time as local nanoseconds since the epoch, or `None` if the
+            piece has no pending event.
+        """
+        next_ns = self.sim_clock.get_next_step_ns()
+        return next_ns
+
 
 class SimulationRunner:
+    """Runs a simulation.
+
+    Parameters
+    ----------
+    sim_clock : SimulationClock
+    data_providers : list of ASimulationPiece
+        The pieces stepped first on each clock step (e.g. the
+        :class:`~algotradepy.streamers.sim_streamer.SimulationDataStreamer`).
+    data_consumers : list of ASimulationPiece
+        The pieces stepped after the providers (e.g. the
+        :class:`~algotradepy.brokers.sim_broker.SimulationBroker`).
+    event_driven : bool, default False
+        If set to `True`, the clock jumps straight to the earliest wake-up
+        time requested by the simulation pieces instead of visiting every
+        time step. The pieces receive the same callbacks as in the
+        fixed-step mode, but `step_count` then counts the wake-ups and the
+        simulation ends as soon as no piece has a pending event.
+    """
+
     def __init__(
         self,
         sim_clock: SimulationClock,
         data_providers: List[ASimulationPiece],
         data_consumers: List[ASimulationPiece],
+        event_driven: bool = False,
     ):
         self._sim_clock = sim_clock
         self._data_providers = data_providers
         self._data_consumers = data_consumers
+        self._event_driven = event_driven
 
         for piece in self._data_providers:
             piece.sim_clock = sim_clock
@@ -200,7 +437,13 @@ class SimulationRunner:
 
         while step_count != 0:
             try:
-                self._sim_clock.tick()
+                if self._event_driven:
+                    wake_up = self._get_next_wake_up()
+                    if wake_up is None:
+                        break
+                    self._sim_clock.advance_to(target_ns=wake_up)
+                else:
+                    self._sim_clock.tick()
                 for piece in self._data_providers:
                     piece.step(cache_only=cache_only)
                 for piece in self._data_consumers:
@@ -210,3 +453,15 @@ class SimulationRunner:
 
             if step_count is not None:
                 step_count -= 1
+
+    def _get_next_wake_up(self) -> Optional[int]:
+        wake_up = None
+
+        for piece in self._data_providers + self._data_consumers:
+            piece_wake_up = piece.get_next_wake_up()
+            if piece_wake_up is not None and (
+                wake_up is None or piece_wake_up < wake_up
+            ):
+                wake_up = piece_wake_up
+
+        return wake_up
@@ -1,11 +1,271 @@
+import functools
+import heapq
+import itertools
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Callable, Optional, Dict
+from typing import Callable, Optional, Dict, List
 
-from algotradepy.contracts import AContract, PriceType
+import numpy as np
+
+from algotradepy.contracts import AContract, PriceType, Exchange
+from algotradepy.objects import Tick, TickBatch
+
+# the exchange codes are the positions in the Exchange enum
+_EXCHANGE_CODES = {exchange: code for code, exchange in enumerate(Exchange)}
+
+
+class FlushScheduler:
+    """Runs the latency-triggered flushes of tick batchers.
+
+    A single daemon thread, started on first use, waits for the earliest
+    deadline and runs its function, so that the batchers of a streamer
+    share one thread instead of starting a timer thread per batch.
+    """
+
+    def __init__(self):
+        self._deadlines = []  # heap of (deadline, sequence, func)
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def schedule(self, deadline: float, func: Callable):
+        """Call a function at a deadline.
+
+        Parameters
+        ----------
+        deadline : float
+            The time at which to call the function, in `time.monotonic()`
+            seconds.
+        func : Callable
+            The function, called without arguments on the scheduler thread.
+            The exceptions it raises are logged.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The scheduler is closed.")
+            heapq.heappush(
+                self._deadlines, (deadline, next(self._sequence), func),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self):
+        """Stop the scheduler thread, dropping the pending deadlines."""
+        with self._cond:
+            self._closed = True
+            self._deadlines.clear()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (
+                    len(self._deadlines) == 0
+                    or self._deadlines[0][0] > time.monotonic()
+                ):
+                    timeout = None
+                    if len(self._deadlines) != 0:
+                        timeout = self._deadlines[0][0] - time.monotonic()
+                    self._cond.wait(timeout=timeout)
+                if self._closed:
+                    break
+                _, _, func = heapq.heappop(self._deadlines)
+            try:
+                func()
+            except Exception:
+                # keep the thread alive for the other batchers
+                logging.exception("Scheduled flush failed.")
+
+
+class TickBatcher:
+    """Accumulates the ticks of a contract into batches.
+
+    A batch is delivered when it holds `max_batch_size` ticks or when its
+    first tick was received `max_latency` ago, whichever comes first. The
+    size-triggered batches are delivered on the thread adding the ticks
+    and the latency-triggered ones on the scheduler thread, one batch at a
+    time and in order.
+
+    Parameters
+    ----------
+    contract : AContract
+        The contract of the ticks.
+    func : Callable
+        The callback function. It is called with the
+        :class:`~algotradepy.objects.TickBatch` as its sole positional
+        argument.
+    fn_kwargs : dict, optional, default None
+        The keyword arguments to pass to the callback function.
+    max_latency : datetime.timedelta, optional, default None
+        The longest time a tick is held before its batch is delivered.
+    max_batch_size : int, optional, default None
+        The largest number of ticks in a batch.
+    scheduler : FlushScheduler, optional, default None
+        The scheduler of the latency-triggered flushes, usually shared by
+        the batchers of a streamer. A scheduler is created if required and
+        none is provided.
+    """
+
+    def __init__(
+        self,
+        contract: AContract,
+        func: Callable,
+        fn_kwargs: Optional[Dict] = None,
+        max_latency: Optional[timedelta] = None,
+        max_batch_size: Optional[int] = None,
+        scheduler: Optional[FlushScheduler] = None,
+    ):
+        self.validate_limits(
+            max_latency=max_latency, max_batch_size=max_batch_size,
+        )
+        if fn_kwargs is None:
+            fn_kwargs = {}
+        if scheduler is None and max_latency is not None:
+            scheduler = FlushScheduler()
+
+        self._contract = contract
+        self._func = func
+        self._fn_kwargs = fn_kwargs
+        self._max_latency = max_latency
+        self._max_batch_size = max_batch_size
+        self._scheduler = scheduler
+        # guards the accumulated ticks, never held while calling back
+        self._lock = threading.Lock()
+        # delivers the batches one at a time and in order
+        self._delivery_lock = threading.RLock()
+        # the number of the accumulating batch
+        self._batch_number = 0
+        self._timestamps = []
+        self._prices = []
+        self._sizes = []
+        self._exchanges = []
+
+    @staticmethod
+    def validate_limits(
+        max_latency: Optional[timedelta], max_batch_size: Optional[int],
+    ):
+        if max_latency is None and max_batch_size is None:
+            raise ValueError(
+                "At least one of max_latency or max_batch_size must be set."
+            )
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(
+                f"The max batch size must be positive. Got {max_batch_size}."
+            )
+
+    def add(
+        self,
+        timestamp: float,
+        price: float,
+        size: float = np.nan,
+        exchange: int = -1,
+    ):
+        """Add a tick to the batch.
+
+        Parameters
+        ----------
+        timestamp : float
+            The time stamp of the tick, in seconds since the epoch.
+        price : float
+        size : float, default NaN
+        exchange : int, default -1
+            The exchange code of the tick (see
+            :class:`~algotradepy.objects.TickBatch`).
+        """
+        with self._lock:
+            self._timestamps.append(timestamp)
+            self._prices.append(price)
+            self._sizes.append(size)
+            self._exchanges.append(exchange)
+            n_ticks = len(self._timestamps)
+            full = (
+                self._max_batch_size is not None
+                and n_ticks >= self._max_batch_size
+            )
+
+            if not full and n_ticks == 1 and self._max_latency is not None:
+                deadline = time.monotonic() + self._max_latency.total_seconds()
+                self._scheduler.schedule(
+                    deadline=deadline,
+                    func=functools.partial(
+                        self._on_deadline, self._batch_number,
+                    ),
+                )
+
+        if full:
+            self.flush()
+
+    def add_price(self, contract: AContract, price: float):
+        """Add a price update, as received by tick data subscribers."""
+        self.add(timestamp=time.time(), price=price)
+
+    def add_tick(self, tick: Tick):
+        """Add a tick, as received by trades subscribers."""
+        self.add(
+            timestamp=tick.timestamp,
+            price=tick.price,
+            size=tick.size,
+            exchange=_EXCHANGE_CODES.get(tick.exchange, -1),
+        )
+
+    def flush(self):
+        """Deliver the accumulated ticks, if any."""
+        with self._delivery_lock:
+            with self._lock:
+                batches = self._take_batches()
+            for batch in batches:
+                self._func(batch, **self._fn_kwargs)
+
+    def _on_deadline(self, batch_number: int):
+        # the deadlines of the batches already delivered are ignored
+        with self._delivery_lock:
+            with self._lock:
+                batches = []
+                if self._batch_number == batch_number:
+                    batches = self._take_batches()
+            for batch in batches:
+                self._func(batch, **self._fn_kwargs)
+
+    def _take_batches(self) -> List[TickBatch]:
+        # must be called with the lock held
+        n_ticks = len(self._timestamps)
+        batch_size = self._max_batch_size or max(n_ticks, 1)
+        timestamps = np.array(self._timestamps, dtype=np.float64)
+        prices = np.array(self._prices, dtype=np.float64)
+        sizes = np.array(self._sizes, dtype=np.float64)
+        exchanges = np.array(self._exchanges, dtype=np.int16)
+        batches = [
+            TickBatch(
+                contract=self._contract,
+                timestamps=timestamps[start : start + batch_size],
+                prices=prices[start : start + batch_size],
+                sizes=sizes[start : start + batch_size],
+                exchanges=exchanges[start : start + batch_size],
+            )
+            for start in range(0, n_ticks, batch_size)
+        ]
+        self._timestamps.clear()
+        self._prices.clear()
+        self._sizes.clear()
+        self._exchanges.clear()
+        self._batch_number += 1
+        return batches
 
 
 class ADataStreamer(ABC):
+    def __init__(self):
+        # runs the latency-triggered flushes of all the batchers
+        self._flush_scheduler = FlushScheduler()
+        # {(contract, func): TickBatcher}
+        self._tick_batchers = {}
+        self._trade_batchers = {}
+
     @abstractmethod
     def subscribe_to_bars(
         self,
@@ -120,3 +380,138 @@ class ADataStreamer(ABC):
             The function for which to cancel trade updates.
         """
         raise NotImplementedError
+
+    def subscribe_to_tick_batches(
+        self,
+        contract: AContract,
+        func: Callable,
+        fn_kwargs: Optional[Dict] = None,
+        price_type: PriceType = PriceType.MARKET,
+        max_latency: Optional[timedelta] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        """Subscribe to batched tick updates.
+
+        The tick updates are accumulated and delivered as
+        :class:`~algotradepy.objects.TickBatch` objects, each holding the
+        updates received for the contract since the previous batch. At
+        least one of `max_latency` or `max_batch_size` must be set.
+
+        Parameters
+        ----------
+        contract : AContract
+            The contract definition for which to request price updates.
+        func : Callable
+            The callback function. It must accept a TickBatch as its sole
+            positional argument.
+        fn_kwargs : dict
+            The keyword arguments to pass to the callback function along with
+            the positional arguments.
+        price_type : PriceType
+            The price type (market, bid, ask).
+        max_latency : datetime.timedelta, optional, default None
+            The longest time an update is held before its batch is delivered.
+        max_batch_size : int, optional, default None
+            The largest number of updates in a batch.
+        """
+        batcher = TickBatcher(
+            contract=contract,
+            func=func,
+            fn_kwargs=fn_kwargs,
+            max_latency=max_latency,
+            max_batch_size=max_batch_size,
+            scheduler=self._flush_scheduler,
+        )
+        self._tick_batchers[(contract, func)] = batcher
+        self.subscribe_to_tick_data(
+            contract=contract, func=batcher.add_price, price_type=price_type,
+        )
+
+    def cancel_tick_batches(self, contract: AContract, func: Callable):
+        """Cancel batched tick updates.
+
+        The updates accumulated up to the cancellation are delivered.
+
+        Parameters
+        ----------
+        contract : AContract
+            The contract definition for which to cancel tick updates.
+        func : Callable
+            The function for which to cancel tick updates.
+        """
+        batcher = self._pop_batcher(
+            batchers=self._tick_batchers, contract=contract, func=func,
+        )
+        self.cancel_tick_data(contract=contract, func=batcher.add_price)
+        batcher.flush()
+
+    def subscribe_to_trade_batches(
+        self,
+        contract: AContract,
+        func: Callable,
+        fn_kwargs: Optional[Dict] = None,
+        max_latency: Optional[timedelta] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        """Subscribe to batched trade updates.
+
+        The trades are accumulated and delivered as
+        :class:`~algotradepy.objects.TickBatch` objects, each holding the
+        trades received for the contract since the previous batch. At least
+        one of `max_latency` or `max_batch_size` must be set.
+
+        Parameters
+        ----------
+        contract : AContract
+            The contract definition for which to request trade updates.
+        func : Callable
+            The callback function. It must accept a TickBatch as its sole
+            positional argument.
+        fn_kwargs : dict
+            The keyword arguments to pass to the callback function along with
+            the positional arguments.
+        max_latency : datetime.timedelta, optional, default None
+            The longest time a trade is held before its batch is delivered.
+        max_batch_size : int, optional, default None
+            The largest number of trades in a batch.
+        """
+        batcher = TickBatcher(
+            contract=contract,
+            func=func,
+            fn_kwargs=fn_kwargs,
+            max_latency=max_latency,
+            max_batch_size=max_batch_size,
+            scheduler=self._flush_scheduler,
+        )
+        self._trade_batchers[(contract, func)] = batcher
+        self.subscribe_to_trades(contract=contract, func=batcher.add_tick)
+
+    def cancel_trade_batches(self, contract: AContract, func: Callable):
+        """Cancel batched trade updates.
+
+        The trades accumulated up to the cancellation are delivered.
+
+        Parameters
+        ----------
+        contract : AContract
+            The contract definition for which to cancel trade updates.
+        func : Callable
+            The function for which to cancel trade updates.
+        """
+        batcher = self._pop_batcher(
+            batchers=self._trade_batchers, contract=contract, func=func,
+        )
+        self.cancel_trades(contract=contract, func=batcher.add_tick)
+        batcher.flush()
+
+    @staticmethod
+    def _pop_batcher(
+        batchers: Dict, contract: AContract, func: Callable,
+    ) -> TickBatcher:
+        batcher = batchers.pop((contract, func), None)
+        if batcher is None:
+            raise ValueError(
+                f"No batch subscription found for contract {contract} and"
+                f" function {func}."
+            )
+        return batcher
@@ -44,6 +44,7 @@ class IBDataStreamer(ADataStreamer, IBBase):
         simulation: bool = True,
         ib_connector: Optional[IBConnector] = None,
     ):
+        ADataStreamer.__init__(self)
         IBBase.__init__(self, simulation=simulation, ib_connector=ib_connector)
 
         # {contract: {"tick": ib_tick, "sub_count": sub-count}}
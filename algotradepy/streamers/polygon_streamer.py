@@ -2,24 +2,60 @@ import threading
 from datetime import timedelta
 from typing import Callable, Optional, Dict
 
+from algotradepy.connectors.frame_buffer import OverflowPolicy
 from algotradepy.connectors.polygon_connector import PolygonWebSocketConnector
-from algotradepy.contracts import AContract, PriceType, StockContract
-from algotradepy.streamers.base import ADataStreamer
+from algotradepy.contracts import (
+    AContract,
+    PriceType,
+    StockContract,
+    ContractRegistry,
+)
+from algotradepy.streamers.base import ADataStreamer, TickBatcher
 from algotradepy.time_utils import milli_to_seconds
 from algotradepy.objects import Tick
 
 
 class PolygonDataStreamer(ADataStreamer):
-    def __init__(self, api_token: str):
-        self._conn = PolygonWebSocketConnector(api_token=api_token)
+    """The Polygon data streamer.
+
+    Parameters
+    ----------
+    api_token : str
+    buffer_capacity : int, default 10_000
+    overflow_policy : OverflowPolicy, default OverflowPolicy.BLOCK
+    dispatcher_threads : int, default 1
+        The dispatch settings of the web socket connection, passed to the
+        `PolygonWebSocketConnector`.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        buffer_capacity: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        dispatcher_threads: int = 1,
+    ):
+        super().__init__()
+        self._conn = PolygonWebSocketConnector(
+            api_token=api_token,
+            buffer_capacity=buffer_capacity,
+            overflow_policy=overflow_policy,
+            dispatcher_threads=dispatcher_threads,
+        )
         self._conn.connect()
+        # the subscription keys, never handed out as they are shared
+        self._contracts = ContractRegistry()
         self._trade_subscribers_lock = threading.Lock()
+        # the per-contract dicts are replaced on change, so that the
+        # dispatcher threads can iterate them without the lock
         self._trade_subscribers = {}  # {contract: {func: fn_kwargs}}
+        self._trade_batch_subscribers = {}  # {contract: {func: TickBatcher}}
 
         self._subscribe_to_events()
 
     def __del__(self):
         self._conn.disconnect()
+        self._flush_scheduler.close()
 
     def subscribe_to_bars(
         self,
@@ -57,10 +93,9 @@ class PolygonDataStreamer(ADataStreamer):
             fn_kwargs = {}
 
         with self._trade_subscribers_lock:
-            if contract in self._trade_subscribers:
-                self._trade_subscribers[contract][func] = fn_kwargs
-            else:
-                self._trade_subscribers[contract] = {func: fn_kwargs}
+            sub_dict = dict(self._trade_subscribers.get(contract, {}))
+            sub_dict[func] = fn_kwargs
+            self._trade_subscribers[contract] = sub_dict
             self._conn.request_trade_data(symbol=contract.symbol)
 
     def cancel_trades(self, contract: AContract, func: Callable):
@@ -71,32 +106,85 @@ class PolygonDataStreamer(ADataStreamer):
                 raise ValueError(
                     f"No subscriptions found for contract {contract}."
                 )
-            sub_dict = self._trade_subscribers[contract]
+            sub_dict = dict(self._trade_subscribers[contract])
             if func not in sub_dict:
                 raise ValueError(
                     f"Function {func} not subscribed to contract {contract}."
                 )
             del sub_dict[func]
-            if len(sub_dict) == 0:
-                self._conn.cancel_trade_data(symbol=contract.symbol)
+            self._trade_subscribers[contract] = sub_dict
+            self._maybe_cancel_trade_data(contract=contract)
+
+    def subscribe_to_trade_batches(
+        self,
+        contract: AContract,
+        func: Callable,
+        fn_kwargs: Optional[Dict] = None,
+        max_latency: Optional[timedelta] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        batcher = TickBatcher(
+            contract=contract,
+            func=func,
+            fn_kwargs=fn_kwargs,
+            max_latency=max_latency,
+            max_batch_size=max_batch_size,
+            scheduler=self._flush_scheduler,
+        )
+        contract = self._validate_contract(contract=contract)
+
+        with self._trade_subscribers_lock:
+            sub_dict = dict(self._trade_batch_subscribers.get(contract, {}))
+            sub_dict[func] = batcher
+            self._trade_batch_subscribers[contract] = sub_dict
+            self._conn.request_trade_data(symbol=contract.symbol)
+
+    def cancel_trade_batches(self, contract: AContract, func: Callable):
+        contract = self._validate_contract(contract=contract)
+
+        with self._trade_subscribers_lock:
+            sub_dict = dict(self._trade_batch_subscribers.get(contract, {}))
+            if func not in sub_dict:
+                raise ValueError(
+                    f"Function {func} not subscribed to trade batches of"
+                    f" contract {contract}."
+                )
+            batcher = sub_dict.pop(func)
+            self._trade_batch_subscribers[contract] = sub_dict
+            self._maybe_cancel_trade_data(contract=contract)
+
+        batcher.flush()
 
     def _subscribe_to_events(self):
         self._conn.subscribe_to_trade_event(func=self._trades_receiver)
 
-    @staticmethod
-    def _validate_contract(contract: AContract) -> AContract:
+    def _validate_contract(self, contract: AContract) -> AContract:
         if isinstance(contract, StockContract):
-            contract = StockContract(symbol=contract.symbol)
+            contract = self._contracts.get(
+                StockContract, symbol=contract.symbol,
+            )
         else:
             raise TypeError(f"Unknown contract type {type(contract)}.")
 
         return contract
 
+    def _maybe_cancel_trade_data(self, contract: AContract):
+        if len(self._trade_subscribers.get(contract, {})) == 0 and (
+            len(self._trade_batch_subscribers.get(contract, {})) == 0
+        ):
+            self._conn.cancel_trade_data(symbol=contract.symbol)
+
     def _trades_receiver(self, trade: Dict):
-        contract = StockContract(symbol=trade["sym"])
-        tick = self._parse_trade(trade=trade)
-        with self._trade_subscribers_lock:
-            sub_dict = self._trade_subscribers[contract]
+        contract = self._contracts.get(StockContract, symbol=trade["sym"])
+        batchers = self._trade_batch_subscribers.get(contract)
+        if batchers:
+            ts = milli_to_seconds(milli=trade["t"])
+            for batcher in batchers.values():
+                batcher.add(timestamp=ts, price=trade["p"], size=trade["s"])
+
+        sub_dict = self._trade_subscribers.get(contract)
+        if sub_dict:
+            tick = self._parse_trade(trade=trade)
             for func, fn_kwargs in sub_dict.items():
                 func(tick, **fn_kwargs)
 
@@ -1,15 +1,196 @@
-from datetime import timedelta
-from typing import Callable, Optional, Dict
+import bisect
+from datetime import timedelta, date, datetime
+from typing import Callable, Optional, Dict, Union, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from algotradepy.contracts import AContract, PriceType, OptionContract
 from algotradepy.historical.hist_utils import is_daily
 from algotradepy.historical.loaders import HistoricalRetriever
-from algotradepy.objects import Greeks
+from algotradepy.historical.tick_store import QUOTES_DTYPE
+from algotradepy.objects import Greeks, Bar, TickBatch
 from algotradepy.sim_utils import ASimulationPiece
-from algotradepy.streamers.base import ADataStreamer
-from algotradepy.time_utils import get_next_trading_date
+from algotradepy.streamers.base import ADataStreamer, TickBatcher
+from algotradepy.time_utils import (
+    get_next_trading_date,
+    get_trading_calendar,
+)
+
+_NANOS_PER_SEC = 10 ** 9
+_NANOS_PER_DAY = 24 * 60 * 60 * _NANOS_PER_SEC
+_EPOCH = datetime(1970, 1, 1)
+# the positions of the (mid, ask, bid) tick prices
+_PRICE_TYPES = {PriceType.MARKET: 0, PriceType.ASK: 1, PriceType.BID: 2}
+
+
+class _BarArrays:
+    """The bars of a contract as contiguous arrays, with a moving cursor.
+
+    Looking up the bars in the order of the simulation only advances the
+    cursor, making the bar delivery constant-time.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.timestamps = pd.DatetimeIndex(data.index).asi8
+        self.columns = list(data.columns)
+        self.positions = {name: pos for pos, name in enumerate(self.columns)}
+        self.values = data.to_numpy(dtype=np.float64)
+        self._ts_list = self.timestamps.tolist()
+        self._rows = None
+        self._cursor = 0
+
+    def find(self, ts: int) -> Optional[int]:
+        """Get the index of the bar starting at `ts`, if any."""
+        idx = self._seek(ts=ts)
+
+        if idx == len(self._ts_list) or self._ts_list[idx] != ts:
+            idx = None
+
+        return idx
+
+    def find_after(self, ts: int) -> Optional[int]:
+        """Get the index of the first bar starting after `ts`, if any."""
+        idx = self._seek(ts=ts)
+
+        if idx != len(self._ts_list) and self._ts_list[idx] == ts:
+            idx += 1
+        if idx == len(self._ts_list):
+            idx = None
+
+        return idx
+
+    def get_series(self, idx: int) -> pd.Series:
+        bar = pd.Series(
+            self.values[idx],
+            index=self.columns,
+            name=pd.Timestamp(self._ts_list[idx]),
+        )
+        return bar
+
+    def get_record(self, idx: int) -> Bar:
+        if self._rows is None:
+            self._rows = self.values.tolist()
+        micros = self._ts_list[idx] // 1000
+        bar = Bar(
+            datetime_=_EPOCH + timedelta(microseconds=micros),
+            values=self._rows[idx],
+            columns=self.positions,
+        )
+        return bar
+
+    def _seek(self, ts: int) -> int:
+        # moves the cursor to the first bar starting at or after ts
+        ts_list = self._ts_list
+        cursor = self._cursor
+        n_bars = len(ts_list)
+
+        if cursor == n_bars or ts_list[cursor] != ts:
+            if cursor + 1 < n_bars and ts_list[cursor + 1] == ts:
+                cursor += 1
+            elif cursor < n_bars and ts_list[cursor] < ts:
+                cursor = bisect.bisect_left(ts_list, ts, lo=cursor)
+            else:
+                cursor = bisect.bisect_left(ts_list, ts)
+            self._cursor = cursor
+
+        return cursor
+
+
+class _TickReplay:
+    """Replays the ticks of several contracts in time order.
+
+    The ticks of all the contracts for a day are merged once into a single
+    time-sorted set of arrays. Each step then dispatches a contiguous slice
+    of those arrays, with no per-step sorting or frame building.
+
+    Parameters
+    ----------
+    date_ : datetime.date
+        The replayed day.
+    contracts : list of AContract
+        The replayed contracts.
+    records : list of numpy.ndarray
+        The quotes records of each contract for the day, sorted by time stamp.
+    callbacks : list of list of tuple
+        The `(func, price_type_idx, fn_kwargs)` callbacks of each contract,
+        where `price_type_idx` indexes the (mid, ask, bid) prices.
+    """
+
+    def __init__(
+        self,
+        date_: date,
+        contracts: List[AContract],
+        records: List[np.ndarray],
+        callbacks: List[List[Tuple[Callable, int, Dict]]],
+    ):
+        self.date = date_
+        self._contracts = contracts
+        self._callbacks = callbacks
+
+        timestamps = np.concatenate(
+            [contract_records["timestamp"] for contract_records in records]
+        )
+        codes = np.repeat(
+            np.arange(len(records)), [len(r) for r in records],
+        )
+        # a stable sort keeps same-time ticks in subscription order
+        order = np.argsort(timestamps, kind="stable")
+        asks = np.concatenate([r["ask"] for r in records])[order]
+        bids = np.concatenate([r["bid"] for r in records])[order]
+
+        self._timestamps = timestamps[order].tolist()
+        self._codes = codes[order].tolist()
+        self._prices = list(
+            zip(((asks + bids) / 2).tolist(), asks.tolist(), bids.tolist())
+        )
+        self._last_end = None
+        self._last_end_idx = 0
+
+    def dispatch(self, start: int, end: int):
+        """Dispatch the ticks time-stamped in [start, end)."""
+        if start == self._last_end:
+            start_idx = self._last_end_idx
+        else:
+            start_idx = bisect.bisect_left(self._timestamps, start)
+        end_idx = bisect.bisect_left(self._timestamps, end, lo=start_idx)
+        self._last_end = end
+        self._last_end_idx = end_idx
+
+        contracts = self._contracts
+        callbacks = self._callbacks
+        codes = self._codes[start_idx:end_idx]
+        prices = self._prices[start_idx:end_idx]
+
+        for code, tick_prices in zip(codes, prices):
+            contract = contracts[code]
+            for func, price_idx, fn_kwargs in callbacks[code]:
+                func(contract, tick_prices[price_idx], **fn_kwargs)
+
+
+class _TickBatchSubscription:
+    """The state of a simulated tick batches subscription."""
+
+    def __init__(
+        self,
+        contract: AContract,
+        func: Callable,
+        fn_kwargs: Dict,
+        price_type: PriceType,
+        max_latency: Optional[timedelta],
+        max_batch_size: Optional[int],
+    ):
+        self.contract = contract
+        self.func = func
+        self.fn_kwargs = fn_kwargs
+        self.price_type = price_type
+        self.max_latency_ns = None
+        if max_latency is not None:
+            self.max_latency_ns = int(max_latency.total_seconds() * 1e9)
+        self.max_batch_size = max_batch_size
+        # the start of the time range not delivered yet
+        self.window_start: Optional[int] = None
+        self.window_date: Optional[date] = None
 
 
 class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
@@ -23,10 +204,16 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
     ----------
     historical_retriever : HistoricalRetriever
         The historical retriever to use when loading historical data.
+    bar_records : bool, default False
+        If set to `True`, the bars are delivered as light-weight
+        :class:`~algotradepy.objects.Bar` records instead of
+        :class:`pandas.Series`.
     """
 
     def __init__(
-        self, historical_retriever: Optional[HistoricalRetriever] = None,
+        self,
+        historical_retriever: Optional[HistoricalRetriever] = None,
+        bar_records: bool = False,
     ):
         ADataStreamer.__init__(self)
         ASimulationPiece.__init__(self)
@@ -35,6 +222,12 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
             historical_retriever = HistoricalRetriever()
         self._hist_retriever = historical_retriever
         self._local_cache = {}  # {contract: pd.DataFrame}
+        self._bar_arrays = {}  # {contract: {bar_size: _BarArrays}}
+        self._bar_records = bar_records
+        self._tick_records = {}  # {contract: {date: np.ndarray}}
+        self._tick_replay: Optional[_TickReplay] = None
+        # {(contract, func): _TickBatchSubscription}
+        self._tick_batch_subscriptions = {}
         # {bar_size: {contract: {func: fn_kwargs}}}
         self._bars_callback_table = {}
         # {contract: {func: {"fn_kwargs": fn_kwargs, "price_type": price_type}}}
@@ -88,6 +281,7 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
 
         callbacks = self._tick_callback_table.setdefault(contract, {})
         callbacks[func] = {"fn_kwargs": fn_kwargs, "price_type": price_type}
+        self._tick_replay = None
 
     def cancel_tick_data(self, contract: AContract, func: Callable):
         if contract in self._tick_callback_table:
@@ -96,6 +290,67 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
                 del callbacks[func]
             if len(callbacks) == 0:
                 del self._tick_callback_table[contract]
+            self._tick_replay = None
+
+    def subscribe_to_tick_batches(
+        self,
+        contract: AContract,
+        func: Callable,
+        fn_kwargs: Optional[Dict] = None,
+        price_type: PriceType = PriceType.MARKET,
+        max_latency: Optional[timedelta] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        """Subscribe to batched tick updates.
+
+        The batches are sliced from the tick records of the contract, with
+        no per-tick processing. The latency is measured in simulation time.
+        The batches pending at the end of a trading day are delivered at
+        the last step of that day.
+        """
+        if self.sim_clock.time_step != timedelta(seconds=1):
+            raise ValueError(
+                f"Can only simulate tick data subscription with a clock"
+                f" time-step of 1s. Current time-step:"
+                f" {self.sim_clock.time_step}."
+            )
+        TickBatcher.validate_limits(
+            max_latency=max_latency, max_batch_size=max_batch_size,
+        )
+
+        if fn_kwargs is None:
+            fn_kwargs = {}
+
+        self._tick_batch_subscriptions[(contract, func)] = (
+            _TickBatchSubscription(
+                contract=contract,
+                func=func,
+                fn_kwargs=fn_kwargs,
+                price_type=price_type,
+                max_latency=max_latency,
+                max_batch_size=max_batch_size,
+            )
+        )
+
+    def cancel_tick_batches(self, contract: AContract, func: Callable):
+        sub = self._pop_batcher(
+            batchers=self._tick_batch_subscriptions,
+            contract=contract,
+            func=func,
+        )
+
+        if self._has_pending_ticks(sub=sub):
+            records = self._get_tick_records(
+                contract=sub.contract, date_=self.sim_clock.date,
+            )
+            timestamps = records["timestamp"]
+            start_idx = bisect.bisect_left(timestamps, sub.window_start)
+            end_idx = bisect.bisect_left(
+                timestamps, self.sim_clock.datetime_ns, lo=start_idx,
+            )
+            self._deliver_tick_batches(
+                sub=sub, records=records[start_idx:end_idx],
+            )
 
     def subscribe_to_greeks(
         self,
@@ -131,12 +386,109 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
 
     def step(self, cache_only: bool = True):
         self._update_tick_subscribers()
+        self._update_tick_batch_subscribers()
         self._maybe_update_bar_subscribers()
 
-    def get_bar(self, contract: AContract, bar_size: timedelta,) -> pd.Series:
+    def get_next_wake_up(self) -> Optional[int]:
+        clock = self.sim_clock
+
+        if is_daily(bar_size=clock.time_step):
+            return clock.get_next_step_ns()
+
+        now = clock.datetime_ns
+        wake_ups = []
+
+        for bar_size in self._bars_callback_table:
+            if is_daily(bar_size=bar_size):
+                idx = np.searchsorted(clock.session_closes, now, side="right")
+                if idx != len(clock.session_closes):
+                    wake_ups.append(int(clock.session_closes[idx]))
+            else:
+                bar_ns = bar_size.seconds * _NANOS_PER_SEC
+                wake_ups.append((now // bar_ns + 1) * bar_ns)
+
+        for contract in self._tick_callback_table:
+            tick_ns = self._get_next_tick_ns(contract=contract, now=now)
+            if tick_ns is not None:
+                wake_ups.append(tick_ns)
+
+        for sub in self._tick_batch_subscriptions.values():
+            tick_ns = self._get_next_tick_ns(contract=sub.contract, now=now)
+            if tick_ns is not None:
+                wake_ups.append(tick_ns)
+            if sub.max_latency_ns is not None and sub.window_start is not None:
+                latency_ns = sub.window_start + sub.max_latency_ns
+                latency_ns = -(-latency_ns // _NANOS_PER_SEC) * _NANOS_PER_SEC
+                if latency_ns > now:
+                    wake_ups.append(latency_ns)
+            if self._has_pending_ticks(sub=sub):
+                # the pending ticks are delivered at the session close
+                idx = np.searchsorted(clock.session_closes, now, side="left")
+                close_ns = int(clock.session_closes[idx])
+                if close_ns > now:
+                    wake_ups.append(close_ns)
+
+        wake_up = min(wake_ups) if len(wake_ups) != 0 else None
+
+        return wake_up
+
+    def add_bar_data(
+        self, contract: AContract, bar_size: timedelta, data: pd.DataFrame,
+    ):
+        """Provide the bars data of a contract ahead of the simulation.
+
+        The data is used instead of loading it with the historical
+        retriever. It must cover the simulation period and the trading day
+        following it.
+
+        Parameters
+        ----------
+        contract : AContract
+        bar_size : datetime.timedelta
+        data : pandas.DataFrame
+            The bars data, indexed by a `datetime` index.
+        """
+        symbol_data = self._local_cache.setdefault(contract, {})
+        symbol_data[bar_size] = data
+        self._bar_arrays.get(contract, {}).pop(bar_size, None)
+
+    def get_bar(
+        self, contract: AContract, bar_size: timedelta,
+    ) -> Union[pd.Series, Bar]:
+        """Get the bar starting at the current simulation time.
+
+        At the session close, gets the bar opening the next trading session.
+        Missing bars are not skipped: a `KeyError` is raised if the data has
+        no bar starting at the expected time.
+        """
         bar = self._get_next_bar(contract=contract, bar_size=bar_size)
         return bar
 
+    def get_last_bar(
+        self, contract: AContract, bar_size: timedelta,
+    ) -> Union[pd.Series, Bar]:
+        """Get the last bar completed at the current simulation time."""
+        bar = self._get_latest_time_entry(contract=contract, bar_size=bar_size)
+        return bar
+
+    def get_last_quotes(self, contract: AContract) -> np.ndarray:
+        """Get the quotes delivered at the current 1s simulation step.
+
+        Returns
+        -------
+        numpy.ndarray
+            The quotes records time-stamped in [t - 1s, t).
+        """
+        now = self.sim_clock.datetime_ns
+        records = self._get_tick_records(
+            contract=contract, date_=self.sim_clock.date,
+        )
+        timestamps = records["timestamp"]
+        start_idx = bisect.bisect_left(timestamps, now - _NANOS_PER_SEC)
+        end_idx = bisect.bisect_left(timestamps, now, lo=start_idx)
+        quotes = records[start_idx:end_idx]
+        return quotes
+
     def simulate_greeks_update(self, contract: OptionContract, greeks: Greeks):
         # TODO: make this functionality dependent on the simulation data
         con_dict = self._greeks_callback_table[contract]
@@ -147,35 +499,186 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
     # -------------------------- Helpers ---------------------------------------
 
     def _update_tick_subscribers(self):
-        data = pd.DataFrame()
+        if len(self._tick_callback_table) == 0:
+            return
 
-        for contract, _ in self._tick_callback_table.items():
-            symbol_data = self._get_tick_data(contract=contract)
-            data = data.append(symbol_data)
+        clock = self.sim_clock
+        replay = self._tick_replay
+        if replay is None or replay.date != clock.date:
+            replay = self._build_tick_replay(date_=clock.date)
 
-        data = data.sort_index(axis=0, level=1)
+        now = clock.datetime_ns
+        replay.dispatch(start=now - _NANOS_PER_SEC, end=now)
 
-        for idx, row in data.iterrows():
-            contract, dt_ = idx
-            callbacks = self._tick_callback_table[contract]
+    def _update_tick_batch_subscribers(self):
+        if len(self._tick_batch_subscriptions) == 0:
+            return
+
+        clock = self.sim_clock
+        now = clock.datetime_ns
+        end_of_day = clock.end_of_day
+
+        for sub in list(self._tick_batch_subscriptions.values()):
+            if sub.window_date != clock.date:
+                sub.window_start = now - _NANOS_PER_SEC
+                sub.window_date = clock.date
 
-            for func, fn_dict in callbacks.items():
-                if fn_dict["price_type"] == PriceType.ASK:
-                    price = row["ask"]
-                elif fn_dict["price_type"] == PriceType.BID:
-                    price = row["bid"]
+            records = self._get_tick_records(
+                contract=sub.contract, date_=clock.date,
+            )
+            timestamps = records["timestamp"]
+            start_idx = bisect.bisect_left(timestamps, sub.window_start)
+            end_idx = bisect.bisect_left(timestamps, now, lo=start_idx)
+            n_ticks = end_idx - start_idx
+
+            if end_of_day or (
+                sub.max_latency_ns is not None
+                and now - sub.window_start >= sub.max_latency_ns
+            ):
+                deliver_idx = end_idx
+                sub.window_start = now
+            elif (
+                sub.max_batch_size is not None
+                and n_ticks >= sub.max_batch_size
+            ):
+                # the remaining ticks wait for the next full batch
+                n_batches = n_ticks // sub.max_batch_size
+                deliver_idx = start_idx + n_batches * sub.max_batch_size
+                if deliver_idx == end_idx:
+                    sub.window_start = now
                 else:
-                    price = (row["ask"] + row["bid"]) / 2
-                func(contract, price, **fn_dict["fn_kwargs"])
-
-    def _get_tick_data(self, contract: AContract) -> pd.DataFrame:
-        curr_dt = self.sim_clock.datetime
-        prev_dt = curr_dt - timedelta(seconds=1)
-        symbol_data = self._get_data(contract=contract, bar_size=timedelta(0),)
-        symbol_data = symbol_data.loc[prev_dt:curr_dt]
-        ml_index = pd.MultiIndex.from_product([[contract], symbol_data.index])
-        symbol_data.index = ml_index
-        return symbol_data
+                    sub.window_start = int(timestamps[deliver_idx])
+            else:
+                deliver_idx = start_idx
+
+            self._deliver_tick_batches(
+                sub=sub, records=records[start_idx:deliver_idx],
+            )
+
+    def _deliver_tick_batches(
+        self, sub: _TickBatchSubscription, records: np.ndarray,
+    ):
+        batch_size = sub.max_batch_size or max(len(records), 1)
+        for batch_start in range(0, len(records), batch_size):
+            batch = self._make_tick_batch(
+                contract=sub.contract,
+                records=records[batch_start : batch_start + batch_size],
+                price_type=sub.price_type,
+            )
+            sub.func(batch, **sub.fn_kwargs)
+
+    def _has_pending_ticks(self, sub: _TickBatchSubscription) -> bool:
+        clock = self.sim_clock
+        pending = False
+
+        if sub.window_date == clock.date:
+            timestamps = self._get_tick_records(
+                contract=sub.contract, date_=clock.date,
+            )["timestamp"]
+            pending = (
+                bisect.bisect_left(timestamps, sub.window_start)
+                != len(timestamps)
+            )
+
+        return pending
+
+    @staticmethod
+    def _make_tick_batch(
+        contract: AContract, records: np.ndarray, price_type: PriceType,
+    ) -> TickBatch:
+        if price_type == PriceType.ASK:
+            prices = records["ask"]
+            sizes = records["ask volume"]
+        elif price_type == PriceType.BID:
+            prices = records["bid"]
+            sizes = records["bid volume"]
+        else:
+            prices = (records["ask"] + records["bid"]) / 2
+            sizes = np.full(len(records), np.nan)
+        batch = TickBatch(
+            contract=contract,
+            timestamps=records["timestamp"] / 1e9,
+            prices=prices,
+            sizes=sizes,
+            exchanges=np.full(len(records), -1, dtype=np.int16),
+        )
+        return batch
+
+    def _build_tick_replay(self, date_: date) -> _TickReplay:
+        contracts = list(self._tick_callback_table)
+        records = [
+            self._get_tick_records(contract=contract, date_=date_)
+            for contract in contracts
+        ]
+        callbacks = []
+
+        for contract in contracts:
+            contract_callbacks = [
+                (
+                    func,
+                    _PRICE_TYPES[fn_dict["price_type"]],
+                    fn_dict["fn_kwargs"],
+                )
+                for func, fn_dict in self._tick_callback_table[
+                    contract
+                ].items()
+            ]
+            callbacks.append(contract_callbacks)
+
+        self._tick_replay = _TickReplay(
+            date_=date_,
+            contracts=contracts,
+            records=records,
+            callbacks=callbacks,
+        )
+
+        return self._tick_replay
+
+    def _get_next_tick_ns(
+        self, contract: AContract, now: int,
+    ) -> Optional[int]:
+        # the ticks in [t - 1s, t) are delivered at clock step t
+        clock = self.sim_clock
+        session_dates = clock.session_dates
+        idx = np.searchsorted(
+            session_dates, np.datetime64(clock.date, "D"), side="left",
+        )
+        tick_ns = None
+
+        while tick_ns is None and idx < len(session_dates):
+            records = self._get_tick_records(
+                contract=contract, date_=session_dates[idx].tolist(),
+            )
+            timestamps = records["timestamp"]
+            tick_idx = bisect.bisect_left(timestamps, now)
+            if tick_idx != len(timestamps):
+                tick_ns = int(timestamps[tick_idx])
+                tick_ns = (tick_ns // _NANOS_PER_SEC + 1) * _NANOS_PER_SEC
+            idx += 1
+
+        return tick_ns
+
+    def _get_tick_records(
+        self, contract: AContract, date_: date,
+    ) -> np.ndarray:
+        contract_records = self._tick_records.setdefault(contract, {})
+        records = contract_records.get(date_)
+
+        if records is None:
+            records = self._hist_retriever.get_cached_tick_records(
+                contract=contract, date_=date_, bar_size=timedelta(0),
+            )
+            if records is None and not self._hist_cache_only:
+                # downloads and caches the missing data
+                self._get_data(contract=contract, bar_size=timedelta(0))
+                records = self._hist_retriever.get_cached_tick_records(
+                    contract=contract, date_=date_, bar_size=timedelta(0),
+                )
+            if records is None:
+                records = np.empty(0, dtype=QUOTES_DTYPE)
+            contract_records[date_] = records
+
+        return records
 
     def _maybe_update_bar_subscribers(self):
         step_is_daily = is_daily(bar_size=self.sim_clock.time_step)
@@ -186,11 +689,12 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
                 bar_size=bar_size, contract_dict=contract_dict,
             )
         else:
+            since_epoch = self.sim_clock.datetime_ns
             for bar_size, contract_dict in self._bars_callback_table.items():
                 sub_is_daily = is_daily(bar_size=bar_size)
-                since_epoch = self.sim_clock.datetime.timestamp()
                 if (sub_is_daily and self.sim_clock.end_of_day) or (
-                    not sub_is_daily and since_epoch % bar_size.seconds == 0
+                    not sub_is_daily
+                    and since_epoch % (bar_size.seconds * _NANOS_PER_SEC) == 0
                 ):
                     self._update_bar_subscribers(
                         bar_size=bar_size, contract_dict=contract_dict
@@ -208,30 +712,68 @@ class SimulationDataStreamer(ADataStreamer, ASimulationPiece):
 
     def _get_latest_time_entry(
         self, contract: AContract, bar_size: timedelta
-    ) -> pd.Series:
-        bar_data = self._get_data(contract=contract, bar_size=bar_size)
-        curr_dt = self.sim_clock.datetime
+    ) -> Union[pd.Series, Bar]:
+        bar_arrays = self._get_bar_arrays(contract=contract, bar_size=bar_size)
+        now = self.sim_clock.datetime_ns
         if is_daily(bar_size=bar_size):
-            bar = bar_data.loc[pd.to_datetime(curr_dt.date())]
+            ts = now - now % _NANOS_PER_DAY
         else:
-            curr_dt -= bar_size
-            bar = bar_data.loc[curr_dt]
+            ts = now - bar_size.seconds * _NANOS_PER_SEC
+        idx = bar_arrays.find(ts=ts)
+        if idx is None:
+            raise KeyError(pd.Timestamp(ts))
+        bar = self._make_bar(bar_arrays=bar_arrays, idx=idx)
         return bar
 
     def _get_next_bar(
         self, contract: AContract, bar_size: timedelta,
-    ) -> pd.Series:
-        bar_data = self._get_data(contract=contract, bar_size=bar_size)
-        curr_dt = self.sim_clock.datetime
+    ) -> Union[pd.Series, Bar]:
+        bar_arrays = self._get_bar_arrays(contract=contract, bar_size=bar_size)
+        now = self.sim_clock.datetime_ns
         if is_daily(bar_size=bar_size):
-            curr_dt += bar_size
-            while curr_dt.date() not in bar_data.index:
-                curr_dt += bar_size
-            bar = bar_data.loc[curr_dt.date()]
+            idx = bar_arrays.find_after(ts=now - now % _NANOS_PER_DAY)
+        else:
+            if self.sim_clock.end_of_day:
+                # at the session close, the next bar opens the next session
+                now = self._get_next_session_open()
+            idx = bar_arrays.find(ts=now)
+        if idx is None:
+            raise KeyError(pd.Timestamp(now))
+        bar = self._make_bar(bar_arrays=bar_arrays, idx=idx)
+        return bar
+
+    def _get_next_session_open(self) -> int:
+        next_date = get_next_trading_date(base_date=self.sim_clock.date)
+        calendar = get_trading_calendar(
+            start_date=next_date, end_date=next_date,
+        )
+        _, opens, _ = calendar.get_schedule_arrays(
+            start_date=next_date, end_date=next_date,
+        )
+        return int(opens[0])
+
+    def _make_bar(
+        self, bar_arrays: _BarArrays, idx: int,
+    ) -> Union[pd.Series, Bar]:
+        if self._bar_records:
+            bar = bar_arrays.get_record(idx=idx)
         else:
-            bar = bar_data.loc[curr_dt]
+            bar = bar_arrays.get_series(idx=idx)
         return bar
 
+    def _get_bar_arrays(
+        self, contract: AContract, bar_size: timedelta,
+    ) -> _BarArrays:
+        contract_arrays = self._bar_arrays.setdefault(contract, {})
+        bar_arrays = contract_arrays.get(bar_size)
+
+        if bar_arrays is None:
+            bar_data = self._get_data(contract=contract, bar_size=bar_size)
+            bar_arrays = _BarArrays(data=bar_data)
+            contract_arrays[bar_size] = bar_arrays
+
+        return bar_arrays
+
     def _get_data(
         self, contract: AContract, bar_size: timedelta,
     ) -> pd.DataFrame:
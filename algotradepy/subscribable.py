@@ -8,6 +8,10 @@ class Subscribable:
 
     Classes inheriting from the Subscribable class can have their public methods
     subscribed to by other other objects.
+
+    Subscribing to a method installs a wrapper calling the callbacks on the
+    instance, which is removed once the last callback is unsubscribed. The
+    access to the other attributes is left untouched.
     """
 
     def __init__(self):
@@ -49,6 +53,7 @@ class Subscribable:
             self._subscriptions[target_fn_name] = {
                 callback: (include_target_args, callback_kwargs),
             }
+            self._install_wrapper(attr_name=target_fn_name)
 
     def unsubscribe(self, target_fn: Callable, callback: Callable):
         """Unsubscribe from target method.
@@ -63,8 +68,12 @@ class Subscribable:
         target_fn = self._validate_target(target_fn=target_fn)
         target_fn_name = target_fn.__name__
         if target_fn_name in self._subscriptions:
-            if callback in self._subscriptions[target_fn_name]:
-                del self._subscriptions[target_fn_name][callback]
+            callbacks = self._subscriptions[target_fn_name]
+            if callback in callbacks:
+                del callbacks[callback]
+            if len(callbacks) == 0:
+                del self._subscriptions[target_fn_name]
+                del self.__dict__[target_fn_name]
 
     def _validate_target(self, target_fn: Callable) -> Callable:
         if ismethod(target_fn):
@@ -85,36 +94,20 @@ class Subscribable:
             )
         return target_fn
 
-    def __getattribute__(self, item):
-        try:
-            _subscriptions = super().__getattribute__("_subscriptions")
-        except AttributeError:
-            _subscriptions = None
-        attr = super().__getattribute__(item)
-
-        if (
-            _subscriptions is not None
-            and not item.startswith("_")
-            and ismethod(attr)
-            and item in _subscriptions
-        ):
-            attr = self._wrap_attr(attr=attr)
-
-        return attr
-
-    def _wrap_attr(self, attr):
-        attr_name = attr.__name__
+    def _install_wrapper(self, attr_name: str):
+        # the instance attribute shadows the method of the class
+        attr = getattr(self, attr_name)
         callbacks = self._subscriptions[attr_name]
-        attr_fn = attr.__func__
 
         @wraps(attr)
         def execute_attr(*args, **kwargs):
-            attr_fn(self, *args, **kwargs)
-            for callback, params in callbacks.items():
+            res = attr(*args, **kwargs)
+            for callback, params in list(callbacks.items()):
                 include_target_args, callback_kwargs = params
                 if include_target_args:
                     callback(*args, **kwargs, **callback_kwargs)
                 else:
                     callback(**callback_kwargs)
+            return res
 
-        return execute_attr
+        self.__dict__[attr_name] = execute_attr
@@ -1,38 +1,245 @@
+import threading
 from datetime import date, time, timedelta, datetime
-from typing import List
+from pathlib import Path
+from typing import List, Optional, Tuple
 
-import pandas_market_calendars as pmc
+import numpy as np
 import pandas as pd
 
+from algotradepy.path_utils import PROJECT_DIR
+
+CALENDAR_CACHE_PATH = PROJECT_DIR / "histData" / "nyse_calendar.npz"
+_CALENDAR_START = date(1990, 1, 1)
+_CALENDAR_END = date(2035, 12, 31)
+_CALENDAR_TZ = "America/New_York"
+
+
+class TradingCalendar:
+    """The NYSE trading calendar.
+
+    The schedule is held as numpy arrays of session dates and UTC open and
+    close times (nanoseconds since the epoch), and date-range queries are
+    answered by binary search.
+
+    Parameters
+    ----------
+    dates : numpy.ndarray
+        The session dates, as `datetime64[D]`.
+    opens : numpy.ndarray
+        The session open times in nanoseconds since the epoch.
+    closes : numpy.ndarray
+        The session close times in nanoseconds since the epoch.
+    tz : str, default "America/New_York"
+        The exchange time zone.
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        opens: np.ndarray,
+        closes: np.ndarray,
+        tz: str = _CALENDAR_TZ,
+    ):
+        self._dates = dates.astype("datetime64[D]")
+        self._opens = opens.astype(np.int64)
+        self._closes = closes.astype(np.int64)
+        self._tz = tz
+        self._local_opens = self._to_local(ts=self._opens)
+        self._local_closes = self._to_local(ts=self._closes)
+
+    @classmethod
+    def from_market_calendars(
+        cls,
+        start_date: date = _CALENDAR_START,
+        end_date: date = _CALENDAR_END,
+    ) -> "TradingCalendar":
+        """Build the calendar using `pandas_market_calendars`."""
+        import pandas_market_calendars as pmc
+
+        nyse = pmc.get_calendar("NYSE")
+        schedule = nyse.schedule(start_date=start_date, end_date=end_date)
+        calendar = cls(
+            dates=schedule.index.values.astype("datetime64[D]"),
+            opens=schedule["market_open"].values.view(np.int64),
+            closes=schedule["market_close"].values.view(np.int64),
+        )
+        return calendar
+
+    @classmethod
+    def load(cls, file_path: Path) -> "TradingCalendar":
+        """Load a calendar saved with :meth:`save`."""
+        with np.load(Path(file_path)) as arrays:
+            calendar = cls(
+                dates=arrays["dates"],
+                opens=arrays["opens"],
+                closes=arrays["closes"],
+                tz=str(arrays["tz"]),
+            )
+        return calendar
+
+    def save(self, file_path: Path):
+        """Save the calendar to a `.npz` file."""
+        np.savez(
+            Path(file_path),
+            dates=self._dates,
+            opens=self._opens,
+            closes=self._closes,
+            tz=np.array(self._tz),
+        )
+
+    @property
+    def first_date(self) -> date:
+        return self._dates[0].tolist()
+
+    @property
+    def last_date(self) -> date:
+        return self._dates[-1].tolist()
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        covered = self.first_date <= start_date and end_date <= self.last_date
+        return covered
+
+    def get_trading_days(self, start_date: date, end_date: date) -> List[date]:
+        start_idx, end_idx = self._get_range(
+            start_date=start_date, end_date=end_date,
+        )
+        dates = self._dates[start_idx:end_idx].tolist()
+        return dates
+
+    def get_schedule_arrays(
+        self, start_date: date, end_date: date,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the schedule between two dates, inclusive.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The session dates (`datetime64[D]`), and the open and close times
+            as exchange-local (time zone naive) nanoseconds since the epoch.
+        """
+        start_idx, end_idx = self._get_range(
+            start_date=start_date, end_date=end_date,
+        )
+        arrays = (
+            self._dates[start_idx:end_idx],
+            self._local_opens[start_idx:end_idx],
+            self._local_closes[start_idx:end_idx],
+        )
+        return arrays
+
+    def get_next_trading_date(self, base_date: date) -> date:
+        """Get the trading date following the first one on or after a date."""
+        idx = np.searchsorted(
+            self._dates, np.datetime64(base_date, "D"), side="left",
+        )
+        target_date = self._dates[idx + 1].tolist()
+        return target_date
+
+    def _get_range(self, start_date: date, end_date: date) -> Tuple[int, int]:
+        start_idx = np.searchsorted(
+            self._dates, np.datetime64(start_date, "D"), side="left",
+        )
+        end_idx = np.searchsorted(
+            self._dates, np.datetime64(end_date, "D"), side="right",
+        )
+        return start_idx, end_idx
+
+    def _to_local(self, ts: np.ndarray) -> np.ndarray:
+        local_ts = (
+            pd.DatetimeIndex(ts.view("datetime64[ns]"))
+            .tz_localize("UTC")
+            .tz_convert(self._tz)
+            .tz_localize(None)
+            .asi8
+        )
+        return local_ts
+
+
+_calendar: Optional[TradingCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar(
+    start_date: Optional[date] = None, end_date: Optional[date] = None,
+) -> TradingCalendar:
+    """Get the process-wide trading calendar.
+
+    On first use, the calendar is loaded from `CALENDAR_CACHE_PATH` if it
+    exists, in which case `pandas_market_calendars` is not imported, and is
+    built for 1990 through 2035 otherwise. It is rebuilt if a query falls
+    outside of the dates it covers.
+
+    Parameters
+    ----------
+    start_date : datetime.date, optional, default None
+    end_date : datetime.date, optional, default None
+        The date range that the calendar must cover.
+    """
+    global _calendar
+
+    with _calendar_lock:
+        if _calendar is None and CALENDAR_CACHE_PATH.exists():
+            _calendar = TradingCalendar.load(file_path=CALENDAR_CACHE_PATH)
+
+        start_date = start_date or _CALENDAR_START
+        end_date = end_date or _CALENDAR_END
+        if _calendar is None or not _calendar.covers(
+            start_date=start_date, end_date=end_date,
+        ):
+            if _calendar is not None:
+                start_date = min(start_date, _calendar.first_date)
+                end_date = max(end_date, _calendar.last_date)
+            _calendar = TradingCalendar.from_market_calendars(
+                start_date=min(start_date, _CALENDAR_START),
+                end_date=max(end_date, _CALENDAR_END),
+            )
+
+        calendar = _calendar
+
+    return calendar
+
+
+def set_trading_calendar(calendar: Optional[TradingCalendar]):
+    """Set the process-wide trading calendar.
+
+    Setting it to `None` resets it, and it is rebuilt on next use.
+    """
+    global _calendar
+
+    with _calendar_lock:
+        _calendar = calendar
+
 
 def generate_trading_days(start_date: date, end_date: date) -> List[date]:
-    nyse = pmc.get_calendar("NYSE")
-    schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-    dates = schedule.index.date.tolist()
+    calendar = get_trading_calendar(start_date=start_date, end_date=end_date)
+    dates = calendar.get_trading_days(start_date=start_date, end_date=end_date)
     return dates
 
 
 def generate_trading_schedule(
     start_date: date, end_date: date,
 ) -> pd.DataFrame:
-    nyse = pmc.get_calendar("NYSE")
-    schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-    schedule.loc[:, "market_open"] = schedule["market_open"].apply(
-        lambda x: x.tz_convert("America/New_York").time()
+    calendar = get_trading_calendar(start_date=start_date, end_date=end_date)
+    dates, opens, closes = calendar.get_schedule_arrays(
+        start_date=start_date, end_date=end_date,
     )
-    schedule.loc[:, "market_close"] = schedule["market_close"].apply(
-        lambda x: x.tz_convert("America/New_York").time()
+    schedule = pd.DataFrame(
+        data={
+            "market_open": pd.DatetimeIndex(opens.view("datetime64[ns]")).time,
+            "market_close": pd.DatetimeIndex(
+                closes.view("datetime64[ns]")
+            ).time,
+        },
+        index=dates.tolist(),
     )
-    schedule.index = schedule.index.date
     return schedule
 
 
 def get_next_trading_date(base_date: date) -> date:
-    end_date = base_date + timedelta(days=5)
-    schedule = generate_trading_schedule(
-        start_date=base_date, end_date=end_date,
+    calendar = get_trading_calendar(
+        start_date=base_date, end_date=base_date + timedelta(days=10),
     )
-    target_date = schedule.iloc[1].name
+    target_date = calendar.get_next_trading_date(base_date=base_date)
     return target_date
 
 
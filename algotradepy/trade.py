@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 
 from algotradepy.contracts import AContract
 from algotradepy.orders import AnOrder
@@ -42,6 +42,14 @@ class TradeStatus(ReprAble, Comparable):
         The associated order's ID.
     """
 
+    __slots__ = (
+        "_order_id",
+        "_state",
+        "_filled",
+        "_remaining",
+        "_ave_fill_price",
+    )
+
     def __init__(
         self,
         state: TradeState,
@@ -78,6 +86,16 @@ class TradeStatus(ReprAble, Comparable):
     def ave_fill_price(self) -> float:
         return self._ave_fill_price
 
+    def _make_key(self) -> Tuple:
+        key = (
+            self._order_id,
+            self._state,
+            self._filled,
+            self._remaining,
+            self._ave_fill_price,
+        )
+        return key
+
 
 class Trade(ReprAble):
     """This class defines a trade.
@@ -92,6 +110,8 @@ class Trade(ReprAble):
         The status of the trade.
     """
 
+    __slots__ = ("_contract", "_order", "_status")
+
     def __init__(
         self,
         contract: AContract,
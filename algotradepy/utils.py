@@ -1,8 +1,10 @@
 import collections.abc
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 class ReprAble:
+    __slots__ = ()
+
     def __repr__(self):
         class_name = type(self).__name__
         public_args = [
@@ -20,29 +22,79 @@ class ReprAble:
 
 
 class Comparable:
+    """Compares and hashes objects on a key made of their fields.
+
+    The key is computed once, on first use, and cached along with its hash,
+    so that objects used as dictionary keys are hashed and compared in
+    constant time. Subclasses can override `_make_key` to build the key
+    from their fields directly instead of from their public attributes, and
+    must call `_reset_key` before one of those fields changes.
+
+    Once an object has been hashed, it may be a key of a dictionary or a
+    member of a set, where it could no longer be found if its key changed.
+    `_reset_key` therefore raises an AttributeError for hashed objects,
+    making the fields of the key read-only from then on.
+
+    The cached hash is not pickled, since the hashes of strings differ
+    between processes.
+    """
+
+    __slots__ = ("_key", "_hash")
+
+    def __getstate__(self):
+        state = getattr(self, "__dict__", {}).copy()
+        for cls in type(self).__mro__:
+            for attr in cls.__dict__.get("__slots__", ()):
+                if attr not in Comparable.__slots__ and hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
+        return state
+
+    def __setstate__(self, state):
+        for attr, value in state.items():
+            object.__setattr__(self, attr, value)
+
     def __hash__(self):
-        public_args = [
-            arg for arg in self.__dir__() if not arg.startswith("_")
-        ]
-        h = hash(tuple(public_args))
+        try:
+            h = self._hash
+        except AttributeError:
+            h = hash(self._get_key())
+            self._hash = h
         return h
 
     def __eq__(self, other):
-        equal = True
-
-        if type(self) != type(other):
+        if self is other:
+            equal = True
+        elif type(self) != type(other):
             equal = False
         else:
-            public_args = [
-                arg for arg in self.__dir__() if not arg.startswith("_")
-            ]
-            for arg in public_args:
-                if self.__getattribute__(arg) != other.__getattribute__(arg):
-                    equal = False
-                    break
+            equal = self._get_key() == other._get_key()
 
         return equal
 
+    def _get_key(self) -> Tuple:
+        try:
+            key = self._key
+        except AttributeError:
+            key = self._make_key()
+            self._key = key
+        return key
+
+    def _make_key(self) -> Tuple:
+        public_args = [
+            arg for arg in self.__dir__() if not arg.startswith("_")
+        ]
+        key = tuple(self.__getattribute__(arg) for arg in public_args)
+        return key
+
+    def _reset_key(self):
+        if hasattr(self, "_hash"):
+            raise AttributeError(
+                f"Cannot modify a {type(self).__name__} once it has been"
+                f" hashed."
+            )
+        if hasattr(self, "_key"):
+            del self._key
+
 
 def recursive_dict_update(
     receiver: Dict[Any, Any], updater: Dict[Any, Any],
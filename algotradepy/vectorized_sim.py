@@ -0,0 +1,147 @@
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+
+class VectorizedSimResult:
+    """The result of a vectorized simulation.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The per-bar simulation data, indexed like the simulated bars, with
+        the columns `target`, `fill_qty`, `fill_price`, `fee`, `position`,
+        `cash` and `equity`.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self._data = data
+
+    @property
+    def data(self) -> pd.DataFrame:
+        return self._data
+
+    @property
+    def fills(self) -> pd.DataFrame:
+        """The fills, indexed by the bar at the open of which they occurred.
+
+        The `fill_qty` column is positive for buys and negative for sells.
+        """
+        data = self._data
+        fills = data.loc[
+            data["fill_qty"] != 0, ["fill_qty", "fill_price", "fee"]
+        ]
+        return fills
+
+    @property
+    def positions(self) -> pd.Series:
+        return self._data["position"]
+
+    @property
+    def cash(self) -> pd.Series:
+        return self._data["cash"]
+
+    @property
+    def equity(self) -> pd.Series:
+        """The value of the cash and of the position at each bar's close."""
+        return self._data["equity"]
+
+
+class VectorizedSimulator:
+    """A vectorized back-testing engine.
+
+    Simulates a strategy expressed as a target position for each bar with
+    array operations over the whole bar history, instead of stepping a
+    :class:`~algotradepy.sim_utils.SimulationRunner` bar by bar. Suited for
+    strategies that are a pure function of the price history, e.g. for
+    screening parameter values before running the full simulation.
+
+    The fills follow the market-on-next-open semantics of the
+    :class:`~algotradepy.brokers.sim_broker.SimulationBroker`: the target
+    position computed at the close of a bar is reached with a market order
+    filled at the open of the next bar. The bars are taken as contiguous:
+    if a bar is missing from `bars`, the order is filled at the open of the
+    following bar, whereas the simulation broker raises a `KeyError` for
+    the missing bar.
+
+    Parameters
+    ----------
+    starting_funds : float
+        The funds with which the simulation will begin.
+    transaction_cost : float, default 0
+        The cost of each transaction.
+    """
+
+    def __init__(self, starting_funds: float, transaction_cost: float = 0):
+        self._starting_funds = starting_funds
+        self._abs_fee = transaction_cost
+
+    def run(
+        self,
+        bars: pd.DataFrame,
+        signal: Union[
+            Callable[[pd.DataFrame], Union[pd.Series, np.ndarray]],
+            pd.Series,
+            np.ndarray,
+        ],
+    ) -> VectorizedSimResult:
+        """Run the simulation.
+
+        Parameters
+        ----------
+        bars : pandas.DataFrame
+            The bars data of a contract, as retrieved with the
+            :class:`~algotradepy.historical.loaders.HistoricalRetriever`.
+        signal : Callable or pandas.Series or numpy.ndarray
+            The target position (number of shares) at the close of each bar,
+            or a function computing it from `bars`. The missing values are
+            treated as a flat position.
+
+        Returns
+        -------
+        VectorizedSimResult
+            The fills, positions, cash and equity curves.
+        """
+        if callable(signal):
+            signal = signal(bars)
+        if isinstance(signal, pd.Series):
+            signal = signal.reindex(bars.index)
+        target = np.nan_to_num(np.asarray(signal, dtype=np.float64))
+
+        if len(target) != len(bars):
+            raise ValueError(
+                f"The signal has {len(target)} values for {len(bars)} bars."
+            )
+
+        opens = bars["open"].to_numpy(dtype=np.float64)
+        closes = bars["close"].to_numpy(dtype=np.float64)
+
+        # the order placed at the close of bar i is filled at the open of i+1
+        orders = np.diff(target, prepend=0)
+        fill_qty = np.zeros(len(target))
+        fill_qty[1:] = orders[:-1]
+        filled = fill_qty != 0
+        fill_price = np.where(filled, opens, np.nan)
+        fees = np.where(filled, self._abs_fee, 0)
+
+        position = np.cumsum(fill_qty)
+        cash_deltas = -np.where(filled, fill_qty * opens, 0) - fees
+        cash = self._starting_funds + np.cumsum(cash_deltas)
+        equity = cash + position * closes
+
+        data = pd.DataFrame(
+            data={
+                "target": target,
+                "fill_qty": fill_qty,
+                "fill_price": fill_price,
+                "fee": fees,
+                "position": position,
+                "cash": cash,
+                "equity": equity,
+            },
+            index=bars.index,
+        )
+        result = VectorizedSimResult(data=data)
+
+        return result
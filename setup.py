@@ -33,6 +33,8 @@ setup(
     extras_require={
         "ibapi": ["ib_insync >=0.9, <1", "ibapi"],
         "polygon": ["websocket-client==0.57.0"],
+        "parquet": ["pyarrow"],
+        "fastjson": ["msgspec", "orjson"],
         "dev": [
             "pytest",
             "pylint",
@@ -1,12 +1,22 @@
+from datetime import timedelta, datetime, date
+
 import pytest
 import numpy as np
 
 from algotradepy.brokers.sim_broker import SimulationBroker, DEFAULT_SIM_ACC
 from algotradepy.contracts import StockContract, Currency
+from algotradepy.historical.loaders import HistoricalRetriever
 from algotradepy.objects import Position
-from algotradepy.orders import MarketOrder, OrderAction, LimitOrder
+from algotradepy.orders import (
+    MarketOrder,
+    OrderAction,
+    LimitOrder,
+    TrailingStopOrder,
+)
+from algotradepy.sim_utils import SimulationClock, SimulationRunner
 from algotradepy.streamers.sim_streamer import SimulationDataStreamer
 from algotradepy.trade import Trade, TradeState
+from tests.conftest import TEST_DATA_DIR
 
 
 def test_simulation_broker_init():
@@ -116,7 +126,7 @@ def test_simulation_broker_limit_order(sim_broker_runner_and_streamer_15m):
     assert len(broker.open_trades) == 0
 
     contract = StockContract(symbol="SPY")
-    order = LimitOrder(action=OrderAction.SELL, quantity=2, limit_price=99,)
+    order = LimitOrder(action=OrderAction.BUY, quantity=2, limit_price=99,)
     trade = Trade(contract=contract, order=order)
 
     runner.run_sim(step_count=1)
@@ -126,7 +136,7 @@ def test_simulation_broker_limit_order(sim_broker_runner_and_streamer_15m):
     assert trade.status.state == TradeState.SUBMITTED
 
     broker.simulate_trade_execution(
-        trade=trade, price=100, n_shares=1,
+        trade=trade, price=98, n_shares=1,
     )
 
     # does not update without sim step
@@ -139,7 +149,7 @@ def test_simulation_broker_limit_order(sim_broker_runner_and_streamer_15m):
     assert trade.status.remaining == 1
 
     broker.simulate_trade_execution(
-        trade=trade, price=100, n_shares=1,
+        trade=trade, price=98, n_shares=1,
     )
 
     runner.run_sim(step_count=1)
@@ -149,6 +159,93 @@ def test_simulation_broker_limit_order(sim_broker_runner_and_streamer_15m):
     assert trade.status.remaining == 0
 
 
+def test_simulation_broker_limit_order_matching(
+    sim_broker_runner_and_streamer_15m,
+):
+    broker, runner, streamer = sim_broker_runner_and_streamer_15m
+    contract = StockContract(symbol="SPY")
+    bars = []
+    streamer.subscribe_to_bars(
+        contract=contract, bar_size=timedelta(minutes=15), func=bars.append,
+    )
+
+    runner.run_sim(step_count=1)
+
+    sell_limit = 262
+    _, sell_trade = broker.place_trade(
+        trade=Trade(
+            contract=contract,
+            order=LimitOrder(
+                action=OrderAction.SELL, quantity=1, limit_price=sell_limit,
+            ),
+        ),
+    )
+    _, far_trade = broker.place_trade(
+        trade=Trade(
+            contract=contract,
+            order=LimitOrder(
+                action=OrderAction.SELL, quantity=1, limit_price=1_000,
+            ),
+        ),
+    )
+    _, cancelled_trade = broker.place_trade(
+        trade=Trade(
+            contract=contract,
+            order=LimitOrder(
+                action=OrderAction.SELL, quantity=1, limit_price=1,
+            ),
+        ),
+    )
+    broker.cancel_trade(trade=cancelled_trade)
+
+    runner.run_sim(step_count=1)
+
+    while sell_trade.status.state != TradeState.FILLED:
+        assert bars[-1]["high"] < sell_limit
+        runner.run_sim(step_count=1)
+
+    # filled against the 12:15 bar, completed at this step
+    assert bars[-1].name == datetime(2020, 4, 6, 12, 15)
+    assert sell_trade.status.ave_fill_price == sell_limit
+    assert far_trade.status.state == TradeState.SUBMITTED
+    assert broker.get_position(contract=contract) == -1
+    assert len(broker.open_trades) == 1
+
+
+def test_simulation_broker_trailing_stop(sim_broker_runner_and_streamer_15m):
+    broker, runner, streamer = sim_broker_runner_and_streamer_15m
+    contract = StockContract(symbol="SPY")
+    bars = []
+    streamer.subscribe_to_bars(
+        contract=contract, bar_size=timedelta(minutes=15), func=bars.append,
+    )
+
+    runner.run_sim(step_count=1)
+
+    trail = 2
+    _, trade = broker.place_trade(
+        trade=Trade(
+            contract=contract,
+            order=TrailingStopOrder(
+                action=OrderAction.SELL, quantity=1, aux_price=trail,
+            ),
+        ),
+    )
+    start_idx = len(bars)
+
+    while trade.status.state != TradeState.FILLED:
+        runner.run_sim(step_count=1)
+
+    stop_price = bars[start_idx]["open"] - trail
+    for bar in bars[start_idx:-1]:
+        assert bar["low"] > stop_price
+        stop_price = max(stop_price, bar["high"] - trail)
+
+    assert bars[-1]["low"] <= stop_price
+    assert trade.status.ave_fill_price == min(stop_price, bars[-1]["open"])
+    assert broker.get_position(contract=contract) == -1
+
+
 def test_subscribe_to_position_updates():
     con = StockContract(symbol="SPY")
     pos = Position(
@@ -205,3 +302,74 @@ def test_subscribe_to_position_updates():
     assert updated_pos.position == 12
     assert updated_pos.ave_fill_price == target_ave_price
     assert updated_pos.account == DEFAULT_SIM_ACC
+
+
+def test_simulation_broker_limit_order_matching_ticks():
+    sim_clock = SimulationClock(
+        start_date=date(2020, 6, 17),
+        end_date=date(2020, 6, 17),
+        simulation_time_step=timedelta(seconds=1),
+    )
+    hist_retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    streamer = SimulationDataStreamer(historical_retriever=hist_retriever)
+    broker = SimulationBroker(
+        sim_streamer=streamer, starting_funds={Currency.USD: 1_000},
+    )
+    runner = SimulationRunner(
+        sim_clock=sim_clock,
+        data_providers=[streamer],
+        data_consumers=[broker],
+    )
+    contract = StockContract(symbol="SPY")
+    records = hist_retriever.get_cached_tick_records(
+        contract=contract, date_=date(2020, 6, 17), bar_size=timedelta(0),
+    )
+
+    runner.run_sim(step_count=1)
+
+    placed_ns = sim_clock.datetime_ns
+    _, trade = broker.place_trade(
+        trade=Trade(
+            contract=contract,
+            order=LimitOrder(
+                action=OrderAction.BUY, quantity=1, limit_price=1_000,
+            ),
+        ),
+    )
+
+    while trade.status.state != TradeState.FILLED:
+        runner.run_sim(step_count=1)
+
+    # filled at the first ask quoted after the order was placed
+    first_ask = records["ask"][records["timestamp"] >= placed_ns][0]
+
+    assert trade.status.ave_fill_price == first_ask
+
+
+def test_trades_and_open_trades(sim_broker_runner_and_streamer_15m):
+    broker, runner, _ = sim_broker_runner_and_streamer_15m
+    contract = StockContract(symbol="SPY")
+    placed = []
+
+    for limit_price in range(1, 6):
+        order = LimitOrder(
+            action=OrderAction.BUY, quantity=1, limit_price=limit_price,
+        )
+        _, trade = broker.place_trade(
+            trade=Trade(contract=contract, order=order),
+        )
+        placed.append(trade)
+    _, mkt_trade = broker.place_trade(
+        trade=get_1_spy_mkt_trade(buy=True),
+    )
+
+    broker.cancel_trade(trade=placed[1])
+    runner.run_sim(step_count=1)
+
+    trades = broker.trades
+    open_trades = broker.open_trades
+
+    assert [trade.order.order_id for trade in trades] == list(range(1, 7))
+    assert trades[1].status.state == TradeState.CANCELLED
+    assert trades[5].status.state == TradeState.FILLED
+    assert open_trades == [placed[0]] + placed[2:]
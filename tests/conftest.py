@@ -1,4 +1,5 @@
 import os
+import shutil
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -15,6 +16,14 @@ PROJECT_DIR = CURRENT_DIR.parent
 TEST_DATA_DIR = CURRENT_DIR / "test_hist_data"
 
 
+@pytest.fixture
+def test_data_copy_dir(tmpdir) -> Path:
+    """A copy of the test data, for the tests writing to the cache."""
+    data_dir = Path(tmpdir) / "test_hist_data"
+    shutil.copytree(TEST_DATA_DIR, data_dir)
+    return data_dir
+
+
 @pytest.fixture
 def sim_broker_runner_and_streamer_15m():
     sim_clock = SimulationClock(
@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotradepy.connectors import fast_json
+
+
+def _make_page(n_trades: int) -> bytes:
+    results = [
+        {
+            "t": 1595857800006463344 + i,
+            "y": 1595857800006463244 + i,
+            "q": 1000 + i,
+            "i": str(i),
+            "x": i % 17,
+            "s": 100 + i,
+            "c": [12, 37],
+            "p": 1448.59 + i / 100,
+            "z": 3,
+        }
+        for i in range(n_trades)
+    ]
+    page = json.dumps({"results": results, "success": True}).encode()
+    return page
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_decode_trades_page(monkeypatch, typed):
+    if not typed:
+        monkeypatch.setattr(fast_json, "_trades_page_decoder", None)
+    elif fast_json._trades_page_decoder is None:
+        pytest.skip("msgspec not installed.")
+
+    page = _make_page(n_trades=10)
+    expected = json.loads(page)["results"]
+
+    data = fast_json.decode_trades_page(page)
+
+    assert list(data.columns) == list(fast_json.TRADE_COLUMNS)
+    assert data["t"].dtype == np.int64
+    assert data["p"].dtype == np.float64
+    assert data["t"].tolist() == [trade["t"] for trade in expected]
+    assert data["x"].tolist() == [trade["x"] for trade in expected]
+    assert data["s"].tolist() == [trade["s"] for trade in expected]
+    assert data["p"].tolist() == [trade["p"] for trade in expected]
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_decode_empty_trades_page(monkeypatch, typed):
+    if not typed:
+        monkeypatch.setattr(fast_json, "_trades_page_decoder", None)
+
+    data = fast_json.decode_trades_page(b'{"success": true}')
+
+    assert len(data) == 0
+    assert list(data.columns) == list(fast_json.TRADE_COLUMNS)
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_decode_trades_page_missing_exchange(monkeypatch, typed):
+    if not typed:
+        monkeypatch.setattr(fast_json, "_trades_page_decoder", None)
+    elif fast_json._trades_page_decoder is None:
+        pytest.skip("msgspec not installed.")
+
+    page = json.loads(_make_page(n_trades=2))
+    del page["results"][1]["x"]
+
+    data = fast_json.decode_trades_page(json.dumps(page).encode())
+
+    assert data["x"].tolist() == [0, -1]  # 0 is a valid exchange id
+    assert data["x"].dtype == np.int64
+
+
+def test_decode_trades_page_typed_matches_fallback(monkeypatch):
+    if fast_json._trades_page_decoder is None:
+        pytest.skip("msgspec not installed.")
+
+    page = json.loads(_make_page(n_trades=10))
+    del page["results"][1]["x"]
+    del page["results"][2]["y"]
+    del page["results"][3]["q"]
+    content = json.dumps(page).encode()
+
+    typed = fast_json.decode_trades_page(content)
+    monkeypatch.setattr(fast_json, "_trades_page_decoder", None)
+    fallback = fast_json.decode_trades_page(content)
+
+    pd.testing.assert_frame_equal(typed, fallback)
+    assert typed.dtypes.to_dict() == fast_json.TRADE_COLUMNS
+
+
+def test_loads():
+    frame = '[{"ev": "T", "sym": "SPY", "p": 330.1, "s": 100}]'
+
+    assert fast_json.loads(frame) == json.loads(frame)
+    assert fast_json.loads(frame.encode()) == json.loads(frame)
@@ -0,0 +1,128 @@
+import json
+import threading
+import time
+
+import pytest
+
+from algotradepy.connectors.frame_buffer import FrameBuffer, OverflowPolicy
+
+
+def _make_frame(*symbols) -> str:
+    frame = json.dumps([{"ev": "T", "sym": sym, "p": i} for i, sym in symbols])
+    return frame
+
+
+def _get_coalesce_key(event):
+    return event["sym"]
+
+
+def test_frame_buffer_fifo():
+    buffer = FrameBuffer(capacity=3, parse=json.loads)
+
+    buffer.put(frame=_make_frame((0, "SPY")))
+    buffer.put(frame=_make_frame((1, "QQQ"), (2, "SPY")))
+
+    assert buffer.depth == 2
+    assert buffer.get_events() == [{"ev": "T", "sym": "SPY", "p": 0}]
+    assert len(buffer.get_events()) == 2
+    assert buffer.get_events(timeout=0.01) is None
+
+
+def test_frame_buffer_drop_oldest():
+    buffer = FrameBuffer(
+        capacity=2,
+        parse=json.loads,
+        overflow_policy=OverflowPolicy.DROP_OLDEST,
+    )
+
+    for i in range(5):
+        buffer.put(frame=_make_frame((i, "SPY")))
+
+    assert buffer.get_events()[0]["p"] == 3
+    assert buffer.get_events()[0]["p"] == 4
+
+    stats = buffer.get_stats()
+
+    assert stats["received_frames"] == 5
+    assert stats["dropped_frames"] == 3
+    assert stats["max_depth"] == 2
+
+
+def test_frame_buffer_coalesce_latest():
+    buffer = FrameBuffer(
+        capacity=2,
+        parse=json.loads,
+        overflow_policy=OverflowPolicy.COALESCE_LATEST,
+        coalesce_key=_get_coalesce_key,
+    )
+
+    buffer.put(frame=_make_frame((0, "SPY"), (1, "QQQ")))
+    buffer.put(frame=_make_frame((2, "SPY")))
+    buffer.put(frame=_make_frame((3, "QQQ")))
+
+    assert buffer.get_events() == [
+        {"ev": "T", "sym": "QQQ", "p": 1},
+        {"ev": "T", "sym": "SPY", "p": 2},
+    ]
+    assert buffer.get_events() == [{"ev": "T", "sym": "QQQ", "p": 3}]
+    assert buffer.get_stats()["coalesced_events"] == 1
+
+    with pytest.raises(ValueError):
+        FrameBuffer(
+            capacity=2,
+            parse=json.loads,
+            overflow_policy=OverflowPolicy.COALESCE_LATEST,
+        )
+
+
+def test_frame_buffer_block():
+    buffer = FrameBuffer(capacity=1, parse=json.loads)
+    buffer.put(frame=_make_frame((0, "SPY")))
+
+    producer = threading.Thread(
+        target=buffer.put, kwargs={"frame": _make_frame((1, "SPY"))},
+    )
+    producer.start()
+    time.sleep(0.05)
+
+    assert producer.is_alive()
+    assert buffer.get_events()[0]["p"] == 0
+
+    producer.join(timeout=1)
+
+    assert not producer.is_alive()
+    assert buffer.get_events()[0]["p"] == 1
+
+
+def test_frame_buffer_close():
+    buffer = FrameBuffer(capacity=1, parse=json.loads)
+    consumer_result = []
+
+    consumer = threading.Thread(
+        target=lambda: consumer_result.append(buffer.get_events()),
+    )
+    consumer.start()
+    buffer.close()
+    consumer.join(timeout=1)
+
+    assert consumer_result == [None]
+
+
+def test_frame_buffer_block_put_after_close():
+    buffer = FrameBuffer(capacity=1, parse=json.loads)
+    buffer.put(frame=_make_frame((0, "SPY")))
+
+    producer = threading.Thread(
+        target=buffer.put, kwargs={"frame": _make_frame((1, "SPY"))},
+    )
+    producer.start()
+    time.sleep(0.05)
+    buffer.close()
+    producer.join(timeout=1)
+    buffer.put(frame=_make_frame((2, "SPY")))
+
+    assert not producer.is_alive()
+    assert buffer.depth == 1
+    assert buffer.get_events()[0]["p"] == 0
+    assert buffer.get_events() is None
+    assert buffer.get_stats()["dropped_frames"] == 2
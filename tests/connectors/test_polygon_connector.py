@@ -1,3 +1,4 @@
+import json
 import threading
 import time
 from datetime import date, datetime
@@ -7,6 +8,17 @@ import pytest
 from tests.conftest import can_test_polygon
 
 
+def can_import_websocket() -> bool:
+    try:
+        import websocket
+    except ImportError:
+        can_import = False
+    else:
+        can_import = True
+
+    return can_import
+
+
 @pytest.mark.skipif(not can_test_polygon(), reason="Polygon not available.")
 def test_rest_get_exchanges(polygon_api_token):
     from algotradepy.connectors.polygon_connector import PolygonRESTConnector
@@ -175,3 +187,106 @@ def test_ws_cancel_trade(ws_conn):
     time.sleep(2)
 
     assert event is None  # no longer updating
+
+
+class _FakeWebSocket:
+    """Replays frames through the connector's message callback."""
+
+    def __init__(self, on_message):
+        self._on_message = on_message
+        self._closed = threading.Event()
+
+    def run_forever(self):
+        auth_event = {
+            "ev": "status",
+            "message": "authenticated",
+            "status": "auth_success",
+        }
+        self._closed.clear()
+        self.receive(frame=json.dumps([auth_event]))
+        self._closed.wait()
+
+    def receive(self, frame: str):
+        self._on_message(self, frame)
+
+    def send(self, data: str):
+        pass
+
+    def close(self):
+        self._closed.set()
+
+
+@pytest.mark.skipif(
+    not can_import_websocket(), reason="websocket-client not installed.",
+)
+def test_ws_sharded_dispatch():
+    from algotradepy.connectors.polygon_connector import (
+        PolygonWebSocketConnector,
+    )
+
+    symbols = ["SPY", "QQQ", "TSLA", "AAPL", "MSFT"]
+    n_frames = 200
+    conn = PolygonWebSocketConnector(api_token="token", dispatcher_threads=2)
+    fake_ws = _FakeWebSocket(on_message=conn._on_message())
+    conn._ws = fake_ws
+    received = []
+    conn.subscribe_to_trade_event(func=received.append)
+
+    conn.connect()
+    for i in range(n_frames):
+        frame = [{"ev": "T", "sym": sym, "p": i} for sym in symbols]
+        fake_ws.receive(frame=json.dumps(frame))
+
+    deadline = time.monotonic() + 5
+    while (
+        len(received) != n_frames * len(symbols)
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.01)
+    stats = conn.get_stats()
+    conn.disconnect()
+
+    assert len(received) == n_frames * len(symbols)
+    for sym in symbols:
+        prices = [event["p"] for event in received if event["sym"] == sym]
+        assert prices == list(range(n_frames))
+    assert stats["received_frames"] == n_frames + 1  # and the auth frame
+    assert stats["dropped_frames"] == 0
+    assert stats["coalesced_events"] == 0
+    assert stats["depth"] == 0
+    assert stats["shard_depth"] == 0
+    assert not conn._dispatcher_thread.is_alive()
+    assert not any(thread.is_alive() for thread in conn._shard_threads)
+    assert len(conn._shard_threads) == 2
+
+
+@pytest.mark.skipif(
+    not can_import_websocket(), reason="websocket-client not installed.",
+)
+def test_ws_reconnect():
+    from algotradepy.connectors.polygon_connector import (
+        PolygonWebSocketConnector,
+    )
+
+    conn = PolygonWebSocketConnector(api_token="token", dispatcher_threads=2)
+    fake_ws = _FakeWebSocket(on_message=conn._on_message())
+    conn._ws = fake_ws
+    received = []
+    conn.subscribe_to_trade_event(func=received.append)
+
+    conn.connect()
+    fake_ws.receive(frame=json.dumps([{"ev": "T", "sym": "SPY", "p": 0}]))
+    conn.disconnect()
+    conn.connect()
+    fake_ws.receive(frame=json.dumps([{"ev": "T", "sym": "SPY", "p": 1}]))
+
+    deadline = time.monotonic() + 5
+    while len(received) != 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stats = conn.get_stats()
+    conn.disconnect()
+
+    assert [event["p"] for event in received] == [0, 1]
+    assert stats["received_frames"] == 2  # the auth and trade frames
+    assert not conn._dispatcher_thread.is_alive()
+    assert not any(thread.is_alive() for thread in conn._shard_threads)
@@ -123,6 +123,21 @@ def test_unsubscribe(observable):
     assert res_two is None
 
 
+def test_unsubscribe_removes_wrapper(observable):
+    def callback_fn(*args, **kwargs):
+        pass
+
+    observable.subscribe(target_fn=observable.foo, callback=callback_fn)
+
+    assert observable.foo(1, two=2) == ((1,), {"two": 2})
+    assert "foo" in vars(observable)
+
+    observable.unsubscribe(target_fn=observable.foo, callback=callback_fn)
+
+    assert "foo" not in vars(observable)
+    assert observable.foo == type(observable).foo.__get__(observable)
+
+
 def test_subscribe_to_private_raises(observable):
     def callback_fn():
         pass
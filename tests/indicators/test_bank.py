@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from algotradepy.indicators.bank import IndicatorBank, SMABank
+from algotradepy.indicators.ma import SMA, EMA
+from algotradepy.indicators.macd import MACD
+from algotradepy.indicators.rsi import RSI
+
+
+def _assert_equal_values(bank_value, value):
+    assert (np.isnan(bank_value) and np.isnan(value)) or np.isclose(
+        bank_value, value, rtol=1e-12,
+    )
+
+
+def test_indicator_bank_matches_indicators():
+    keys = ["SPY", "QQQ", "SCHW", "AAPL"]
+    rng = np.random.default_rng(0)
+    feed = rng.normal(100, 5, (80, len(keys)))
+    feed[rng.random(feed.shape) < 0.2] = np.nan  # missing bars
+
+    bank = IndicatorBank(keys=keys)
+    bank.add_sma(name="sma", n_periods=5)
+    bank.add_ema(name="ema", n_periods=7)
+    bank.add_rsi(name="rsi", n_periods=14)
+    bank.add_macd(
+        name="macd",
+        short_ema_n_periods=3,
+        long_ema_n_periods=6,
+        signal_ema_n_periods=4,
+    )
+    indicators = {
+        key: {
+            "sma": SMA(n_periods=5),
+            "ema": EMA(n_periods=7),
+            "rsi": RSI(n_periods=14),
+            "macd": MACD(
+                short_ema_n_periods=3,
+                long_ema_n_periods=6,
+                signal_ema_n_periods=4,
+            ),
+        }
+        for key in keys
+    }
+
+    for values in feed:
+        bank.update(values=values)
+
+        for key, value in zip(keys, values):
+            row = bank.get_row(key=key)
+            key_indicators = indicators[key]
+            if not np.isnan(value):
+                for indicator in key_indicators.values():
+                    indicator.update(value=value)
+
+            for name in ["sma", "ema", "rsi"]:
+                _assert_equal_values(
+                    bank[name].value[row], key_indicators[name].value,
+                )
+            for line in ["macd_line", "signal_line", "macd_hist"]:
+                _assert_equal_values(
+                    getattr(bank["macd"], line)[row],
+                    getattr(key_indicators["macd"], line),
+                )
+
+
+def test_indicator_bank_dict_update():
+    bank = IndicatorBank(keys=["SPY", "QQQ"])
+    bank.add_sma(name="sma", n_periods=2)
+
+    bank.update(values={"QQQ": 1})
+    bank.update(values={"SPY": 2, "QQQ": 3})
+
+    assert np.isnan(bank["sma"].value[bank.get_row(key="SPY")])
+    assert bank["sma"].value[bank.get_row(key="QQQ")] == 2
+
+    with pytest.raises(ValueError):
+        bank.add_indicator(
+            name="other", indicator=SMABank(n_instruments=3, n_periods=2),
+        )
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from algotradepy.indicators.ma import SMA, EMA
@@ -87,3 +88,46 @@ def test_ma(ma, feed, targets):
         )
 
     assert ma.ready
+
+
+@pytest.mark.parametrize("ma_class", [SMA, EMA])
+@pytest.mark.parametrize("split", [0, 3, 10, 57])
+def test_ma_update_many(ma_class, split):
+    feed = np.random.default_rng(0).normal(100, 5, 200)
+    ma = ma_class(n_periods=10)
+    batch_ma = ma_class(n_periods=10)
+
+    for val in feed:
+        ma.update(value=val)
+    batch_ma.update_many(values=feed[:split])
+    for val in feed[split : split + 5]:
+        batch_ma.update(value=val)
+    batch_ma.update_many(values=feed[split + 5 :])
+
+    assert batch_ma.ready
+    assert np.isclose(batch_ma.value, ma.value)
+
+
+def test_sma_running_sum():
+    feed = np.random.default_rng(0).normal(1e6, 1, 100_000)
+    sma = SMA(n_periods=7)
+
+    for val in feed:
+        sma.update(value=val)
+
+    assert np.isclose(sma.value, feed[-7:].mean(), rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("ma_class", [SMA, EMA])
+def test_ma_compute(ma_class):
+    feed = np.random.default_rng(0).normal(100, 5, 200)
+    ma = ma_class(n_periods=10)
+    targets = []
+
+    for val in feed:
+        ma.update(value=val)
+        targets.append(ma.value)
+
+    values = ma_class.compute(values=pd.Series(feed), n_periods=10)
+
+    np.testing.assert_allclose(values, targets, rtol=1e-12)
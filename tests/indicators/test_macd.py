@@ -168,3 +168,45 @@ def test_macd():
         assert (
             np.isnan(macd.macd_hist) and np.isnan(macd_hist_target[i])
         ) or np.isclose(macd.macd_hist, macd_hist_target[i], 0.005)
+
+
+def test_macd_update_many():
+    feed = np.random.default_rng(0).normal(100, 5, 100)
+    macd = MACD(
+        short_ema_n_periods=12, long_ema_n_periods=26, signal_ema_n_periods=9,
+    )
+    batch_macd = MACD(
+        short_ema_n_periods=12, long_ema_n_periods=26, signal_ema_n_periods=9,
+    )
+
+    for val in feed:
+        macd.update(value=val)
+    batch_macd.update_many(values=feed[:20])
+    batch_macd.update_many(values=feed[20:30])
+    batch_macd.update_many(values=feed[30:])
+
+    assert np.isclose(batch_macd.macd_line, macd.macd_line)
+    assert np.isclose(batch_macd.signal_line, macd.signal_line)
+    assert np.isclose(batch_macd.macd_hist, macd.macd_hist)
+
+
+def test_macd_compute():
+    feed = np.random.default_rng(0).normal(100, 5, 100)
+    macd = MACD(
+        short_ema_n_periods=12, long_ema_n_periods=26, signal_ema_n_periods=9,
+    )
+    targets = []
+
+    for val in feed:
+        macd.update(value=val)
+        targets.append([macd.macd_line, macd.signal_line, macd.macd_hist])
+
+    data = MACD.compute(
+        values=feed,
+        short_ema_n_periods=12,
+        long_ema_n_periods=26,
+        signal_ema_n_periods=9,
+    )
+
+    assert list(data.columns) == ["macd_line", "signal_line", "macd_hist"]
+    np.testing.assert_allclose(data.to_numpy(), targets, rtol=1e-9)
@@ -48,3 +48,33 @@ def test_rsi():
         assert (np.isnan(rsi.value) and np.isnan(targets[i])) or np.isclose(
             rsi.value, targets[i], 0.005
         )
+
+
+def test_rsi_update_many():
+    feed = np.random.default_rng(0).normal(100, 5, 100)
+    rsi = RSI(n_periods=14)
+    batch_rsi = RSI(n_periods=14)
+
+    for val in feed:
+        rsi.update(value=val)
+    batch_rsi.update_many(values=feed[:30])
+    batch_rsi.update_many(values=feed[30:])
+
+    assert batch_rsi.ready
+    assert np.isclose(batch_rsi.value, rsi.value)
+
+
+def test_rsi_compute():
+    feed = np.random.default_rng(0).normal(100, 5, 100)
+    feed[50:70] = np.arange(20)  # no losses over a whole window
+    rsi = RSI(n_periods=14)
+    targets = []
+
+    for val in feed:
+        rsi.update(value=val)
+        targets.append(rsi.value)
+
+    values = RSI.compute(values=feed, n_periods=14)
+
+    np.testing.assert_allclose(values, targets, rtol=1e-12)
+    assert values[-31] == 100
@@ -0,0 +1,155 @@
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from algotradepy.contracts import StockContract, Exchange
+from algotradepy.objects import Tick
+from algotradepy.streamers.base import FlushScheduler, TickBatcher
+
+
+def test_tick_batcher_max_batch_size():
+    contract = StockContract(symbol="SPY")
+    batches = []
+    batcher = TickBatcher(
+        contract=contract, func=batches.append, max_batch_size=3,
+    )
+
+    for i in range(7):
+        batcher.add_tick(
+            tick=Tick(
+                timestamp=i,
+                symbol="SPY",
+                price=100 + i,
+                size=10,
+                exchange=Exchange.ARCA,
+            ),
+        )
+
+    assert [len(batch) for batch in batches] == [3, 3]
+
+    batcher.flush()
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert batches[0].contract == contract
+    np.testing.assert_equal(batches[1].prices, [103, 104, 105])
+    np.testing.assert_equal(batches[1].timestamps, [3, 4, 5])
+    np.testing.assert_equal(batches[1].sizes, [10, 10, 10])
+    assert all(batches[2].exchanges == list(Exchange).index(Exchange.ARCA))
+
+
+def test_tick_batcher_max_latency():
+    contract = StockContract(symbol="SPY")
+    batches = []
+    batcher = TickBatcher(
+        contract=contract,
+        func=batches.append,
+        max_latency=timedelta(milliseconds=50),
+    )
+
+    batcher.add_price(contract=contract, price=100)
+    batcher.add_price(contract=contract, price=101)
+
+    assert len(batches) == 0
+
+    time.sleep(0.3)
+
+    assert len(batches) == 1
+    np.testing.assert_equal(batches[0].prices, [100, 101])
+    assert np.isnan(batches[0].sizes).all()
+    assert (batches[0].exchanges == -1).all()
+
+
+def test_tick_batcher_limits():
+    with pytest.raises(ValueError):
+        TickBatcher(contract=StockContract(symbol="SPY"), func=print)
+
+
+def test_tick_batchers_share_scheduler_thread():
+    scheduler = FlushScheduler()
+    batches = []
+    n_threads = threading.active_count()
+
+    for i in range(20):
+        batcher = TickBatcher(
+            contract=StockContract(symbol=f"S{i}"),
+            func=batches.append,
+            max_latency=timedelta(milliseconds=50),
+            scheduler=scheduler,
+        )
+        batcher.add(timestamp=i, price=100 + i)
+
+    assert threading.active_count() <= n_threads + 1
+
+    time.sleep(0.3)
+
+    assert len(batches) == 20
+    scheduler.close()
+
+
+def test_scheduler_survives_failing_callback(caplog):
+    scheduler = FlushScheduler()
+    contract = StockContract(symbol="SPY")
+    batches = []
+
+    def failing_receiver(batch):
+        raise ValueError("Subscriber failure.")
+
+    failing_batcher = TickBatcher(
+        contract=contract,
+        func=failing_receiver,
+        max_latency=timedelta(milliseconds=20),
+        scheduler=scheduler,
+    )
+    batcher = TickBatcher(
+        contract=contract,
+        func=batches.append,
+        max_latency=timedelta(milliseconds=20),
+        scheduler=scheduler,
+    )
+
+    failing_batcher.add(timestamp=0, price=100)
+    time.sleep(0.2)
+    batcher.add(timestamp=1, price=101)
+    failing_batcher.add(timestamp=2, price=102)
+    time.sleep(0.2)
+
+    assert len(batches) == 1
+    np.testing.assert_equal(batches[0].prices, [101])
+    assert "Subscriber failure." in caplog.text
+    scheduler.close()
+
+
+def test_tick_batcher_calls_back_outside_lock():
+    contract = StockContract(symbol="SPY")
+    in_callback = threading.Event()
+    release = threading.Event()
+    batches = []
+
+    def receiver(batch):
+        in_callback.set()
+        release.wait(timeout=5)
+        batches.append(batch)
+
+    batcher = TickBatcher(contract=contract, func=receiver, max_batch_size=2)
+    producer = threading.Thread(
+        target=lambda: [batcher.add(timestamp=i, price=i) for i in range(2)],
+    )
+    producer.start()
+    in_callback.wait(timeout=5)
+
+    # ticks can be added while a batch is being delivered
+    adder = threading.Thread(target=batcher.add, args=(2, 2))
+    adder.start()
+    adder.join(timeout=1)
+
+    assert not adder.is_alive()
+
+    release.set()
+    producer.join()
+    batcher.flush()
+
+    np.testing.assert_equal(batches[0].prices, [0, 1])
+    np.testing.assert_equal(batches[1].prices, [2])
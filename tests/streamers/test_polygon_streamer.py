@@ -8,6 +8,37 @@ from algotradepy.objects import Tick
 from tests.conftest import can_test_polygon
 
 
+def can_import_websocket() -> bool:
+    try:
+        import websocket
+    except ImportError:
+        can_import = False
+    else:
+        can_import = True
+
+    return can_import
+
+
+class _FakeConnector:
+    def __init__(self, **kwargs):
+        self.trade_event_subscribers = []
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def subscribe_to_trade_event(self, func):
+        self.trade_event_subscribers.append(func)
+
+    def request_trade_data(self, symbol):
+        pass
+
+    def cancel_trade_data(self, symbol):
+        pass
+
+
 @pytest.fixture()
 def streamer(polygon_api_token):
     from algotradepy.streamers.polygon_streamer import PolygonDataStreamer
@@ -80,3 +111,41 @@ def test_cancel_trades_data(streamer):
     time.sleep(1)
 
     assert tick is None
+
+
+@pytest.mark.skipif(
+    not can_import_websocket(), reason="websocket-client not installed.",
+)
+def test_trades_dispatched_concurrently(monkeypatch):
+    from algotradepy.streamers import polygon_streamer
+
+    monkeypatch.setattr(
+        polygon_streamer, "PolygonWebSocketConnector", _FakeConnector,
+    )
+    streamer = polygon_streamer.PolygonDataStreamer(api_token="token")
+    (receiver,) = streamer._conn.trade_event_subscribers
+    qqq_received = threading.Event()
+    delivered_meanwhile = []
+
+    def spy_receiver(t):
+        # blocks until a trade of another symbol is delivered meanwhile
+        delivered_meanwhile.append(qqq_received.wait(timeout=2))
+
+    streamer.subscribe_to_trades(
+        contract=StockContract(symbol="SPY"), func=spy_receiver,
+    )
+    streamer.subscribe_to_trades(
+        contract=StockContract(symbol="QQQ"),
+        func=lambda t: qqq_received.set(),
+    )
+
+    spy_thread = threading.Thread(
+        target=receiver, args=({"sym": "SPY", "t": 1, "p": 1, "s": 1},),
+    )
+    spy_thread.start()
+    time.sleep(0.05)
+    receiver({"sym": "QQQ", "t": 1, "p": 1, "s": 1})
+    spy_thread.join()
+
+    assert delivered_meanwhile == [True]
+    streamer.__del__()
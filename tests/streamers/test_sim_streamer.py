@@ -1,4 +1,5 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -12,7 +13,7 @@ from algotradepy.contracts import (
     Right,
 )
 from algotradepy.historical.loaders import HistoricalRetriever
-from algotradepy.objects import Greeks
+from algotradepy.objects import Greeks, Bar, TickBatch
 from algotradepy.sim_utils import SimulationClock, SimulationRunner
 from algotradepy.streamers.sim_streamer import SimulationDataStreamer
 from tests.conftest import TEST_DATA_DIR
@@ -94,6 +95,82 @@ def test_simulation_broker_register_daily(sim_broker_runner_and_streamer_15m):
     checker.assert_all_received()
 
 
+def test_bar_records():
+    contract = StockContract(symbol="SPY")
+    received = {}
+
+    for bar_records in [False, True]:
+        sim_clock = SimulationClock(
+            start_date=date(2020, 4, 6),
+            end_date=date(2020, 4, 7),
+            simulation_time_step=timedelta(minutes=15),
+        )
+        streamer = SimulationDataStreamer(
+            historical_retriever=HistoricalRetriever(
+                hist_data_dir=TEST_DATA_DIR,
+            ),
+            bar_records=bar_records,
+        )
+        runner = SimulationRunner(
+            sim_clock=sim_clock, data_providers=[streamer], data_consumers=[],
+        )
+        bars = []
+        for bar_size in [timedelta(minutes=15), timedelta(days=1)]:
+            streamer.subscribe_to_bars(
+                contract=contract, bar_size=bar_size, func=bars.append,
+            )
+        runner.run_sim()
+        received[bar_records] = bars
+
+    assert len(received[True]) == len(received[False])
+    for record, series in zip(received[True], received[False]):
+        assert isinstance(record, Bar)
+        assert record.datetime == series.name
+        assert record.close == series["close"]
+        assert record.to_dict() == series.to_dict()
+
+
+def test_get_bar_gapped_data():
+    contract = StockContract(symbol="SPY")
+    bar_size = timedelta(minutes=15)
+    sim_clock = SimulationClock(
+        start_date=date(2020, 4, 6),
+        end_date=date(2020, 4, 7),
+        simulation_time_step=bar_size,
+    )
+    retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    streamer = SimulationDataStreamer(historical_retriever=retriever)
+    SimulationRunner(
+        sim_clock=sim_clock, data_providers=[streamer], data_consumers=[],
+    )
+    data = retriever.retrieve_bar_data(
+        contract=contract,
+        bar_size=bar_size,
+        start_date=date(2020, 4, 6),
+        end_date=date(2020, 4, 7),
+        cache_only=True,
+    )
+    missing = [datetime(2020, 4, 6, 10), datetime(2020, 4, 7, 9, 30)]
+    streamer.add_bar_data(
+        contract=contract, bar_size=bar_size, data=data.drop(missing),
+    )
+
+    sim_clock.set_datetime(dt=datetime(2020, 4, 6, 9, 45))
+    bar = streamer.get_bar(contract=contract, bar_size=bar_size)
+    assert bar.name == datetime(2020, 4, 6, 9, 45)
+
+    sim_clock.set_datetime(dt=datetime(2020, 4, 6, 10))
+    with pytest.raises(KeyError):
+        streamer.get_bar(contract=contract, bar_size=bar_size)
+
+    # the bar opening the next session is missing
+    sim_clock.set_datetime(dt=datetime(2020, 4, 6, 15, 45))
+    sim_clock.tick()
+    assert sim_clock.end_of_day
+    with pytest.raises(KeyError):
+        streamer.get_bar(contract=contract, bar_size=bar_size)
+
+
 def test_simulation_broker_register_tick_resolution_fail(
     sim_broker_runner_and_streamer_15m,
 ):
@@ -393,3 +470,241 @@ def test_multiple_greeks_subscriptions():
 
     assert len(first_greeks_updates) == 1
     assert len(second_greeks_updates) == 1
+
+
+def _build_sim(
+    start_date: date,
+    end_date: date,
+    time_step: timedelta,
+    event_driven: bool,
+    hist_data_dir: Path = TEST_DATA_DIR,
+):
+    sim_clock = SimulationClock(
+        start_date=start_date,
+        end_date=end_date,
+        simulation_time_step=time_step,
+    )
+    streamer = SimulationDataStreamer(
+        historical_retriever=HistoricalRetriever(hist_data_dir=hist_data_dir),
+    )
+    broker = SimulationBroker(
+        sim_streamer=streamer, starting_funds={Currency.USD: 1_000},
+    )
+    sim_runner = SimulationRunner(
+        sim_clock=sim_clock,
+        data_providers=[streamer],
+        data_consumers=[broker],
+        event_driven=event_driven,
+    )
+    return sim_clock, sim_runner, streamer
+
+
+def test_event_driven_runner_bars():
+    contract = StockContract(symbol="SPY")
+    received = {}
+
+    for event_driven in [False, True]:
+        sim_clock, runner, streamer = _build_sim(
+            start_date=date(2020, 4, 6),
+            end_date=date(2020, 4, 7),
+            time_step=timedelta(minutes=1),
+            event_driven=event_driven,
+        )
+        bars = []
+        for bar_size in [timedelta(minutes=30), timedelta(days=1)]:
+            streamer.subscribe_to_bars(
+                contract=contract,
+                bar_size=bar_size,
+                func=lambda bar: bars.append(
+                    (sim_clock.datetime, bar["close"])
+                ),
+            )
+        runner.run_sim()
+        received[event_driven] = bars
+
+    assert len(received[False]) == 2 * 13 + 2
+    assert received[True] == received[False]
+
+
+def test_event_driven_runner_ticks():
+    contract = StockContract(symbol="SPY")
+    end_datetime = datetime(2020, 6, 17, 9, 32)
+    received = {}
+
+    for event_driven in [False, True]:
+        sim_clock, runner, streamer = _build_sim(
+            start_date=date(2020, 6, 17),
+            end_date=date(2020, 6, 17),
+            time_step=timedelta(seconds=1),
+            event_driven=event_driven,
+        )
+        ticks = []
+        streamer.subscribe_to_tick_data(
+            contract=contract,
+            func=lambda _, price: ticks.append((sim_clock.datetime, price)),
+            price_type=PriceType.ASK,
+        )
+        if event_driven:
+            while sim_clock.datetime < end_datetime:
+                runner.run_sim(step_count=1)
+            ticks = [tick for tick in ticks if tick[0] <= end_datetime]
+        else:
+            runner.run_sim(step_count=120)
+            assert sim_clock.datetime == end_datetime
+        received[event_driven] = ticks
+
+    assert len(received[False]) != 0
+    assert received[True] == received[False]
+
+
+def test_tick_data_delivered_once(sim_broker_runner_and_streamer_1s):
+    _, runner, streamer = sim_broker_runner_and_streamer_1s
+    spy_stock_contract = StockContract(symbol="SPY")
+    hist_retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    records = hist_retriever.get_cached_tick_records(
+        contract=spy_stock_contract,
+        date_=date(2020, 6, 17),
+        bar_size=timedelta(0),
+    )
+
+    spy_ask = []
+
+    def spy_receiver(_, price):
+        spy_ask.append(price)
+
+    streamer.subscribe_to_tick_data(
+        contract=spy_stock_contract,
+        func=spy_receiver,
+        price_type=PriceType.ASK,
+    )
+
+    runner.run_sim(step_count=300)
+
+    end_ns = streamer.sim_clock.datetime_ns
+    expected = records["ask"][records["timestamp"] < end_ns]
+
+    assert len(spy_ask) != 0
+    np.testing.assert_equal(spy_ask, expected)
+
+
+@pytest.mark.parametrize(
+    "max_latency, max_batch_size",
+    [(timedelta(seconds=5), None), (None, 7), (timedelta(seconds=5), 7)],
+)
+def test_tick_batches(
+    sim_broker_runner_and_streamer_1s, max_latency, max_batch_size,
+):
+    _, runner, streamer = sim_broker_runner_and_streamer_1s
+    spy_stock_contract = StockContract(symbol="SPY")
+
+    spy_ask = []
+    batches = []
+
+    def spy_receiver(_, price):
+        spy_ask.append(price)
+
+    def spy_batch_receiver(batch: TickBatch):
+        batches.append(batch)
+
+    streamer.subscribe_to_tick_data(
+        contract=spy_stock_contract,
+        func=spy_receiver,
+        price_type=PriceType.ASK,
+    )
+    streamer.subscribe_to_tick_batches(
+        contract=spy_stock_contract,
+        func=spy_batch_receiver,
+        price_type=PriceType.ASK,
+        max_latency=max_latency,
+        max_batch_size=max_batch_size,
+    )
+
+    runner.run_sim(step_count=300)
+
+    batched_ask = np.concatenate([batch.prices for batch in batches])
+
+    assert len(batches) != 0
+    assert all(batch.contract == spy_stock_contract for batch in batches)
+    if max_batch_size is not None:
+        assert all(len(batch) <= max_batch_size for batch in batches)
+    if max_latency is not None:
+        # the ticks of the last 5s at most are pending
+        end_s = streamer.sim_clock.datetime_ns / 1e9
+        assert batches[-1].timestamps[-1] >= end_s - 6
+    np.testing.assert_equal(batched_ask, spy_ask[: len(batched_ask)])
+
+
+def test_event_driven_tick_batches_data_ending_before_close(
+    test_data_copy_dir,
+):
+    contract = StockContract(symbol="SPY")
+    # the ticks of the first day end at 15:00, an hour before the close
+    tick_dir = test_data_copy_dir / "stocks" / "SPY" / "tick"
+    file_path = tick_dir / "2020-06-17.csv"
+    with open(file_path) as f:
+        lines = f.readlines()
+    with open(file_path, "w") as f:
+        f.writelines(line for line in lines if " 15:" not in line)
+    received = {}
+
+    for event_driven in [False, True]:
+        _, runner, streamer = _build_sim(
+            start_date=date(2020, 6, 17),
+            end_date=date(2020, 6, 18),
+            time_step=timedelta(seconds=1),
+            event_driven=event_driven,
+            hist_data_dir=test_data_copy_dir,
+        )
+        batches = []
+        streamer.subscribe_to_tick_batches(
+            contract=contract,
+            func=batches.append,
+            price_type=PriceType.ASK,
+            max_batch_size=1000,
+        )
+        runner.run_sim()
+        received[event_driven] = np.concatenate(
+            [batch.timestamps for batch in batches]
+        )
+
+    hist_retriever = HistoricalRetriever(hist_data_dir=test_data_copy_dir)
+    n_ticks = sum(
+        len(
+            hist_retriever.get_cached_tick_records(
+                contract=contract, date_=date_, bar_size=timedelta(0),
+            )
+        )
+        for date_ in [date(2020, 6, 17), date(2020, 6, 18)]
+    )
+
+    assert len(received[False]) == n_ticks
+    np.testing.assert_equal(received[True], received[False])
+
+
+def test_cancel_tick_batches_delivers_pending_ticks(
+    sim_broker_runner_and_streamer_1s,
+):
+    _, runner, streamer = sim_broker_runner_and_streamer_1s
+    contract = StockContract(symbol="SPY")
+    ticks = []
+    batches = []
+    streamer.subscribe_to_tick_data(
+        contract=contract,
+        func=lambda _, price: ticks.append(price),
+        price_type=PriceType.ASK,
+    )
+    streamer.subscribe_to_tick_batches(
+        contract=contract,
+        func=batches.append,
+        price_type=PriceType.ASK,
+        max_batch_size=1000,
+    )
+
+    runner.run_sim(step_count=60)
+
+    assert len(batches) == 0
+
+    streamer.cancel_tick_batches(contract=contract, func=batches.append)
+
+    assert len(batches) == 1
+    np.testing.assert_equal(batches[0].prices, ticks)
@@ -1,5 +1,16 @@
+import pickle
+from datetime import date
+
 import pytest
 
+from algotradepy.contracts import (
+    ContractRegistry,
+    Currency,
+    StockContract,
+    OptionContract,
+    Exchange,
+    Right,
+)
 from algotradepy.orders import OrderAction, TrailingStopOrder
 
 
@@ -21,3 +32,97 @@ def test_trailing_stop_order_aux_price_and_trail_percent_fail():
             aux_price=None,
             trail_percent=None,
         )
+
+
+def test_contract_hash_and_equality():
+    spy = StockContract(symbol="SPY")
+
+    assert spy == StockContract(symbol="SPY")
+    assert hash(spy) == hash(StockContract(symbol="SPY"))
+    assert spy != StockContract(symbol="QQQ")
+    assert spy != StockContract(symbol="SPY", con_id=1)
+
+    option = OptionContract(
+        symbol="SPY",
+        strike=300,
+        right=Right.CALL,
+        multiplier=100,
+        last_trade_date=date(2020, 6, 19),
+    )
+    other_option = OptionContract(
+        symbol="SPY",
+        strike=300,
+        right=Right.PUT,
+        multiplier=100,
+        last_trade_date=date(2020, 6, 19),
+    )
+
+    assert option != other_option
+    assert option != spy
+
+
+def test_contract_key_updated_on_change():
+    spy = StockContract(symbol="SPY")
+    assert spy == StockContract(symbol="SPY")
+
+    spy.exchange = Exchange.ARCA
+
+    assert spy == StockContract(symbol="SPY", exchange=Exchange.ARCA)
+    assert hash(spy) == hash(
+        StockContract(symbol="SPY", exchange=Exchange.ARCA)
+    )
+
+
+def test_contract_read_only_once_hashed():
+    spy = StockContract(symbol="SPY")
+    table = {spy: 1}
+
+    with pytest.raises(AttributeError):
+        spy.exchange = Exchange.ARCA
+    with pytest.raises(AttributeError):
+        spy.currency = Currency.CAD
+
+    assert spy.exchange is None
+    assert table[StockContract(symbol="SPY")] == 1
+
+
+def test_contract_hashes_are_distinct():
+    contracts = [StockContract(symbol=f"S{i}") for i in range(10_000)]
+    table = {contract: i for i, contract in enumerate(contracts)}
+
+    assert len({hash(contract) for contract in contracts}) == len(contracts)
+    assert all(
+        table[StockContract(symbol=f"S{i}")] == i for i in range(10_000)
+    )
+
+
+def test_contract_registry():
+    registry = ContractRegistry()
+    spy = registry.get(StockContract, symbol="SPY")
+
+    assert registry.get(StockContract, symbol="SPY") is spy
+    assert registry.intern(contract=StockContract(symbol="SPY")) is spy
+    assert registry.get(StockContract, symbol="SPY", con_id=1) is not spy
+    assert registry.get(StockContract, symbol="QQQ") != spy
+
+    arca_spy = StockContract(symbol="SPY", exchange=Exchange.ARCA)
+
+    assert registry.intern(contract=arca_spy) is arca_spy
+    assert (
+        registry.get(StockContract, symbol="SPY", exchange=Exchange.ARCA)
+        is arca_spy
+    )
+    assert len(registry) == 4
+
+
+def test_contract_slots_and_pickling():
+    spy = StockContract(symbol="SPY", exchange=Exchange.ARCA)
+    hash(spy)
+
+    assert not hasattr(spy, "__dict__")
+
+    unpickled = pickle.loads(pickle.dumps(spy))
+
+    assert not hasattr(unpickled, "_hash")  # hashes differ across processes
+    assert unpickled == spy
+    assert hash(unpickled) == hash(spy)
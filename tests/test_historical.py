@@ -1,3 +1,5 @@
+import threading
+import time
 from datetime import date, timedelta
 from typing import Optional
 
@@ -6,10 +8,24 @@ import numpy as np
 import pytest
 
 from algotradepy.contracts import StockContract
-from algotradepy.historical.loaders import HistoricalRetriever
+from algotradepy.historical.loaders import (
+    HistoricalRetriever,
+    HistCacheHandler,
+)
+from algotradepy.historical.providers.base import AHistoricalProvider
 from algotradepy.historical.providers.yahoo_provider import (
     YahooHistoricalProvider,
 )
+from algotradepy.historical.storage import (
+    CSVHistStorage,
+    ParquetHistStorage,
+    ArrowHistStorage,
+)
+from algotradepy.historical.tick_store import (
+    TickStore,
+    records_to_frame,
+    QUOTES_DTYPE,
+)
 from algotradepy.historical.transformers import HistoricalAggregator
 from algotradepy.time_utils import generate_trading_days
 from tests.conftest import (
@@ -113,6 +129,419 @@ def test_retrieve_cached_trades():
     validate_data_range(data=data, start_date=start_date, end_date=end_date)
 
 
+def test_iter_cached_days():
+    start_date = date(2020, 4, 6)
+    end_date = date(2020, 4, 8)
+
+    retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    contract = StockContract(symbol="SPY")
+    data = retriever.retrieve_bar_data(
+        contract=contract,
+        start_date=start_date,
+        end_date=end_date,
+        bar_size=timedelta(minutes=1),
+        cache_only=True,
+        rth=False,
+    )
+    days = list(
+        retriever.iter_cached_days(
+            contract=contract,
+            start_date=start_date,
+            end_date=end_date,
+            bar_size=timedelta(minutes=1),
+        )
+    )
+
+    assert len(days) == 3
+    for day_data in days:
+        assert len(np.unique(day_data.index.date)) == 1
+    pd.testing.assert_frame_equal(pd.concat(days), data)
+
+
+def can_test_parquet() -> bool:
+    can_test = True
+
+    try:
+        import pyarrow
+    except ImportError:
+        can_test = False
+
+    return can_test
+
+
+@pytest.mark.skipif(not can_test_parquet(), reason="pyarrow not available.")
+@pytest.mark.parametrize("storage_cls", [ParquetHistStorage, ArrowHistStorage])
+def test_columnar_storage_round_trip(tmpdir, storage_cls):
+    start_date = date(2020, 4, 6)
+    end_date = date(2020, 4, 7)
+    contract = StockContract(symbol="SPY")
+    csv_handler = HistCacheHandler(hist_data_dir=TEST_DATA_DIR)
+    data = csv_handler.get_cached_bar_data(
+        contract=contract,
+        start_date=start_date,
+        end_date=end_date,
+        bar_size=timedelta(minutes=1),
+    )
+
+    columnar_handler = HistCacheHandler(
+        hist_data_dir=tmpdir, storage=storage_cls(),
+    )
+    columnar_handler.cache_bar_data(
+        data=data, contract=contract, bar_size=timedelta(minutes=1),
+    )
+    loaded = columnar_handler.get_cached_bar_data(
+        contract=contract,
+        start_date=start_date,
+        end_date=end_date,
+        bar_size=timedelta(minutes=1),
+    )
+
+    assert len(tmpdir.listdir()) != 0
+    pd.testing.assert_frame_equal(loaded, data)
+
+
+@pytest.mark.skipif(not can_test_parquet(), reason="pyarrow not available.")
+@pytest.mark.parametrize("storage_cls", [ParquetHistStorage, ArrowHistStorage])
+def test_columnar_storage_round_trip_tz_aware(tmpdir, storage_cls):
+    storage = storage_cls()
+    index = pd.date_range(
+        "2020-04-06 09:30",
+        periods=3,
+        freq="1min",
+        tz="America/New_York",
+        name="datetime",
+    )
+    data = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+    file_path = tmpdir / storage.file_name(stem="2020-04-06")
+
+    storage.write(data=data, file_path=file_path, daily=False)
+    loaded = storage.read(file_path=file_path)
+
+    pd.testing.assert_frame_equal(loaded, data, check_freq=False)
+
+
+@pytest.mark.skipif(not can_test_parquet(), reason="pyarrow not available.")
+def test_parquet_storage_reads_legacy_csv():
+    start_date = date(2020, 4, 6)
+    end_date = date(2020, 4, 7)
+    contract = StockContract(symbol="SPY")
+
+    csv_handler = HistCacheHandler(
+        hist_data_dir=TEST_DATA_DIR, storage=CSVHistStorage(),
+    )
+    parquet_handler = HistCacheHandler(
+        hist_data_dir=TEST_DATA_DIR, storage=ParquetHistStorage(),
+    )
+
+    for bar_size in [timedelta(days=1), timedelta(minutes=5)]:
+        csv_data = csv_handler.get_cached_bar_data(
+            contract=contract,
+            start_date=start_date,
+            end_date=end_date,
+            bar_size=bar_size,
+        )
+        parquet_data = parquet_handler.get_cached_bar_data(
+            contract=contract,
+            start_date=start_date,
+            end_date=end_date,
+            bar_size=bar_size,
+        )
+
+        pd.testing.assert_frame_equal(parquet_data, csv_data)
+
+
+def test_cache_index_updated_on_cache(tmpdir):
+    contract = StockContract(symbol="SPY")
+    bar_size = timedelta(minutes=1)
+    csv_handler = HistCacheHandler(hist_data_dir=TEST_DATA_DIR)
+    data = csv_handler.get_cached_bar_data(
+        contract=contract,
+        start_date=date(2020, 4, 6),
+        end_date=date(2020, 4, 7),
+        bar_size=bar_size,
+    )
+    day_data = data.loc["2020-04-07"]
+
+    handler = HistCacheHandler(hist_data_dir=tmpdir)
+    handler.cache_bar_data(
+        data=day_data, contract=contract, bar_size=bar_size, schema_v=1,
+    )
+
+    assert (tmpdir / "stocks" / "SPY" / "1 min" / ".manifest.json").exists()
+
+    coverage = handler.get_coverage(contract=contract, bar_size=bar_size)
+
+    assert coverage.index.tolist() == [date(2020, 4, 7)]
+    assert coverage["rows"].iloc[0] == len(day_data)
+    assert coverage["start"].iloc[0] == day_data.index[0].value
+    assert coverage["end"].iloc[0] == day_data.index[-1].value
+
+    missing = handler.get_missing_date_ranges(
+        contract=contract,
+        start_date=date(2020, 4, 3),
+        end_date=date(2020, 4, 9),
+        bar_size=bar_size,
+    )
+
+    assert missing == [
+        [date(2020, 4, 3), date(2020, 4, 6)],
+        [date(2020, 4, 8), date(2020, 4, 9)],
+    ]
+
+    new_handler = HistCacheHandler(hist_data_dir=tmpdir)
+
+    assert new_handler.available_data == {
+        "stocks": {"SPY": {"1 min": [date(2020, 4, 7)]}},
+    }
+
+
+def test_cache_index_rebuilt_for_legacy_cache():
+    handler = HistCacheHandler(hist_data_dir=TEST_DATA_DIR)
+    available_data = handler.available_data
+    spy_data = available_data["stocks"]["SPY"]
+
+    assert date(2020, 4, 6) in spy_data["1 min"]
+    assert date(2020, 4, 7) in spy_data["daily"]
+    assert not (TEST_DATA_DIR / "stocks" / "SPY" / ".manifest.json").exists()
+
+
+class ConcurrencyCountingStorage(CSVHistStorage):
+    def __init__(self):
+        self.max_active = 0
+        self.max_active_per_folder = 0
+        self._active = []
+        self._lock = threading.Lock()
+
+    def write(self, data, file_path, daily):
+        folder_path = file_path.parent
+        with self._lock:
+            self._active.append(folder_path)
+            self.max_active = max(self.max_active, len(self._active))
+            self.max_active_per_folder = max(
+                self.max_active_per_folder, self._active.count(folder_path),
+            )
+        time.sleep(0.05)
+        with self._lock:
+            self._active.remove(folder_path)
+        super().write(data=data, file_path=file_path, daily=daily)
+
+
+def test_cache_writes_locked_per_folder(tmpdir):
+    storage = ConcurrencyCountingStorage()
+    handler = HistCacheHandler(hist_data_dir=tmpdir, storage=storage)
+    index = pd.date_range(
+        "2020-04-06 09:30", periods=3, freq="1min", name="datetime",
+    )
+    data = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+    symbols = ["A", "A", "B", "B"]
+
+    threads = [
+        threading.Thread(
+            target=handler.cache_bar_data,
+            kwargs={
+                "data": data,
+                "contract": StockContract(symbol=symbol),
+                "bar_size": timedelta(minutes=1),
+            },
+        )
+        for symbol in symbols
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert storage.max_active == 2
+    assert storage.max_active_per_folder == 1
+
+
+def test_tick_store_round_trip(tmpdir):
+    contract = StockContract(symbol="SPY")
+    csv_handler = HistCacheHandler(hist_data_dir=TEST_DATA_DIR)
+    data = csv_handler.get_cached_bar_data(
+        contract=contract,
+        start_date=date(2020, 6, 17),
+        end_date=date(2020, 6, 18),
+        bar_size=timedelta(0),
+    )
+
+    store = TickStore(folder_path=tmpdir, dtype=QUOTES_DTYPE)
+    store.write(data=data)
+
+    assert store.get_dates() == [date(2020, 6, 17), date(2020, 6, 18)]
+
+    records = store.open_day(date_=date(2020, 6, 17))
+
+    assert isinstance(records, np.memmap)
+    pd.testing.assert_frame_equal(
+        records_to_frame(records=records), data.loc["2020-06-17"],
+    )
+
+    start = pd.Timestamp("2020-06-17 09:30:00")
+    end = pd.Timestamp("2020-06-17 09:30:05")
+    view = store.get_range(start=start, end=end)
+
+    assert view.base is not None
+    pd.testing.assert_frame_equal(
+        records_to_frame(records=view), data.loc[start:end],
+    )
+
+
+def test_tick_records_written_on_cache(tmpdir):
+    contract = StockContract(symbol="SPY")
+    csv_handler = HistCacheHandler(hist_data_dir=TEST_DATA_DIR)
+    data = csv_handler.get_cached_bar_data(
+        contract=contract,
+        start_date=date(2020, 6, 17),
+        end_date=date(2020, 6, 17),
+        bar_size=timedelta(0),
+    )
+
+    handler = HistCacheHandler(hist_data_dir=tmpdir)
+    handler.cache_bar_data(
+        data=data, contract=contract, bar_size=timedelta(0),
+    )
+    records = handler.get_tick_records(
+        contract=contract, date_=date(2020, 6, 17), bar_size=timedelta(0),
+    )
+    csv_records = csv_handler.get_tick_records(
+        contract=contract, date_=date(2020, 6, 17), bar_size=timedelta(0),
+    )
+
+    assert isinstance(records, np.memmap)
+    assert not isinstance(csv_records, np.memmap)
+    np.testing.assert_array_equal(records, csv_records)
+
+
+class ConcurrencyCountingProvider(AHistoricalProvider):
+    MAX_CONCURRENT_REQUESTS = 4
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.max_active = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def download_bars_data(
+        self,
+        contract,
+        start_date,
+        end_date,
+        bar_size,
+        rth,
+        **kwargs,
+    ) -> pd.DataFrame:
+        with self._lock:
+            self.requests.append((start_date, end_date))
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(0.05)
+        with self._lock:
+            self._active -= 1
+
+        index = pd.date_range(
+            start=f"{start_date} 09:30",
+            end=f"{end_date} 15:59",
+            freq=bar_size,
+            name="datetime",
+        )
+        index = index[index.indexer_between_time("9:30", "15:59")]
+        data = pd.DataFrame(
+            data={"open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0},
+            index=index,
+        )
+        data["volume"] = 100
+
+        return data
+
+    def download_trades_data(
+        self, contract, start_date, end_date, rth, **kwargs,
+    ):
+        raise NotImplementedError
+
+
+def test_retrieve_concurrent_download(tmpdir):
+    provider = ConcurrencyCountingProvider()
+    retriever = HistoricalRetriever(
+        provider=provider, hist_data_dir=tmpdir, max_workers=8,
+    )
+    contract = StockContract(symbol="SPY")
+    start_date = date(2020, 4, 6)
+    end_date = date(2020, 4, 17)
+
+    data = retriever.retrieve_bar_data(
+        contract=contract,
+        bar_size=timedelta(minutes=1),
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    dates = generate_trading_days(start_date=start_date, end_date=end_date)
+
+    assert len(provider.requests) == len(dates)
+    assert 1 < provider.max_active <= provider.MAX_CONCURRENT_REQUESTS
+    assert data.index.is_monotonic_increasing
+    assert len(data) == len(dates) * 390
+
+    cached = retriever.retrieve_bar_data(
+        contract=contract,
+        bar_size=timedelta(minutes=1),
+        start_date=start_date,
+        end_date=end_date,
+        cache_only=True,
+    )
+
+    pd.testing.assert_frame_equal(cached, data)
+
+
+def test_retrieve_bars_bulk(tmpdir):
+    provider = ConcurrencyCountingProvider()
+    retriever = HistoricalRetriever(
+        provider=provider, hist_data_dir=tmpdir, max_workers=8,
+    )
+    contracts = [StockContract(symbol=symbol) for symbol in ["A", "B", "C"]]
+    start_date = date(2020, 4, 6)
+    end_date = date(2020, 4, 8)
+
+    retriever.retrieve_bar_data(
+        contract=contracts[0],
+        bar_size=timedelta(minutes=1),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    provider.requests.clear()
+
+    data = retriever.retrieve_bars_bulk(
+        contracts=contracts,
+        bar_size=timedelta(minutes=1),
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    assert len(provider.requests) == 6
+    assert data.index.names == ["contract", "datetime"]
+    assert data.index.get_level_values("contract").unique().tolist() == (
+        contracts
+    )
+    assert len(data) == 3 * 3 * 390
+
+    data_dict = retriever.retrieve_bars_bulk(
+        contracts=contracts,
+        bar_size=timedelta(minutes=1),
+        start_date=start_date,
+        end_date=end_date,
+        cache_only=True,
+        as_dict=True,
+    )
+
+    assert len(provider.requests) == 6
+    for contract in contracts:
+        pd.testing.assert_frame_equal(
+            data_dict[contract], data.loc[contract],
+        )
+
+
 HIST_PROVIDERS = [YahooHistoricalProvider()]
 
 if can_test_iex():
@@ -333,11 +762,11 @@ def test_retrieving_intermittently_cached_trades(tmpdir, provider):
     validate_data_range(data=data, start_date=dates[0], end_date=dates[-1])
 
 
-def test_historical_bar_aggregator():
+def test_historical_bar_aggregator(test_data_copy_dir):
     start_date = date(2020, 4, 6)
     end_date = date(2020, 4, 7)
 
-    retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    retriever = HistoricalRetriever(hist_data_dir=test_data_copy_dir)
     contract = StockContract(symbol="SPY")
     base_data = retriever.retrieve_bar_data(
         contract=contract,
@@ -347,7 +776,7 @@ def test_historical_bar_aggregator():
         cache_only=True,
     )
 
-    aggregator = HistoricalAggregator(hist_data_dir=TEST_DATA_DIR)
+    aggregator = HistoricalAggregator(hist_data_dir=test_data_copy_dir)
     agg_data = aggregator.aggregate_data(
         contract=contract,
         start_date=start_date,
@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from algotradepy.brokers import SimulationBroker
+from algotradepy.contracts import StockContract, Currency
+from algotradepy.historical.loaders import HistoricalRetriever
+from algotradepy.indicators.ma import SMA
+from algotradepy.orders import MarketOrder, OrderAction
+from algotradepy.sim_sweep import SimulationSweep
+from algotradepy.sim_utils import SimulationClock, SimulationRunner
+from algotradepy.streamers.sim_streamer import SimulationDataStreamer
+from algotradepy.trade import Trade
+from tests.conftest import TEST_DATA_DIR
+
+BAR_SIZE = timedelta(minutes=15)
+
+
+def sma_crossover_sim(
+    sim_clock: SimulationClock,
+    sim_streamer: SimulationDataStreamer,
+    n_short: int,
+    n_long: int,
+) -> float:
+    contract = StockContract(symbol="SPY")
+    broker = SimulationBroker(
+        sim_streamer=sim_streamer,
+        starting_funds={Currency.USD: 1_000},
+        transaction_cost=1,
+    )
+    runner = SimulationRunner(
+        sim_clock=sim_clock,
+        data_providers=[sim_streamer],
+        data_consumers=[broker],
+    )
+    short_sma = SMA(n_periods=n_short)
+    long_sma = SMA(n_periods=n_long)
+
+    def on_bar(bar):
+        short_sma.update(value=bar["close"])
+        long_sma.update(value=bar["close"])
+        target = 0
+        if long_sma.ready:
+            target = np.sign(short_sma.value - long_sma.value)
+        delta = target - broker.get_position(contract=contract)
+        if delta != 0:
+            action = OrderAction.BUY if delta > 0 else OrderAction.SELL
+            order = MarketOrder(action=action, quantity=abs(delta))
+            broker.place_trade(trade=Trade(contract=contract, order=order))
+
+    sim_streamer.subscribe_to_bars(
+        contract=contract, bar_size=BAR_SIZE, func=on_bar,
+    )
+    runner.run_sim()
+
+    return broker.acc_cash[Currency.USD]
+
+
+def test_simulation_sweep():
+    params = [
+        {"n_short": n_short, "n_long": n_long}
+        for n_short in [2, 3]
+        for n_long in [5, 8]
+    ]
+    clock_kwargs = {
+        "start_date": date(2020, 4, 6),
+        "end_date": date(2020, 4, 7),
+        "simulation_time_step": BAR_SIZE,
+    }
+    hist_retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    expected = []
+
+    for run_params in params:
+        sim_streamer = SimulationDataStreamer(
+            historical_retriever=hist_retriever,
+        )
+        expected.append(
+            sma_crossover_sim(
+                sim_clock=SimulationClock(**clock_kwargs),
+                sim_streamer=sim_streamer,
+                **run_params,
+            )
+        )
+
+    for max_workers in [1, 2]:
+        sweep = SimulationSweep(
+            sim_func=sma_crossover_sim,
+            bars=[(StockContract(symbol="SPY"), BAR_SIZE)],
+            historical_retriever=hist_retriever,
+            max_workers=max_workers,
+            **clock_kwargs,
+        )
+        results = sweep.run(params=params, cache_only=True)
+
+        assert results == expected
+    assert len(set(expected)) > 1
+
+
+def test_simulation_sweep_reads_retriever_cache():
+    params = [{"n_short": 2, "n_long": 5}, {"n_short": 3, "n_long": 8}]
+    clock_kwargs = {
+        "start_date": date(2020, 4, 6),
+        "end_date": date(2020, 4, 7),
+        "simulation_time_step": BAR_SIZE,
+    }
+    hist_retriever = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR)
+    expected = [
+        sma_crossover_sim(
+            sim_clock=SimulationClock(**clock_kwargs),
+            sim_streamer=SimulationDataStreamer(
+                historical_retriever=hist_retriever,
+            ),
+            **run_params,
+        )
+        for run_params in params
+    ]
+
+    for max_workers in [1, 2]:
+        # the bars are not shared, and are read from the retriever's cache
+        sweep = SimulationSweep(
+            sim_func=sma_crossover_sim,
+            bars=[],
+            historical_retriever=hist_retriever,
+            max_workers=max_workers,
+            **clock_kwargs,
+        )
+        results = sweep.run(params=params, cache_only=True)
+
+        assert results == expected
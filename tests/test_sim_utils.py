@@ -105,6 +105,86 @@ def test_simulation_clock_daily():
         clock.tick()
 
 
+def test_simulation_clock_precomputed_timeline():
+    clock = SimulationClock(
+        start_date=date(2020, 11, 25),
+        end_date=date(2020, 11, 30),
+        simulation_time_step=timedelta(minutes=7),
+    )
+    timeline_clock = SimulationClock(
+        start_date=date(2020, 11, 25),
+        end_date=date(2020, 11, 30),
+        simulation_time_step=timedelta(minutes=7),
+        precompute_timeline=True,
+    )
+    timeline_clock.set_datetime(datetime(2020, 11, 25, 9, 48))
+    clock.set_datetime(datetime(2020, 11, 25, 9, 48))
+
+    while True:
+        try:
+            clock.tick()
+        except SimulationEndException:
+            break
+        timeline_clock.tick()
+
+        assert timeline_clock.datetime == clock.datetime
+        assert timeline_clock.start_of_day == clock.start_of_day
+        assert timeline_clock.end_of_day == clock.end_of_day
+
+    with pytest.raises(SimulationEndException):
+        timeline_clock.tick()
+
+
+def test_simulation_clock_daily_end_of_day():
+    clock = SimulationClock(
+        start_date=date(2020, 11, 25),
+        end_date=date(2020, 11, 27),
+        simulation_time_step=timedelta(days=1),
+    )
+
+    clock.tick()
+
+    assert clock.end_of_day
+
+    clock.tick()
+
+    assert clock.datetime == datetime(2020, 11, 27, 13)
+    assert clock.end_of_day
+
+
+def _to_ns(dt: datetime) -> int:
+    return int((dt - datetime(1970, 1, 1)).total_seconds()) * 10 ** 9
+
+
+def test_simulation_clock_advance_to():
+    clock = SimulationClock(
+        start_date=date(2020, 1, 6),
+        end_date=date(2020, 1, 7),
+        simulation_time_step=timedelta(minutes=5),
+    )
+
+    assert clock.get_next_step_ns() == clock.datetime_ns + 5 * 60 * 10 ** 9
+
+    clock.advance_to(target_ns=0)
+
+    assert clock.datetime == datetime(2020, 1, 6, 9, 35)
+
+    target_dt = datetime(2020, 1, 6, 10, 1)
+    clock.advance_to(target_ns=_to_ns(target_dt))
+
+    assert clock.datetime == datetime(2020, 1, 6, 10, 5)
+
+    target_dt = datetime(2020, 1, 6, 16, 1)
+    clock.advance_to(target_ns=_to_ns(target_dt))
+
+    assert clock.datetime == datetime(2020, 1, 7, 9, 35)
+    assert not clock.start_of_day
+
+    target_dt = datetime(2020, 1, 8, 9, 30)
+    with pytest.raises(SimulationEndException):
+        clock.advance_to(target_ns=_to_ns(target_dt))
+
+
 @pytest.fixture
 def sim_clock():
     c = SimulationClock(
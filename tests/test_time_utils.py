@@ -0,0 +1,59 @@
+from datetime import date, time
+
+import pandas_market_calendars as pmc
+
+from algotradepy.time_utils import (
+    TradingCalendar,
+    generate_trading_days,
+    generate_trading_schedule,
+    get_next_trading_date,
+)
+
+
+def test_generate_trading_days():
+    start_date = date(2019, 12, 1)
+    end_date = date(2020, 4, 30)
+    nyse = pmc.get_calendar("NYSE")
+    target_dates = nyse.schedule(
+        start_date=start_date, end_date=end_date,
+    ).index.date.tolist()
+
+    dates = generate_trading_days(start_date=start_date, end_date=end_date)
+
+    assert dates == target_dates
+
+
+def test_generate_trading_schedule_early_close():
+    schedule = generate_trading_schedule(
+        start_date=date(2020, 11, 25), end_date=date(2020, 11, 28),
+    )
+
+    assert schedule.index.tolist() == [date(2020, 11, 25), date(2020, 11, 27)]
+    assert schedule["market_open"].tolist() == [time(9, 30), time(9, 30)]
+    assert schedule["market_close"].tolist() == [time(16), time(13)]
+
+
+def test_get_next_trading_date():
+    assert get_next_trading_date(base_date=date(2020, 4, 9)) == date(
+        2020, 4, 13,
+    )
+
+
+def test_trading_calendar_save_load(tmpdir):
+    calendar = TradingCalendar.from_market_calendars(
+        start_date=date(2020, 1, 1), end_date=date(2020, 12, 31),
+    )
+    file_path = tmpdir / "calendar.npz"
+    calendar.save(file_path=file_path)
+    loaded = TradingCalendar.load(file_path=file_path)
+
+    assert loaded.first_date == date(2020, 1, 2)
+    assert loaded.last_date == date(2020, 12, 31)
+
+    for start_date, end_date in [
+        (date(2020, 3, 1), date(2020, 3, 31)),
+        (date(2020, 7, 3), date(2020, 7, 5)),
+    ]:
+        assert loaded.get_trading_days(
+            start_date=start_date, end_date=end_date,
+        ) == calendar.get_trading_days(start_date=start_date, end_date=end_date)
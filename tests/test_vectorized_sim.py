@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from algotradepy.contracts import StockContract, Currency
+from algotradepy.historical.loaders import HistoricalRetriever
+from algotradepy.indicators.ma import SMA
+from algotradepy.orders import MarketOrder, OrderAction
+from algotradepy.trade import Trade
+from algotradepy.vectorized_sim import VectorizedSimulator
+from tests.conftest import TEST_DATA_DIR
+
+
+def sma_crossover_signal(bars: pd.DataFrame) -> pd.Series:
+    short_sma = bars["close"].rolling(3).mean()
+    long_sma = bars["close"].rolling(6).mean()
+    signal = np.sign(short_sma - long_sma)
+    return signal
+
+
+def test_vectorized_simulator():
+    index = pd.date_range("2020-01-02 09:30", periods=4, freq="15min")
+    bars = pd.DataFrame(
+        data={"open": [10, 11, 12, 13], "close": [10.5, 11.5, 12.5, 13.5]},
+        index=index,
+    )
+    simulator = VectorizedSimulator(starting_funds=100, transaction_cost=1)
+
+    result = simulator.run(bars=bars, signal=np.array([1, 1, -1, np.nan]))
+
+    # the order placed at the last close is not filled
+    np.testing.assert_equal(result.fills["fill_qty"].values, [1, -2])
+    np.testing.assert_equal(result.fills["fill_price"].values, [11, 13])
+    np.testing.assert_equal(result.positions.values, [0, 1, 1, -1])
+    np.testing.assert_equal(result.cash.values, [100, 88, 88, 113])
+    np.testing.assert_equal(
+        result.equity.values, [100, 88 + 11.5, 88 + 12.5, 113 - 13.5],
+    )
+
+
+def test_vectorized_simulator_matches_sim_broker(
+    sim_broker_runner_and_streamer_15m,
+):
+    broker, runner, streamer = sim_broker_runner_and_streamer_15m
+    contract = StockContract(symbol="SPY")
+    bar_size = timedelta(minutes=15)
+    short_sma = SMA(n_periods=3)
+    long_sma = SMA(n_periods=6)
+
+    def on_bar(bar):
+        short_sma.update(value=bar["close"])
+        long_sma.update(value=bar["close"])
+        target = 0
+        if long_sma.ready:
+            target = np.sign(short_sma.value - long_sma.value)
+        delta = target - broker.get_position(contract=contract)
+        if delta != 0:
+            action = OrderAction.BUY if delta > 0 else OrderAction.SELL
+            order = MarketOrder(action=action, quantity=abs(delta))
+            broker.place_trade(trade=Trade(contract=contract, order=order))
+
+    streamer.subscribe_to_bars(
+        contract=contract, bar_size=bar_size, func=on_bar,
+    )
+    runner.run_sim()
+
+    bars = HistoricalRetriever(hist_data_dir=TEST_DATA_DIR).retrieve_bar_data(
+        contract=contract,
+        bar_size=bar_size,
+        start_date=date(2020, 4, 6),
+        end_date=date(2020, 4, 7),
+        cache_only=True,
+    )
+    simulator = VectorizedSimulator(starting_funds=1_000, transaction_cost=1)
+    result = simulator.run(bars=bars, signal=sma_crossover_signal)
+
+    fills = result.fills
+
+    assert len(fills) > 2
+    # an order placed at the last close is filled past the simulated bars
+    assert len(fills) <= len(broker.trades) <= len(fills) + 1
+    for trade, (_, fill) in zip(broker.trades, fills.iterrows()):
+        qty = trade.status.filled
+        if trade.order.action == OrderAction.SELL:
+            qty = -qty
+        assert qty == fill["fill_qty"]
+        assert np.isclose(trade.status.ave_fill_price, fill["fill_price"])
+    if len(broker.trades) == len(fills):
+        assert np.isclose(
+            broker.acc_cash[Currency.USD], result.cash.iloc[-1],
+        )
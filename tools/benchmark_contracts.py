@@ -0,0 +1,46 @@
+"""Micro-benchmark of contract hashing and equality.
+
+Times building a dictionary keyed by contracts and looking contracts up in
+it, the way the streamers and brokers key their subscribers and positions.
+
+Run with `python tools/benchmark_contracts.py`.
+"""
+import timeit
+
+from algotradepy.contracts import StockContract
+
+
+def bench_build(n_contracts: int, repeat: int = 5) -> float:
+    """Time building a dict of `n_contracts` contracts, in us per key."""
+    contracts = [StockContract(symbol=f"S{i}") for i in range(n_contracts)]
+
+    def build():
+        # fresh copies, so that the cached keys and hashes are not reused
+        keys = [StockContract(symbol=c.symbol) for c in contracts]
+        return {contract: i for i, contract in enumerate(keys)}
+
+    best = min(timeit.repeat(build, number=1, repeat=repeat))
+    return best / n_contracts * 1e6
+
+
+def bench_lookup(n_contracts: int, repeat: int = 5) -> float:
+    """Time looking up fresh contracts in a dict, in us per lookup."""
+    table = {
+        StockContract(symbol=f"S{i}"): i for i in range(n_contracts)
+    }
+    queries = [StockContract(symbol=f"S{i}") for i in range(n_contracts)]
+
+    def lookup():
+        for contract in queries:
+            table[contract]
+
+    best = min(timeit.repeat(lookup, number=1, repeat=repeat))
+    return best / n_contracts * 1e6
+
+
+if __name__ == "__main__":
+    for n in [1_000, 10_000]:
+        print(
+            f"{n:>6} contracts: build {bench_build(n_contracts=n):.2f} us/key,"
+            f" lookup {bench_lookup(n_contracts=n):.2f} us/key"
+        )